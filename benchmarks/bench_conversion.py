@@ -0,0 +1,75 @@
+"""
+Benchmark converting a 1,000-level order book to atomic units.
+
+Compares the per-level path used so far (Decimal parse, then
+Token.convert_quantity_to_amount with 10 ** decimals recomputed on every call) with
+Market.convert_levels_to_amounts, which parses each field once and scales it with a cached
+factor. Runs fully offline and checks that both paths agree.
+
+Usage:
+    python benchmarks/bench_conversion.py --levels 1000 --iterations 200
+"""
+import argparse
+import random
+import time
+from decimal import Decimal, getcontext
+
+from eth_utils.address import to_checksum_address
+
+from gte_py.models import Market, MarketType, Token
+
+
+def make_levels(count: int) -> list[dict[str, str]]:
+    rng = random.Random(0)
+    return [
+        {"px": f"{3000 + i * 0.5:.1f}", "sz": f"{rng.uniform(0.001, 50):.6f}", "n": rng.randint(1, 9)}
+        for i in range(count)
+    ]
+
+
+def per_level(market: Market, levels: list[dict[str, str]]) -> list[tuple[int, int]]:
+    base, quote = market.base, market.quote
+    return [
+        (
+            int(Decimal(level["px"]) * (10 ** quote.decimals)),
+            int(Decimal(level["sz"]) * (10 ** base.decimals)),
+        )
+        for level in levels
+    ]
+
+
+def time_per_book(convert, market: Market, levels: list[dict[str, str]], iterations: int) -> float:
+    """Microseconds per book."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        convert(market, levels)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(levels_count: int, iterations: int):
+    getcontext().prec = 40  # as set by GTEClient
+    market = Market(
+        address=to_checksum_address("0x0F3642714B9516e3d17a936bAced4de47A6FFa5F"),
+        market_type=MarketType.CLOB_SPOT,
+        base=Token(address=to_checksum_address("0x" + "01" * 20), decimals=18, name="Ether", symbol="WETH"),
+        quote=Token(address=to_checksum_address("0x" + "02" * 20), decimals=6, name="USD", symbol="USDC"),
+    )
+    levels = make_levels(levels_count)
+
+    if per_level(market, levels) != market.convert_levels_to_amounts(levels):
+        raise AssertionError("conversion mismatch")
+
+    baseline = time_per_book(per_level, market, levels, iterations)
+    batched = time_per_book(Market.convert_levels_to_amounts, market, levels, iterations)
+    print(f"{levels_count} levels, {iterations} iterations")
+    print(f"{'per-level Decimal (us/book)':<32}{baseline:>10.1f}")
+    print(f"{'convert_levels_to_amounts':<32}{batched:>10.1f}")
+    print(f"{'speedup':<32}{baseline / batched:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.levels, args.iterations)
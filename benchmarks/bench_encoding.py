@@ -0,0 +1,92 @@
+"""
+Benchmark calldata encoding of the hot order-entry functions: web3 vs the precompiled encoders.
+
+Runs fully offline. For each function it builds the transaction the way ExecutionClient does
+(function object plus _encode_transaction_data()) and reports microseconds per call on both
+paths, after checking that they produce identical calldata.
+
+Usage:
+    python benchmarks/bench_encoding.py --iterations 5000
+"""
+import argparse
+import time
+from typing import Any, Callable
+
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain import fast_encode
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.router import Router
+from gte_py.api.chain.structs import (
+    AmendArgs,
+    CancelArgs,
+    LimitOrderType,
+    OrderSide,
+    PostFillOrderArgs,
+    PostLimitOrderArgs,
+    Settlement,
+)
+
+ROUTER = to_checksum_address("0x86470efcEa37e50F94E74649463b737C87ada367")
+CLOB = to_checksum_address("0x0F3642714B9516e3d17a936bAced4de47A6FFa5F")
+ACCOUNT = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+
+
+def time_per_call(build: Callable[[], Any], iterations: int) -> float:
+    """Microseconds per build + encode."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build().func_call._encode_transaction_data()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int):
+    router = Router(AsyncWeb3(), ROUTER)
+    clob = Clob(AsyncWeb3(), CLOB)
+    limit_args = PostLimitOrderArgs(
+        10**16, 3_000 * 10**18, 0, OrderSide.BUY.value, 1, LimitOrderType.POST_ONLY.value, Settlement.INSTANT.value
+    )
+    fill_args = PostFillOrderArgs(10**16, 3_000 * 10**18, OrderSide.SELL.value, True, 1, Settlement.INSTANT.value)
+    cancel_args = CancelArgs([1, 2, 3], Settlement.INSTANT.value)
+    amend_args = AmendArgs(1, 10**16, 3_000 * 10**18, 0, OrderSide.BUY.value, 1, Settlement.INSTANT.value)
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "clobPostLimitOrder",
+            lambda: router.clob_post_limit_order(CLOB, limit_args),
+            lambda: fast_encode.clob_post_limit_order(router, CLOB, limit_args),
+        ),
+        (
+            "clobPostFillOrder",
+            lambda: router.clob_post_fill_order(CLOB, fill_args),
+            lambda: fast_encode.clob_post_fill_order(router, CLOB, fill_args),
+        ),
+        (
+            "clobCancel",
+            lambda: router.clob_cancel(CLOB, cancel_args, True),
+            lambda: fast_encode.clob_cancel(router, CLOB, cancel_args, True),
+        ),
+        (
+            "amend",
+            lambda: clob.amend(ACCOUNT, amend_args),
+            lambda: fast_encode.clob_amend(clob, ACCOUNT, amend_args),
+        ),
+    ]
+
+    print(f"{'function':<20}{'web3 (us)':>12}{'fast (us)':>12}{'speedup':>10}")
+    for name, web3_build, fast_build in cases:
+        web3_data = web3_build().func_call._encode_transaction_data()
+        fast_data = fast_build().func_call._encode_transaction_data()
+        if web3_data != fast_data:
+            raise AssertionError(f"{name}: calldata mismatch")
+        web3_us = time_per_call(web3_build, iterations)
+        fast_us = time_per_call(fast_build, iterations)
+        print(f"{name:<20}{web3_us:>12.1f}{fast_us:>12.1f}{web3_us / fast_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.iterations)
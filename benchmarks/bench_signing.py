@@ -0,0 +1,110 @@
+"""
+Benchmark transaction signing throughput with and without a signing executor.
+
+Runs fully offline: calldata is encoded with a real Router contract and signed with a real
+key, while send_raw_transaction is stubbed to return immediately. For each mode it reports
+orders/second for a burst and the worst event loop stall observed while the burst runs.
+
+Usage:
+    python benchmarks/bench_signing.py --orders 200 --workers 4
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+
+from eth_account import Account
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.router import Router
+from gte_py.api.chain.structs import LimitOrderType, OrderSide, PostLimitOrderArgs, Settlement
+from gte_py.api.chain.utils import BoundedNonceTxScheduler
+
+ROUTER = to_checksum_address("0x86470efcEa37e50F94E74649463b737C87ada367")
+CLOB = to_checksum_address("0x0F3642714B9516e3d17a936bAced4de47A6FFa5F")
+
+
+class OfflineWeb3:
+    """Just enough of AsyncWeb3 for the scheduler's send path, without any network."""
+
+    def __init__(self, address):
+        async def send_raw_transaction(raw_tx):
+            return HexBytes(b"\x00" * 32)
+
+        self.eth = SimpleNamespace(default_account=address, send_raw_transaction=send_raw_transaction)
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.001) -> float:
+    """Return the worst observed delay of a periodic 1ms tick while the burst runs."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def run_burst(executor: Executor | None, orders: int) -> tuple[float, float]:
+    account = Account.create()
+    scheduler = BoundedNonceTxScheduler(
+        OfflineWeb3(account.address), account, max_pending_window=orders + 1, signing_executor=executor
+    )
+    scheduler.chain_id = 6342
+    router = Router(AsyncWeb3(), ROUTER)
+
+    funcs = [
+        router.clob_post_limit_order(
+            clob=CLOB,
+            args=PostLimitOrderArgs(
+                10**16 + i,
+                3_000 * 10**18,
+                0,
+                OrderSide.BUY.value,
+                i,
+                LimitOrderType.POST_ONLY.value,
+                Settlement.INSTANT.value,
+            ),
+        )
+        for i in range(orders)
+    ]
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(scheduler.send(func) for func in funcs))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    worst_lag = await lag_task
+    return orders / elapsed, worst_lag
+
+
+async def main(orders: int, workers: int):
+    modes: list[tuple[str, Executor | None]] = [
+        ("inline", None),
+        (f"thread x{workers}", ThreadPoolExecutor(max_workers=workers)),
+        (f"process x{workers}", ProcessPoolExecutor(max_workers=workers)),
+    ]
+
+    print(f"{'mode':<14}{'orders/s':>12}{'max loop stall (ms)':>24}")
+    for name, executor in modes:
+        if executor is not None:
+            # Spin workers up before timing so pool start-up is not measured
+            await run_burst(executor, workers)
+        rate, lag = await run_burst(executor, orders)
+        print(f"{name:<14}{rate:>12.0f}{lag * 1000:>24.2f}")
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.workers))
@@ -0,0 +1,100 @@
+"""
+Push-based nonce confirmation tracking for BoundedNonceTxScheduler.
+
+A newHeads subscription on the RPC WebSocket endpoint tells the scheduler when blocks land, so
+its pending window frees up as soon as transactions confirm instead of after a poll.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from web3 import AsyncWeb3, WebSocketProvider
+
+if TYPE_CHECKING:
+    from gte_py.api.chain.utils import BoundedNonceTxScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class HeadConfirmationTracker:
+    """
+    Advance a scheduler's confirmed nonce on every new block head.
+
+    The account's transaction count is only fetched (over the same WebSocket) while the
+    scheduler has transactions in flight, so an idle account costs no RPC calls.
+    """
+
+    def __init__(
+        self,
+        scheduler: "BoundedNonceTxScheduler",
+        rpc_ws: str,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            scheduler: Scheduler whose last_confirmed is advanced
+            rpc_ws: WebSocket JSON-RPC endpoint (NetworkConfig.rpc_ws)
+            reconnect_delay: Initial delay before reconnecting after the subscription drops
+            max_reconnect_delay: Upper bound of the exponential reconnect delay
+        """
+        self.scheduler = scheduler
+        self.rpc_ws = rpc_ws
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.heads_seen = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Start the subscription in a background task."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the subscription task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        """Keep a newHeads subscription open, reconnecting with backoff when it drops."""
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.rpc_ws)) as w3:
+                    await w3.eth.subscribe("newHeads")
+                    logger.info(f"Subscribed to new heads on {self.rpc_ws}")
+                    delay = self.reconnect_delay
+                    async for message in w3.socket.process_subscriptions():
+                        await self.on_head(w3, message.get("result"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"New heads subscription failed: {e}, reconnecting in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def on_head(self, w3: AsyncWeb3, head: Any):
+        """Handle one new head: confirm nonces if the scheduler is waiting on any and advance its simulator's block."""
+        self.heads_seen += 1
+        scheduler = self.scheduler
+        if scheduler.simulator is not None and head and head.get("number") is not None:
+            number = head["number"]
+            scheduler.simulator.set_block(int(number, 16) if isinstance(number, str) else int(number))
+        if scheduler.last_sent <= scheduler.last_confirmed:
+            return
+        confirmed = await w3.eth.get_transaction_count(scheduler.from_address, "latest")
+        scheduler.confirm_nonce(confirmed)
@@ -0,0 +1,155 @@
+"""
+Precompiled calldata encoders for the hot order-entry functions.
+
+Router.clobPostLimitOrder, Router.clobPostFillOrder, Router.clobCancel and Clob.amend take
+fixed-layout arguments, so their calldata is built here from precomputed selectors and
+32-byte words instead of going through web3's ABI lookup, argument validation and checksum
+checks. The output is byte-identical to web3's _encode_transaction_data().
+"""
+
+from typing import Any, Sequence, cast
+
+from eth_typing import ChecksumAddress, HexStr
+from eth_utils.abi import function_signature_to_4byte_selector
+from web3.contract.async_contract import AsyncContract, AsyncContractFunction
+
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.router import Router
+from gte_py.api.chain.structs import AmendArgs, CancelArgs, PostFillOrderArgs, PostLimitOrderArgs
+from gte_py.api.chain.utils import TypedContractFunction, load_abi
+
+
+def _canonical_type(param: dict[str, Any]) -> str:
+    if param["type"].startswith("tuple"):
+        return "(" + ",".join(_canonical_type(c) for c in param["components"]) + ")" + param["type"][5:]
+    return param["type"]
+
+
+def _selector(abi_name: str, fn_name: str) -> bytes:
+    """4-byte selector of a function, computed from its ABI entry."""
+    for entry in load_abi(abi_name):
+        if entry.get("type") == "function" and entry["name"] == fn_name:
+            signature = f"{fn_name}({','.join(_canonical_type(p) for p in entry['inputs'])})"
+            return function_signature_to_4byte_selector(signature)
+    raise ValueError(f"Function {fn_name} not found in {abi_name} ABI")
+
+
+POST_LIMIT_ORDER_SELECTOR = _selector("router", "clobPostLimitOrder")
+POST_FILL_ORDER_SELECTOR = _selector("router", "clobPostFillOrder")
+CANCEL_SELECTOR = _selector("router", "clobCancel")
+AMEND_SELECTOR = _selector("clob", "amend")
+
+# Bit widths of the static struct fields, in ABI order
+_POST_LIMIT_ORDER_LAYOUT = (256, 256, 256, 8, 96, 8, 8)
+_POST_FILL_ORDER_LAYOUT = (256, 256, 8, 1, 8, 8)  # amountIsBase is a bool
+_AMEND_LAYOUT = (256, 256, 256, 256, 8, 8, 8)
+
+_ADDRESS_PAD = bytes(12)
+
+
+def _uint(value: int, bits: int = 256) -> bytes:
+    if not 0 <= value < 1 << bits:
+        raise ValueError(f"Value {value} does not fit in uint{bits}")
+    return int(value).to_bytes(32, "big")
+
+
+def _address(address: str) -> bytes:
+    raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {address}")
+    return _ADDRESS_PAD + raw
+
+
+def _static_struct(values: Sequence[int], layout: tuple[int, ...]) -> bytes:
+    return b"".join(_uint(value, bits) for value, bits in zip(values, layout, strict=True))
+
+
+def _hex(data: bytes) -> HexStr:
+    return HexStr("0x" + data.hex())
+
+
+def encode_clob_post_limit_order(clob: str, args: PostLimitOrderArgs) -> HexStr:
+    """Calldata for Router.clobPostLimitOrder(clob, args)."""
+    return _hex(POST_LIMIT_ORDER_SELECTOR + _address(clob) + _static_struct(args, _POST_LIMIT_ORDER_LAYOUT))
+
+
+def encode_clob_post_fill_order(clob: str, args: PostFillOrderArgs) -> HexStr:
+    """Calldata for Router.clobPostFillOrder(clob, args)."""
+    return _hex(POST_FILL_ORDER_SELECTOR + _address(clob) + _static_struct(args, _POST_FILL_ORDER_LAYOUT))
+
+
+def encode_clob_cancel(clob: str, args: CancelArgs, is_unwrapping: bool) -> HexStr:
+    """Calldata for Router.clobCancel(clob, args, is_unwrapping)."""
+    order_ids, settlement = args
+    # Head: clob, offset of the dynamic args tuple (after 3 head words), is_unwrapping
+    # Tuple: offset of orderIds (after its 2 head words), settlement, then the array
+    return _hex(
+        CANCEL_SELECTOR
+        + _address(clob)
+        + _uint(3 * 32)
+        + _uint(is_unwrapping, 1)
+        + _uint(2 * 32)
+        + _uint(settlement, 8)
+        + _uint(len(order_ids))
+        + b"".join(_uint(order_id) for order_id in order_ids)
+    )
+
+
+def encode_clob_amend(account: str, args: AmendArgs) -> HexStr:
+    """Calldata for Clob.amend(account, args)."""
+    return _hex(AMEND_SELECTOR + _address(account) + _static_struct(args, _AMEND_LAYOUT))
+
+
+class FastContractFunction:
+    """
+    Stand-in for an AsyncContractFunction whose calldata was encoded up front.
+
+    The scheduler only needs address and _encode_transaction_data(); anything else (call(),
+    estimate_gas(), abi, ...) builds the regular web3 function on first use.
+    """
+
+    __slots__ = ["contract", "address", "fn_name", "args", "data", "_web3_function"]
+
+    def __init__(self, contract: AsyncContract, fn_name: str, args: tuple[Any, ...], data: HexStr):
+        self.contract = contract
+        self.address: ChecksumAddress = contract.address
+        self.fn_name = fn_name
+        self.args = args
+        self.data = data
+        self._web3_function: AsyncContractFunction | None = None
+
+    def _encode_transaction_data(self) -> HexStr:
+        return self.data
+
+    def __getattr__(self, name: str) -> Any:
+        function = self._web3_function
+        if function is None:
+            function = self._web3_function = self.contract.functions[self.fn_name](*self.args)
+        return getattr(function, name)
+
+
+def _typed(contract: AsyncContract, fn_name: str, args: tuple[Any, ...], data: HexStr, kwargs: dict[str, Any]):
+    func = FastContractFunction(contract, fn_name, args, data)
+    return TypedContractFunction(cast(AsyncContractFunction, func), params={**kwargs})
+
+
+def clob_post_limit_order(router: Router, clob: ChecksumAddress, args: PostLimitOrderArgs, **kwargs) -> TypedContractFunction[Any]:
+    """Fast equivalent of Router.clob_post_limit_order."""
+    return _typed(router.contract, "clobPostLimitOrder", (clob, tuple(args)), encode_clob_post_limit_order(clob, args), kwargs)
+
+
+def clob_post_fill_order(router: Router, clob: ChecksumAddress, args: PostFillOrderArgs, **kwargs) -> TypedContractFunction[Any]:
+    """Fast equivalent of Router.clob_post_fill_order."""
+    return _typed(router.contract, "clobPostFillOrder", (clob, tuple(args)), encode_clob_post_fill_order(clob, args), kwargs)
+
+
+def clob_cancel(router: Router, clob: ChecksumAddress, args: CancelArgs, is_unwrapping: bool, **kwargs) -> TypedContractFunction[Any]:
+    """Fast equivalent of Router.clob_cancel."""
+    return _typed(
+        router.contract, "clobCancel", (clob, tuple(args), is_unwrapping), encode_clob_cancel(clob, args, is_unwrapping), kwargs
+    )
+
+
+def clob_amend(clob: Clob, account: ChecksumAddress, args: AmendArgs, **kwargs) -> TypedContractFunction[Any]:
+    """Fast equivalent of Clob.amend."""
+    return _typed(clob.contract, "amend", (account, tuple(args)), encode_clob_amend(account, args), kwargs)
@@ -0,0 +1,159 @@
+"""
+Gas limit profiles keyed by contract address and function selector.
+
+Profiles are filled from eth_estimateGas samples and from gasUsed in receipts, so building a
+transaction can pick a tight gas limit without any RPC. gasUsed is net of refunds, which
+EIP-3529 caps at a fifth of the gas spent, so a receipt sample counts as gasUsed * 5 / 4: the
+most the transaction can have needed before its refund.
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Any, cast
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3
+from web3.types import TxParams
+
+logger = logging.getLogger(__name__)
+
+GasKey = tuple[str, str]
+
+# Gas spent before refunds is at most gasUsed * 5 / 4 (refunds capped at 1/5, EIP-3529)
+REFUND_QUOTIENT = 5
+
+
+def scale_up(value: int, factor: float) -> int:
+    """value * factor rounded up to an integer, ignoring float noise in the last digits."""
+    # Round first so 200_000 * 1.1 = 220000.00000000003 does not add a unit
+    return math.ceil(round(value * factor, 6))
+
+
+def function_selector(data: str | bytes) -> str:
+    """Return the 4-byte function selector of calldata as a lowercase 0x-prefixed hex string."""
+    if isinstance(data, (bytes, bytearray)):
+        return "0x" + bytes(data[:4]).hex()
+    return data[:10].lower()
+
+
+class GasProfile:
+    """Rolling window of gas samples for a single (contract, selector) pair."""
+
+    __slots__ = ["samples", "estimate"]
+
+    def __init__(self, max_samples: int):
+        self.samples: deque[int] = deque(maxlen=max_samples)
+        self.estimate = 0  # latest eth_estimateGas result, kept after it leaves the window
+
+    def record(self, gas: int):
+        self.samples.append(gas)
+
+    @property
+    def peak(self) -> int:
+        """Largest gas sample in the window, and never below the latest estimate."""
+        return max(max(self.samples), self.estimate)
+
+
+class GasProfileCache:
+    """
+    Per-(contract address, selector) gas limit cache.
+
+    The limit handed out is the largest recent sample scaled by the safety margin, so a
+    function whose gas varies with book state still gets enough headroom.
+    """
+
+    def __init__(
+        self,
+        safety_margin: float = 0.2,
+        max_samples: int = 32,
+        min_gas: int = 21_000,
+        estimate_on_miss: bool = True,
+    ):
+        """
+        Initialize the gas profile cache.
+
+        Args:
+            safety_margin: Fraction added on top of the largest sample (0.2 = +20%)
+            max_samples: Number of recent samples kept per (contract, selector)
+            min_gas: Lower bound for any returned limit
+            estimate_on_miss: Let the scheduler run one eth_estimateGas the first time a
+                function is sent, instead of falling back to its default limit
+        """
+        if safety_margin < 0:
+            raise ValueError("safety_margin must be non-negative")
+        self.safety_margin = safety_margin
+        self.max_samples = max_samples
+        self.min_gas = min_gas
+        self.estimate_on_miss = estimate_on_miss
+        self._profiles: dict[GasKey, GasProfile] = {}
+
+    @staticmethod
+    def key(address: ChecksumAddress | str, data: str | bytes) -> GasKey:
+        return str(address).lower(), function_selector(data)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, key: GasKey) -> bool:
+        return key in self._profiles
+
+    def get_limit(self, address: ChecksumAddress | str, data: str | bytes) -> int | None:
+        """
+        Get the gas limit for a call, or None if the function has no profile yet.
+
+        Args:
+            address: Contract address the transaction is sent to
+            data: Encoded calldata (only the selector is used)
+        """
+        profile = self._profiles.get(self.key(address, data))
+        if profile is None:
+            return None
+        return max(self.min_gas, scale_up(profile.peak, 1 + self.safety_margin))
+
+    def _profile(self, address: ChecksumAddress | str, data: str | bytes) -> GasProfile:
+        key = self.key(address, data)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = GasProfile(self.max_samples)
+        return profile
+
+    def record(self, address: ChecksumAddress | str, data: str | bytes, gas: int):
+        """Record a sample of the gas a call needs, before any refund."""
+        self._profile(address, data).record(int(gas))
+
+    def record_receipt(self, address: ChecksumAddress | str, data: str | bytes, receipt: Any):
+        """
+        Record the gasUsed of a successful receipt, scaled up to the most the call can have
+        needed before its refund; reverted receipts are ignored.
+        """
+        if receipt.get("status", 1) != 1:
+            return
+        gas_used = receipt.get("gasUsed")
+        if gas_used is None:
+            return
+        if isinstance(gas_used, str):
+            gas_used = int(gas_used, 16)
+        self.record(address, data, -(-int(gas_used) * REFUND_QUOTIENT // (REFUND_QUOTIENT - 1)))
+
+    async def estimate(self, web3: AsyncWeb3, tx_params: TxParams) -> int:
+        """
+        Run eth_estimateGas for a transaction, record the sample and return the new limit.
+
+        Args:
+            web3: AsyncWeb3 instance
+            tx_params: Transaction with at least "to" and "data"
+        """
+        to = cast(str, tx_params["to"])
+        data = cast(str, tx_params["data"])
+        estimate = await web3.eth.estimate_gas(tx_params)
+        profile = self._profile(to, data)
+        profile.record(int(estimate))
+        profile.estimate = int(estimate)
+        limit = cast(int, self.get_limit(to, data))
+        logger.debug(f"Gas estimate for {to} {function_selector(data)}: {estimate} -> limit {limit}")
+        return limit
+
+    def clear(self):
+        """Drop every profile."""
+        self._profiles.clear()
@@ -0,0 +1,109 @@
+"""
+On-disk journal of signed transactions for warm restarts of BoundedNonceTxScheduler.
+
+Every signed transaction is appended before it is broadcast, so after a crash the scheduler knows
+which nonces were in flight, what they were for, and can rebroadcast them byte for byte.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tx_journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    account TEXT NOT NULL,
+    nonce INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    raw_tx BLOB NOT NULL,
+    intent TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tx_journal_account_nonce ON tx_journal (account, nonce);
+"""
+
+
+@dataclass
+class JournalEntry:
+    """A signed transaction as it was handed to the network."""
+    nonce: int
+    tx_hash: str
+    raw_tx: bytes
+    intent: str
+    recorded_at: float
+
+
+class TxJournal:
+    """
+    Append-only SQLite journal of (nonce, tx hash, raw tx, intent).
+
+    A nonce can be journaled more than once (a replacement, or a nonce reused after a rejected
+    send); the latest entry wins. Entries below the confirmed nonce are dropped by prune().
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        rebroadcast_intents: Iterable[str] | None = None,
+        synchronous: str = "NORMAL",
+    ):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+            rebroadcast_intents: Intents that are rebroadcast on restart when the network has
+                lost them; other intents get their nonce cancelled instead. None rebroadcasts all.
+            synchronous: SQLite synchronous pragma. NORMAL survives a process crash; use FULL
+                to also survive power loss at the cost of an fsync per transaction.
+        """
+        self.path = str(path)
+        self.rebroadcast_intents = set(rebroadcast_intents) if rebroadcast_intents is not None else None
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+
+    def record(self, account: str, nonce: int, tx_hash: str, raw_tx: bytes, intent: str):
+        """Append a signed transaction."""
+        self._conn.execute(
+            "INSERT INTO tx_journal (account, nonce, tx_hash, raw_tx, intent, recorded_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (account.lower(), nonce, tx_hash, bytes(raw_tx), intent, time.time()),
+        )
+
+    def entries_from(self, account: str, nonce: int) -> dict[int, JournalEntry]:
+        """
+        Get the latest entry for every journaled nonce at or above nonce.
+
+        Returns:
+            Entries keyed by nonce
+        """
+        rows = self._conn.execute(
+            "SELECT nonce, tx_hash, raw_tx, intent, recorded_at FROM tx_journal "
+            "WHERE account = ? AND nonce >= ? ORDER BY seq",
+            (account.lower(), nonce),
+        )
+        return {row[0]: JournalEntry(*row) for row in rows}
+
+    def should_rebroadcast(self, entry: JournalEntry) -> bool:
+        return self.rebroadcast_intents is None or entry.intent in self.rebroadcast_intents
+
+    def prune(self, account: str, below_nonce: int) -> int:
+        """
+        Drop entries for confirmed nonces.
+
+        Returns:
+            Number of entries removed
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM tx_journal WHERE account = ? AND nonce < ?", (account.lower(), below_nonce)
+        )
+        return cursor.rowcount
+
+    def close(self):
+        self._conn.close()
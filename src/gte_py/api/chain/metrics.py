@@ -0,0 +1,168 @@
+"""
+Latency metrics for the transaction pipeline.
+
+Stages of BoundedNonceTxScheduler and ExecutionClient are timed into fixed-bucket histograms,
+which can be read back as a plain dict (with p50/p99) or as Prometheus text exposition.
+"""
+
+import math
+import time
+from bisect import bisect_left
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+# Upper bounds in seconds, from 50µs to 10s; anything slower lands in the +Inf bucket
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    50e-6, 100e-6, 250e-6, 500e-6,
+    1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3, 100e-3, 250e-3, 500e-3,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+# Stages timed by the SDK
+STAGES: tuple[str, ...] = (
+    "approval_check",
+    "nonce_wait",
+    "abi_encode",
+    "simulate",
+    "sign",
+    "send_rpc",
+    "realtime_receipt",
+    "event_parse",
+)
+
+_NO_TIMER = nullcontext()
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds (counts per bucket, not cumulative)."""
+
+    __slots__ = ["buckets", "counts", "count", "sum", "max"]
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation inside its bucket, like Prometheus'
+        histogram_quantile. Values in the +Inf bucket are capped at the largest sample.
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if i == len(self.buckets):
+                    return self.max
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = min(self.buckets[i], self.max)
+                return lower + (upper - lower) * max(rank - seen, 0) / bucket_count
+            seen += bucket_count
+        return self.max
+
+
+class _StageTimer:
+    __slots__ = ["histogram", "start"]
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class PipelineMetrics:
+    """Registry of per-stage latency histograms."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, enabled: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds, ascending
+            enabled: Record observations; when False every timer is a no-op
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be ascending")
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            histogram = self._histograms[stage] = LatencyHistogram(self.buckets)
+        return histogram
+
+    def observe(self, stage: str, seconds: float):
+        """Record a duration for a stage."""
+        if self.enabled:
+            self.histogram(stage).observe(seconds)
+
+    def timer(self, stage: str) -> AbstractContextManager[Any]:
+        """Context manager timing its body into a stage, exceptions included."""
+        if not self.enabled:
+            return _NO_TIMER
+        return _StageTimer(self.histogram(stage))
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """
+        Summaries per stage.
+
+        Returns:
+            {stage: {"count", "sum", "max", "p50", "p99"}}, durations in seconds
+        """
+        return {
+            stage: {
+                "count": histogram.count,
+                "sum": histogram.sum,
+                "max": histogram.max,
+                "p50": histogram.quantile(0.5),
+                "p99": histogram.quantile(0.99),
+            }
+            for stage, histogram in self._histograms.items()
+        }
+
+    def to_prometheus(self, name: str = "gte_tx_stage_duration_seconds") -> str:
+        """Render every stage as one Prometheus histogram labelled by stage."""
+        lines = [
+            f"# HELP {name} Latency of GTE transaction pipeline stages.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, histogram in self._histograms.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum:.9g}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Drop all observations."""
+        self._histograms.clear()
+
+
+def stage_timer(metrics: PipelineMetrics | None, stage: str) -> AbstractContextManager[Any]:
+    """Time a stage into metrics, or do nothing when metrics is None or disabled."""
+    if metrics is None:
+        return _NO_TIMER
+    return metrics.timer(stage)
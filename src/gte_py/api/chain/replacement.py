@@ -0,0 +1,138 @@
+"""
+Replacement policy for stuck nonces of BoundedNonceTxScheduler.
+
+Instead of always filling a stuck nonce with a zero-value self-transfer, the engine picks per
+intent between rebroadcasting the original signed transaction and re-signing the same payload
+at escalating fees, and only cancels once the deadline has passed.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from eth_account.types import TransactionDictType
+
+from gte_py.api.chain.gas import scale_up
+
+# Nodes reject a replacement priced less than 10% above the transaction it replaces
+MIN_FEE_BUMP = 1.1
+
+
+class ReplacementAction(str, Enum):
+    REBROADCAST = "rebroadcast"  # resend the original signed transaction as is
+    ESCALATE = "escalate"  # re-sign the same payload at the next fee step
+    CANCEL = "cancel"  # replace with a zero-value self-transfer
+
+
+@dataclass
+class FeeLadder:
+    """
+    Fee steps for escalating a stuck transaction.
+
+    Step k (1-based) is taken once the nonce has been stuck for k * interval seconds and signs
+    the payload at multipliers[k - 1] times its original fees, so each step must be at least
+    MIN_FEE_BUMP times the previous one. Once stuck for deadline seconds the nonce is
+    cancelled whatever the intent.
+    """
+    multipliers: tuple[float, ...] = (1.25, 1.5, 2.0, 3.0)
+    interval: float = 3.0
+    deadline: float = 30.0
+
+    def __post_init__(self):
+        previous = 1.0
+        for multiplier in self.multipliers:
+            # Rounded so 1.1 * 1.1 = 1.2100000000000002 still counts as a 10% step
+            if round(multiplier / previous, 9) < MIN_FEE_BUMP:
+                raise ValueError(
+                    f"Fee multipliers must start at {MIN_FEE_BUMP} and rise by at least {MIN_FEE_BUMP}x per "
+                    f"step, got {self.multipliers}"
+                )
+            previous = multiplier
+        if self.interval <= 0 or self.deadline <= 0:
+            raise ValueError("interval and deadline must be positive")
+
+
+@dataclass
+class InflightTx:
+    """A broadcast transaction the scheduler may have to replace."""
+    tx_params: TransactionDictType
+    raw_tx: bytes
+    intent: str
+    step: int = 0
+    # (maxFeePerGas, maxPriorityFeePerGas) of the latest re-signed version, if any
+    fees: tuple[int, int] | None = None
+
+    @property
+    def current_fees(self) -> tuple[int, int]:
+        if self.fees is not None:
+            return self.fees
+        return int(self.tx_params["maxFeePerGas"]), int(self.tx_params["maxPriorityFeePerGas"])
+
+
+DEFAULT_ACTIONS: dict[str, ReplacementAction] = {
+    "cancel": ReplacementAction.ESCALATE,
+    "amend": ReplacementAction.ESCALATE,
+    "new": ReplacementAction.REBROADCAST,
+    "nonce_cancel": ReplacementAction.ESCALATE,
+}
+
+
+class ReplacementEngine:
+    """Decide how a stuck nonce is replaced, based on its intent and how long it has been stuck."""
+
+    def __init__(
+        self,
+        ladder: FeeLadder | None = None,
+        actions: dict[str, ReplacementAction] | None = None,
+        default_action: ReplacementAction = ReplacementAction.ESCALATE,
+    ):
+        """
+        Initialize the replacement engine.
+
+        Args:
+            ladder: Fee steps and deadline (default: FeeLadder())
+            actions: Action per intent (scheduler lanes are "cancel", "amend" and "new"; stuck
+                nonce cancels are "nonce_cancel"). Merged over DEFAULT_ACTIONS.
+            default_action: Action for intents not in actions
+        """
+        self.ladder = ladder or FeeLadder()
+        self.actions = {**DEFAULT_ACTIONS, **(actions or {})}
+        self.default_action = default_action
+
+    def action_for(self, intent: str) -> ReplacementAction:
+        return self.actions.get(intent, self.default_action)
+
+    def plan(self, inflight: InflightTx | None, stuck_for: float) -> ReplacementAction | None:
+        """
+        Pick the action for a nonce that has been stuck for stuck_for seconds.
+
+        Returns:
+            The action to take now, or None to leave the nonce alone until the next check
+        """
+        step = int(stuck_for // self.ladder.interval)
+        if inflight is None:
+            # Nothing to rebroadcast; fill the gap once the deadline has passed
+            return ReplacementAction.CANCEL if stuck_for >= self.ladder.deadline else None
+        if stuck_for >= self.ladder.deadline and inflight.intent != "nonce_cancel":
+            return ReplacementAction.CANCEL
+        if step <= inflight.step:
+            return None
+        action = self.action_for(inflight.intent)
+        if action is ReplacementAction.ESCALATE and inflight.step >= len(self.ladder.multipliers):
+            # Top of the ladder: keep the last version alive until the deadline
+            return ReplacementAction.REBROADCAST
+        return action
+
+    def escalated_fees(self, inflight: InflightTx, step: int) -> tuple[int, int]:
+        """
+        Fees for ladder step (1-based), at least one wei above the last signed version.
+
+        Returns:
+            (maxFeePerGas, maxPriorityFeePerGas)
+        """
+        multiplier = self.ladder.multipliers[min(step, len(self.ladder.multipliers)) - 1]
+        max_fee = int(inflight.tx_params["maxFeePerGas"])
+        priority_fee = int(inflight.tx_params["maxPriorityFeePerGas"])
+        last_fee, last_priority = inflight.current_fees
+        new_priority = max(scale_up(priority_fee, multiplier), last_priority + 1)
+        new_fee = max(scale_up(max_fee, multiplier), last_fee + 1, new_priority)
+        return new_fee, new_priority
@@ -0,0 +1,181 @@
+"""
+Pre-trade simulation of transactions with eth_call against pending state.
+
+A transaction that would revert is caught before it takes a nonce or spends gas, and its
+revert data is decoded through ERROR_SELECTORS. Results are cached per (contract, selector,
+arguments hash, block), so sending the same requote again within a block costs no RPC. Each
+simulation is given a time budget. When the budget runs out the send goes ahead
+unsimulated, and the call keeps running in the background to fill the cache for next time.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from async_timeout import timeout
+from eth_abi import decode
+from eth_typing import ChecksumAddress
+from eth_utils.crypto import keccak
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import ContractLogicError
+from web3.types import TxParams
+
+from gte_py.api.chain.errors import ERROR_SELECTORS
+from gte_py.api.chain.gas import function_selector
+
+logger = logging.getLogger(__name__)
+
+SimulationKey = tuple[str, str, bytes, int]
+
+_ERROR_STRING_SELECTOR = "0x08c379a0"  # Error(string)
+_PANIC_SELECTOR = "0x4e487b71"  # Panic(uint256)
+
+
+def decode_revert(data: Any) -> str | None:
+    """Describe revert data: a custom error from ERROR_SELECTORS, Error(string) or Panic(uint256)."""
+    if isinstance(data, dict):
+        data = data.get("data")
+    if not isinstance(data, str) or not data.startswith("0x") or len(data) < 10:
+        return None
+    selector = data[:10].lower()
+    if selector in ERROR_SELECTORS:
+        return ERROR_SELECTORS[selector]
+    try:
+        if selector == _ERROR_STRING_SELECTOR:
+            return f"Error({decode(['string'], HexBytes(data[10:]))[0]!r})"
+        if selector == _PANIC_SELECTOR:
+            return f"Panic({hex(decode(['uint256'], HexBytes(data[10:]))[0])})"
+    except Exception:
+        return None
+    return None
+
+
+class SimulationRevertError(Exception):
+    """A transaction reverted in simulation and was not sent."""
+
+    def __init__(self, reason: str, data: str | None = None):
+        super().__init__(f"Contract error: {reason}")
+        self.reason = reason
+        self.data = data
+
+
+@dataclass
+class SimulationStats:
+    """Counters of a TxSimulator."""
+    hits: int = 0
+    misses: int = 0
+    reverts: int = 0
+    skipped: int = 0  # budget exceeded or RPC failure; the send went ahead unsimulated
+
+
+class TxSimulator:
+    """
+    eth_call simulation cache keyed by (contract, selector, arguments hash, block).
+
+    Only reverts block a send. A simulation that times out or fails for any other reason lets
+    the transaction through, so the node stays the final judge.
+    """
+
+    def __init__(self, budget: float = 0.05, block_refresh: float = 0.5, max_entries: int = 10_000):
+        """
+        Initialize the simulator.
+
+        Args:
+            budget: Seconds a send waits for its simulation (block lookup included) before going
+                ahead unsimulated
+            block_refresh: Seconds a block number read with eth_blockNumber is used before it is
+                read again; set_block() from a newHeads subscription keeps it current without RPC
+            max_entries: Cached results kept for the current block
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        self.budget = budget
+        self.block_refresh = block_refresh
+        self.max_entries = max_entries
+        self.block_number: int | None = None
+        self._block_read_at = 0.0
+        self._block_task: asyncio.Future[int] | None = None
+        self._results: dict[SimulationKey, str | None] = {}
+        self._inflight: dict[SimulationKey, asyncio.Future[str | None]] = {}
+        self.stats = SimulationStats()
+
+    @staticmethod
+    def key(address: ChecksumAddress | str, data: str | bytes, value: int, block_number: int) -> SimulationKey:
+        data = HexBytes(data)
+        return str(address).lower(), function_selector(bytes(data)), keccak(bytes(data[4:]) + value.to_bytes(32, "big")), block_number
+
+    def set_block(self, block_number: int):
+        """Record a new head; results of older blocks are dropped."""
+        if self.block_number is not None and block_number <= self.block_number:
+            return
+        self.block_number = block_number
+        self._block_read_at = time.monotonic()
+        self._results = {k: v for k, v in self._results.items() if k[3] >= block_number}
+
+    async def _current_block(self, web3: AsyncWeb3) -> int:
+        if self.block_number is not None and time.monotonic() - self._block_read_at < self.block_refresh:
+            return self.block_number
+        if self._block_task is None or self._block_task.done():
+            self._block_task = asyncio.ensure_future(web3.eth.block_number)
+        self.set_block(await asyncio.shield(self._block_task))
+        assert self.block_number is not None
+        return self.block_number
+
+    async def _call(self, web3: AsyncWeb3, tx: TxParams, key: SimulationKey) -> str | None:
+        try:
+            await web3.eth.call(tx, "pending")
+            result = None
+        except ContractLogicError as e:
+            data = e.data if isinstance(e.data, str) else e.message
+            result = decode_revert(data) or str(e)
+        if key[3] == self.block_number and len(self._results) < self.max_entries:
+            self._results[key] = result
+        return result
+
+    def _forget(self, key: SimulationKey, task: asyncio.Future[str | None]):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            # Nobody may be waiting any more once the budget ran out
+            logger.debug(f"Background simulation failed: {task.exception()}")
+
+    async def simulate(self, web3: AsyncWeb3, tx: TxParams) -> None:
+        """
+        Simulate a transaction; raises SimulationRevertError if it would revert.
+
+        Args:
+            web3: AsyncWeb3 instance used for eth_blockNumber and eth_call
+            tx: Transaction with "from", "to", "data" and optionally "value"
+        """
+        try:
+            async with timeout(self.budget):
+                block_number = await self._current_block(web3)
+                key = self.key(str(tx["to"]), tx["data"], int(tx.get("value", 0)), block_number)
+                if key in self._results:
+                    self.stats.hits += 1
+                    reason = self._results[key]
+                else:
+                    self.stats.misses += 1
+                    task = self._inflight.get(key)
+                    if task is None:
+                        task = self._inflight[key] = asyncio.ensure_future(self._call(web3, tx, key))
+                        task.add_done_callback(lambda done: self._forget(key, done))
+                    # Shielded so a timed-out call still fills the cache
+                    reason = await asyncio.shield(task)
+        except asyncio.TimeoutError:
+            self.stats.skipped += 1
+            logger.debug(f"Simulation of {function_selector(HexBytes(tx['data']))} exceeded {self.budget}s, sending unsimulated")
+            return
+        except Exception as e:
+            self.stats.skipped += 1
+            logger.debug(f"Simulation failed, sending unsimulated: {e}")
+            return
+        if reason is not None:
+            self.stats.reverts += 1
+            raise SimulationRevertError(reason, HexBytes(tx["data"]).to_0x_hex())
+
+    def clear(self):
+        """Drop every cached result."""
+        self._results.clear()
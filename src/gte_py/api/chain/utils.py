@@ -8,6 +8,9 @@ import json
 import logging
 import time
 import warnings
+from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor
+from enum import IntEnum
 from typing import Any, Generic, TypeVar, Callable, Tuple, Dict, Awaitable, Optional, List
 from typing import cast
 from typing_extensions import Unpack
@@ -25,8 +28,14 @@ from hexbytes import HexBytes
 from web3 import AsyncWeb3
 from web3.contract.async_contract import AsyncContractFunction, AsyncContractEvent
 from web3.exceptions import ContractCustomError, Web3Exception, Web3RPCError
-from web3.types import TxParams, EventData, Nonce, Wei, TxReceipt
+from web3.types import TxParams, EventData, Nonce, Wei, TxReceipt, RPCEndpoint
+from gte_py.api.chain.confirmations import HeadConfirmationTracker
 from gte_py.api.chain.errors import ERROR_SELECTORS
+from gte_py.api.chain.gas import GasProfileCache
+from gte_py.api.chain.journal import TxJournal
+from gte_py.api.chain.metrics import PipelineMetrics, stage_timer
+from gte_py.api.chain.replacement import InflightTx, ReplacementAction, ReplacementEngine
+from gte_py.api.chain.simulation import SimulationRevertError, TxSimulator
 
 logger = logging.getLogger(__name__)
 
@@ -310,10 +319,60 @@ def normalize_receipt(receipt: TxReceipt) -> TxReceipt:
     return {k: parse_field(k, v) for k, v in receipt.items()}
 
 
+def sign_transaction_with_key(private_key: bytes, tx_params: TransactionDictType) -> SignedTransaction:
+    """
+    Sign a transaction dict with a raw private key.
+
+    Module-level so it can be pickled and dispatched to a process pool.
+    """
+    return Account.sign_transaction(tx_params, private_key)
+
+
+class TxLane(IntEnum):
+    """
+    Submission lanes of BoundedNonceTxScheduler, highest priority first.
+
+    When the pending window fills up, waiting transactions are admitted in lane order and
+    each lane can keep a share of the window that lower lanes may not use.
+    """
+    CANCEL = 0  # cancels and other risk-reducing transactions
+    AMEND = 1
+    NEW = 2
+
+
+DEFAULT_LANE_RESERVES: dict[TxLane, float] = {TxLane.CANCEL: 0.1, TxLane.AMEND: 0.1}
+
+
+@dataclass
+class BatchSendResult:
+    """Outcome of a single transaction submitted through BoundedNonceTxScheduler.send_many."""
+    nonce: int | None
+    tx_hash: str | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class BoundedNonceTxScheduler:
     """A transaction scheduler that manages nonce allocation and prevents nonce gaps."""
     
-    def __init__(self, web3: AsyncWeb3, account: LocalAccount | None = None, max_pending_window: int = 499):
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        account: LocalAccount | None = None,
+        max_pending_window: int = 499,
+        signing_executor: Executor | None = None,
+        reserve_built_nonces: bool = False,
+        gas_cache: GasProfileCache | None = None,
+        lane_reserves: dict[TxLane, float] | None = None,
+        rpc_ws: str | None = None,
+        journal: TxJournal | None = None,
+        replacement: ReplacementEngine | None = None,
+        metrics: PipelineMetrics | None = None,
+        simulator: TxSimulator | None = None,
+    ):
         """
         Initialize the high-throughput transaction scheduler.
         
@@ -321,21 +380,78 @@ class BoundedNonceTxScheduler:
             web3: AsyncWeb3 instance for blockchain interaction
             account: Account for signing transactions
             max_pending_window: Maximum pending transactions (default: 499)
+            signing_executor: Optional thread or process pool used to sign transactions off the
+                event loop. Nonces are still assigned under nonce_lock. The executor is owned by
+                the caller and is not shut down by stop().
+            reserve_built_nonces: If True, return_transaction_data reserves nonces locally from
+                last_sent instead of asking the chain. Reserved nonces must be settled with
+                commit_nonce() or release_nonce().
+            gas_cache: Optional per-(contract, selector) gas profile cache. When set, transactions
+                without an explicit gas limit use the cached limit instead of the 1 giga gas default,
+                and receipts from send_wait feed their gasUsed back into the cache.
+            lane_reserves: Share of max_pending_window reserved for each lane (default: 10% for
+                cancels and 10% for amends). A lane may not use the shares reserved for the lanes
+                above it, so cancels still get nonces when new orders have filled the window.
+            rpc_ws: Optional WebSocket RPC endpoint (NetworkConfig.rpc_ws). When set, a newHeads
+                subscription advances last_confirmed as blocks land instead of waiting for a poll.
+            journal: Optional on-disk journal. Every signed transaction is appended before it is
+                broadcast, and start() reconciles the journal with the chain after a restart.
+            replacement: Optional replacement engine for stuck nonces. When set, a stuck
+                transaction is rebroadcast or re-signed at escalating fees depending on its intent,
+                and only cancelled after the engine's deadline, instead of always being cancelled
+                after 30 seconds.
+            metrics: Optional latency registry; nonce wait, ABI encode, sign, send RPC, realtime
+                receipt and event parse are timed into it
+            simulator: Optional pre-trade simulator. When set, send, send_wait and send_many
+                eth_call every transaction against pending state before it takes a nonce, and
+                one that would revert raises (or, in send_many, fails) with SimulationRevertError
         """
         self.web3 = web3
         self._account = account
+        self._signing_executor = signing_executor
         if not web3.eth.default_account:
             web3.eth.default_account = to_checksum_address("0x0000000000000000000000000000000000000000")
         self.from_address = account.address if account else web3.eth.default_account
 
         self.max_pending_window = max_pending_window
         
+        if lane_reserves is None:
+            lane_reserves = DEFAULT_LANE_RESERVES
+        if any(share < 0 for share in lane_reserves.values()) or sum(lane_reserves.values()) >= 1:
+            raise ValueError("lane_reserves must be non-negative and sum to less than 1")
+        self.lane_reserves = dict(lane_reserves)
+        
         # Lock-based nonce management
         self.nonce_lock = asyncio.Lock()
+        # Replaced on every window change; waiters hold the old event and are woken by set()
+        self._window_changed = asyncio.Event()
+        self._lane_waiters: dict[TxLane, int] = {lane: 0 for lane in TxLane}
         self.last_confirmed = 0
         self.last_sent = 0
         self.chain_id: int | None = None
         
+        # Local nonce reservations for built-but-unsent transactions
+        self.reserve_built_nonces = reserve_built_nonces
+        self._reserved_nonces: set[int] = set()
+        # Nonces handed back below last_sent, reused before last_sent grows
+        self._free_nonces: set[int] = set()
+        
+        self.gas_cache = gas_cache
+        self.metrics = metrics
+        self.simulator = simulator
+        
+        self.journal = journal
+        
+        # Broadcast transactions by nonce, kept only when a replacement engine needs them
+        self.replacement = replacement
+        self._inflight: dict[int, InflightTx] = {}
+        
+        # Called with every receipt from send_wait and wait_for_receipt
+        self._receipt_listeners: list[Callable[[TxReceipt], None]] = []
+        
+        # Optional push-based confirmation tracking
+        self.confirmation_tracker = HeadConfirmationTracker(self, rpc_ws) if rpc_ws else None
+        
         # Optional stuck nonce monitoring
         self._monitoring_task: asyncio.Task[None] | None = None
         self._stuck_nonce_threshold = 30  # seconds
@@ -349,6 +465,21 @@ class BoundedNonceTxScheduler:
             raise ValueError("No account set")
         return self._account
 
+    def add_receipt_listener(self, listener: Callable[[TxReceipt], None]):
+        """Call listener with every receipt obtained by send_wait or wait_for_receipt."""
+        self._receipt_listeners.append(listener)
+
+    def remove_receipt_listener(self, listener: Callable[[TxReceipt], None]):
+        if listener in self._receipt_listeners:
+            self._receipt_listeners.remove(listener)
+
+    def _notify_receipt(self, receipt: TxReceipt):
+        for listener in self._receipt_listeners:
+            try:
+                listener(receipt)
+            except Exception as e:
+                self.logger.warning(f"Receipt listener failed: {e}")
+
     async def start(self):
         """Initialize scheduler and optionally start background monitoring."""
         self.last_confirmed = await self.web3.eth.get_transaction_count(self.from_address, "latest")
@@ -358,9 +489,15 @@ class BoundedNonceTxScheduler:
         self.logger.info(f"BoundedNonceTxScheduler started for {self.from_address}")
         self.logger.info(f"Initial nonce: {self.last_confirmed}, Chain ID: {self.chain_id}")
         
+        if self.journal is not None:
+            await self._recover_from_journal()
+        
         # Start optional stuck nonce monitoring (only if needed)
         if self._monitor_interval > 0:
             self._monitoring_task = asyncio.create_task(self._monitor_stuck_nonces())
+        
+        if self.confirmation_tracker is not None:
+            await self.confirmation_tracker.start()
     
     async def stop(self):
         """Stop scheduler and cancel background monitoring."""
@@ -371,41 +508,220 @@ class BoundedNonceTxScheduler:
             except asyncio.CancelledError:
                 pass
         
+        if self.confirmation_tracker is not None:
+            await self.confirmation_tracker.stop()
+        
         # Wait for pending transactions to confirm
         await self._sync_confirmed_nonce()
+        if self.journal is not None:
+            self.journal.prune(self.from_address, self.last_confirmed)
         pending_count = await self.get_pending_count()
         if pending_count > 0:
             self.logger.warning(f"Stopping with {pending_count} pending transactions")
         
         self.logger.info("BoundedNonceTxScheduler stopped")
 
+    async def _recover_from_journal(self):
+        """
+        Reconcile the journal with chain state after a restart.
+
+        Journaled transactions at or above the pending nonce were lost by the network: they are
+        rebroadcast in one batch, or cancelled if their intent is not meant to be rebroadcast.
+        Nonces in that range missing from the journal are cancelled at once instead of waiting
+        for the stuck-nonce threshold.
+        """
+        journal = cast(TxJournal, self.journal)
+        removed = journal.prune(self.from_address, self.last_confirmed)
+        pending_nonce = await self.web3.eth.get_transaction_count(self.from_address, "pending")
+        entries = journal.entries_from(self.from_address, pending_nonce)
+        top = max(pending_nonce, max(entries, default=-1) + 1)
+        self.last_sent = max(self.last_sent, top)
+        self.logger.info(
+            f"Journal recovery: pruned {removed} confirmed entries, "
+            f"confirmed={self.last_confirmed}, pending={pending_nonce}, journaled up to {top}"
+        )
+        
+        rebroadcast = [entry for _, entry in sorted(entries.items()) if journal.should_rebroadcast(entry)]
+        to_cancel = set(range(pending_nonce, top)) - {entry.nonce for entry in rebroadcast}
+        
+        if rebroadcast:
+            try:
+                responses = await self.web3.provider.make_batch_request([
+                    (RPCEndpoint("eth_sendRawTransaction"), ["0x" + entry.raw_tx.hex()]) for entry in rebroadcast
+                ])
+            except Exception as e:
+                self.logger.error(f"Journal rebroadcast failed: {e}")
+                responses = [{"error": str(e)}] * len(rebroadcast)
+            if not isinstance(responses, list) or len(responses) != len(rebroadcast):
+                responses = [{"error": str(responses)}] * len(rebroadcast)
+            
+            for entry, response in zip(rebroadcast, responses):
+                error_data = response.get("error")
+                if error_data is None:
+                    self.logger.info(f"Rebroadcast journaled {entry.intent} at nonce {entry.nonce}: {entry.tx_hash}")
+                    continue
+                message = str(error_data.get("message", error_data) if isinstance(error_data, dict) else error_data)
+                if "already known" in message.lower() or "nonce too low" in message.lower():
+                    continue
+                # Rejected for good; fill the nonce so later transactions are not blocked
+                self.logger.warning(f"Journaled transaction at nonce {entry.nonce} rejected: {message}")
+                to_cancel.add(entry.nonce)
+        
+        for nonce in sorted(to_cancel):
+            await self._cancel_stuck_nonce(nonce)
+
     async def get_pending_count(self) -> int:
         """Get current number of pending transactions."""
         async with self.nonce_lock:
             return self.last_sent - self.last_confirmed
 
+    @property
+    def reserved_nonces(self) -> set[int]:
+        """Nonces reserved for built transactions that are not yet committed or released."""
+        return set(self._reserved_nonces)
+
+    def lane_limit(self, lane: TxLane) -> int:
+        """Number of pending transactions a lane may fill the window up to."""
+        reserved = sum(
+            int(self.max_pending_window * share) for other, share in self.lane_reserves.items() if other < lane
+        )
+        return self.max_pending_window - reserved
+
+    def _notify_window(self):
+        """Wake transactions waiting for room in the pending window."""
+        self._window_changed.set()
+        self._window_changed = asyncio.Event()
+
+    def _allocate_nonce(self) -> int:
+        """Take the lowest free nonce, or the next one after last_sent (must be called under lock)."""
+        if self._free_nonces:
+            nonce = min(self._free_nonces)
+            self._free_nonces.discard(nonce)
+            return nonce
+        nonce = self.last_sent
+        self.last_sent += 1
+        return nonce
+
+    def _release_nonce(self, nonce: int):
+        """Return an unused nonce to the pool (must be called under lock)."""
+        if nonce < self.last_confirmed or nonce >= self.last_sent:
+            return
+        self._free_nonces.add(nonce)
+        self._inflight.pop(nonce, None)
+        # Shrink last_sent while the top of the range is free
+        while self.last_sent - 1 in self._free_nonces:
+            self.last_sent -= 1
+            self._free_nonces.discard(self.last_sent)
+        self._notify_window()
+
+    async def reserve_nonce(self, lane: TxLane = TxLane.NEW) -> int:
+        """
+        Reserve the next nonce locally without any RPC.
+
+        The nonce stays reserved until commit_nonce() (it was broadcast) or
+        release_nonce() (it will not be used) is called.
+
+        Args:
+            lane: Submission lane the nonce is taken from
+
+        Returns:
+            The reserved nonce
+        """
+        with stage_timer(self.metrics, "nonce_wait"):
+            nonce, = await self._acquire_nonces(1, lane)
+        async with self.nonce_lock:
+            self._reserved_nonces.add(nonce)
+        self.logger.debug(f"Reserved nonce {nonce}")
+        return nonce
+
+    async def commit_nonce(self, nonce: int):
+        """
+        Mark a reserved nonce as broadcast by an external relayer.
+
+        Args:
+            nonce: Nonce previously returned by reserve_nonce() or return_transaction_data()
+        """
+        async with self.nonce_lock:
+            if nonce not in self._reserved_nonces:
+                raise ValueError(f"Nonce {nonce} is not reserved")
+            self._reserved_nonces.discard(nonce)
+
+    async def release_nonce(self, nonce: int):
+        """
+        Give back a reserved nonce whose transaction will not be broadcast.
+
+        The nonce is reused by the next transaction so no gap is left behind.
+
+        Args:
+            nonce: Nonce previously returned by reserve_nonce() or return_transaction_data()
+        """
+        async with self.nonce_lock:
+            if nonce not in self._reserved_nonces:
+                raise ValueError(f"Nonce {nonce} is not reserved")
+            self._reserved_nonces.discard(nonce)
+            self._release_nonce(nonce)
+
+    def confirm_nonce(self, next_nonce: int):
+        """
+        Record that the account's confirmed transaction count has reached next_nonce.
+
+        Fed by send_wait receipts, the confirmation tracker and the monitor, so the pending
+        window frees up without a poll. last_confirmed never moves backwards here.
+
+        Args:
+            next_nonce: Confirmed transaction count, i.e. one past the highest confirmed nonce
+        """
+        if next_nonce <= self.last_confirmed:
+            return
+        self.last_confirmed = next_nonce
+        if self.last_sent < next_nonce:
+            # Nonces used outside this scheduler
+            self.last_sent = next_nonce
+        self._free_nonces = {n for n in self._free_nonces if n >= next_nonce}
+        self._prune_inflight()
+        self._notify_window()
+        self.logger.debug(f"Confirmed nonce advanced to {next_nonce}")
+
+    def _prune_inflight(self):
+        """Forget in-flight transactions below the confirmed nonce."""
+        if self._inflight:
+            self._inflight = {n: tx for n, tx in self._inflight.items() if n >= self.last_confirmed}
+
     async def _sync_confirmed_nonce(self):
         """Sync last_confirmed from chain (must be called under lock)."""
         network_confirmed = await self.web3.eth.get_transaction_count(self.from_address, "latest")
+        if network_confirmed > self.last_confirmed:
+            self._notify_window()
         self.last_confirmed = network_confirmed
         self.logger.debug(f"Synced confirmed nonce: {self.last_confirmed}")
 
-    async def _handle_nonce_error_and_retry(self, contract_func: "TypedContractFunction[Any]") -> str:
-        """Handle nonce error by getting fresh nonce and resending transaction."""
+    async def _resync_nonces(self):
+        """Reset confirmed and sent nonces from the node after a nonce error."""
         async with self.nonce_lock:
             # Get the actual pending nonce from the node
             pending_nonce = await self.web3.eth.get_transaction_count(self.from_address, "pending")
             self.last_confirmed = await self.web3.eth.get_transaction_count(self.from_address, "latest")
-            self.last_sent = pending_nonce
+            # Never hand out nonces still held by outstanding reservations
+            self.last_sent = max(pending_nonce, max(self._reserved_nonces, default=-1) + 1)
+            self._free_nonces = {n for n in self._free_nonces if pending_nonce <= n < self.last_sent}
+            self._notify_window()
             self.logger.info(f"Nonce error - resynced: confirmed={self.last_confirmed}, pending={pending_nonce}")
+
+    async def _handle_nonce_error_and_retry(
+        self, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW
+    ) -> str:
+        """Handle nonce error by getting fresh nonce and resending transaction."""
+        await self._resync_nonces()
         
         # Now sign and send with the correct nonce
-        signed = await self._sign_transaction(contract_func)
+        signed = await self._sign_transaction(contract_func, lane)
         tx_hash = await self.web3.eth.send_raw_transaction(signed.raw_transaction)
         self.logger.info(f"Resent transaction successfully: {tx_hash.hex()}")
         return tx_hash.to_0x_hex()
 
-    async def _handle_rpc_error(self, e: Web3RPCError, contract_func: "TypedContractFunction[Any]") -> str:
+    async def _handle_rpc_error(
+        self, e: Web3RPCError, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW
+    ) -> str:
         """Handle RPC errors with appropriate recovery strategies."""
         error_data = e.args[0] if e.args else {}
         error_code = error_data.get('code') if isinstance(error_data, dict) else None
@@ -414,7 +730,7 @@ class BoundedNonceTxScheduler:
         # Nonce errors - resync and retry
         if 'nonce too low' in error_message.lower() or 'nonce too high' in error_message.lower():
             self.logger.warning(f"Nonce error detected: {error_message}")
-            return await self._handle_nonce_error_and_retry(contract_func)
+            return await self._handle_nonce_error_and_retry(contract_func, lane)
             
         # Already submitted - treat as success
         elif 'already known' in error_message.lower() or 'transaction already in pool' in error_message.lower():
@@ -431,171 +747,593 @@ class BoundedNonceTxScheduler:
             self.logger.warning(f"RPC Error {error_code}: {error_message}")
             return f"0x{'0' * 64}"
 
-    async def _check_pending_window(self):
+    async def _acquire_nonces(self, count: int = 1, lane: TxLane = TxLane.NEW) -> List[int]:
         """
-        Check pending window and sync if needed. Fast fail if still full.
+        Allocate nonces for a lane once the pending window has room. Fast fail if it stays full.
         Must be called before transaction signing.
+
+        While waiting, the lock is not held: local window changes (released nonces,
+        confirmations) wake the waiter at once, and the chain is polled with backoff.
+
+        Args:
+            count: Number of consecutive nonces to allocate
+            lane: Submission lane; waiting lanes are admitted highest priority first
+
+        Returns:
+            The allocated nonces in ascending order
         """
-        async with self.nonce_lock:
-            pending_count = self.last_sent - self.last_confirmed
-            
-            # Fast path: if window is not full, no network calls needed
-            if pending_count < self.max_pending_window:
-                return
-            
-            self.logger.warning(f"Pending window full ({pending_count}/{self.max_pending_window}), syncing with network")
-            
-            # Retry with exponential backoff: 0s, 2s, 4s, 8s
-            retry_delays = [0, 2, 4, 8]
-            
+        limit = self.lane_limit(lane)
+        if count > limit:
+            raise ValueError(f"Cannot send {count} transactions in lane {lane.name} with a limit of {limit}")
+        
+        nonces = await self._try_allocate(count, lane)
+        if nonces is not None:
+            return nonces
+        
+        pending_count = self.last_sent - self.last_confirmed
+        self.logger.warning(
+            f"Pending window full for lane {lane.name} ({pending_count}/{limit}), syncing with network"
+        )
+        
+        # Retry with exponential backoff: 2s, 4s, 8s
+        retry_delays = [2, 4, 8]
+        
+        self._lane_waiters[lane] += 1
+        try:
             for delay in retry_delays:
-                if delay > 0:
-                    self.logger.info(f"Retrying window check in {delay}s")
-                    await asyncio.sleep(delay)
-                    
-                    try:
-                        # Sync with network to get latest confirmed nonce
-                        network_confirmed = await self.web3.eth.get_transaction_count(self.from_address, "latest")
-                        self.last_confirmed = network_confirmed
-                        
-                        # Check if we still have too many pending after sync
-                        pending_after_sync = self.last_sent - self.last_confirmed
-                        
-                        if pending_after_sync < self.max_pending_window:
-                            self.logger.info(f"Window cleared after retry: confirmed={self.last_confirmed}, pending={pending_after_sync}")
-                            return
-                        
-                        self.logger.warning(f"Window still full after attempt: {pending_after_sync}/{self.max_pending_window} pending")
-                        
-                    except Exception as e:
-                        self.logger.error(f"Network error during window check attempt: {e}")
-                        continue
+                self.logger.info(f"Retrying window check in {delay}s")
+                nonces = await self._wait_for_window(count, lane, delay)
+                if nonces is not None:
+                    return nonces
                 
-            # All retries exhausted and window still full
-            final_pending = self.last_sent - self.last_confirmed
-            raise RuntimeError(
-                f"Pending transaction window still full after {len(retry_delays)} retries: ",
-                f"{final_pending}/{self.max_pending_window} transactions pending"
-            )
+                try:
+                    # Sync with network to get latest confirmed nonce
+                    async with self.nonce_lock:
+                        await self._sync_confirmed_nonce()
+                except Exception as e:
+                    self.logger.error(f"Network error during window check attempt: {e}")
+                    continue
+                
+                nonces = await self._try_allocate(count, lane)
+                if nonces is not None:
+                    self.logger.info(f"Window cleared after retry: confirmed={self.last_confirmed}")
+                    return nonces
+                
+                pending_after_sync = self.last_sent - self.last_confirmed
+                self.logger.warning(f"Window still full after attempt: {pending_after_sync}/{limit} pending")
+        finally:
+            self._lane_waiters[lane] -= 1
+            # Lower lanes defer to this one while it waits; let them re-check
+            self._notify_window()
+        
+        # All retries exhausted and window still full
+        final_pending = self.last_sent - self.last_confirmed
+        raise RuntimeError(
+            f"Pending transaction window still full after {len(retry_delays) + 1} retries: "
+            f"{final_pending}/{limit} transactions pending in lane {lane.name}"
+        )
+
+    async def _try_allocate(self, count: int, lane: TxLane) -> List[int] | None:
+        """Allocate nonces if the lane has room and no higher lane is waiting, else return None."""
+        async with self.nonce_lock:
+            if any(self._lane_waiters[other] for other in TxLane if other < lane):
+                return None
+            if self.last_sent - self.last_confirmed + count > self.lane_limit(lane):
+                return None
+            # Allocation always hands out the lowest free nonce, so these are ascending
+            return [self._allocate_nonce() for _ in range(count)]
+
+    async def _wait_for_window(self, count: int, lane: TxLane, delay: float) -> List[int] | None:
+        """Wait up to delay seconds, retrying the allocation whenever the window changes."""
+        sleeper = asyncio.ensure_future(asyncio.sleep(delay))
+        try:
+            while not sleeper.done():
+                changed = asyncio.ensure_future(self._window_changed.wait())
+                await asyncio.wait([sleeper, changed], return_when=asyncio.FIRST_COMPLETED)
+                changed.cancel()
+                if sleeper.done():
+                    break
+                nonces = await self._try_allocate(count, lane)
+                if nonces is not None:
+                    return nonces
+        finally:
+            sleeper.cancel()
+        return None
+
+    def _gas_limit(self, contract_func: "TypedContractFunction[Any]", data: str) -> int:
+        """Pick the gas limit: explicit param, then gas cache, then the 1 giga gas default."""
+        if "gas" in contract_func.params:
+            return contract_func.params["gas"]
+        if self.gas_cache is not None:
+            cached = self.gas_cache.get_limit(contract_func.func_call.address, data)
+            if cached is not None:
+                return cached
+        return 1_000_000_000 # max gas (1 giga gas)
+
+    async def estimate_gas(self, contract_func: "TypedContractFunction[Any]", data: str | None = None) -> int:
+        """
+        Estimate gas for a contract function with eth_estimateGas and record it in the gas cache.
+
+        Call this ahead of trading to warm the cache so later builds need no RPC.
+
+        Args:
+            contract_func: The contract function to estimate
+            data: Already encoded calldata, if available
+
+        Returns:
+            Gas limit with the cache's safety margin applied
+        """
+        if self.gas_cache is None:
+            raise ValueError("No gas cache configured")
+        tx: TxParams = {
+            "from": self.from_address,
+            "to": contract_func.func_call.address,
+            "data": data or contract_func.func_call._encode_transaction_data(),
+            "value": contract_func.params.get("value", 0),
+        }
+        return await self.gas_cache.estimate(self.web3, tx)
+
+    async def _ensure_gas_profile(self, contract_func: "TypedContractFunction[Any]", data: str):
+        """Estimate gas once for a function that has no profile yet, if the cache asks for it."""
+        if self.gas_cache is None or not self.gas_cache.estimate_on_miss or "gas" in contract_func.params:
+            return
+        if self.gas_cache.get_limit(contract_func.func_call.address, data) is not None:
+            return
+        try:
+            await self.estimate_gas(contract_func, data)
+        except Exception as e:
+            # Fall back to the default limit; the send itself will surface any revert
+            self.logger.debug(f"Gas estimation failed, using default limit: {e}")
+
+    def _build_tx_params(
+        self, contract_func: "TypedContractFunction[Any]", nonce: int, data: str | None = None
+    ) -> TransactionDictType:
+        """Build the EIP-1559 transaction dict for a contract function at the given nonce."""
+        if self.chain_id is None:
+            raise ValueError("Chain ID is not set")
+        
+        if data is None:
+            with stage_timer(self.metrics, "abi_encode"):
+                data = contract_func.func_call._encode_transaction_data()
+        tx_params: TransactionDictType = {
+            "chainId": self.chain_id,
+            "from": self.from_address,
+            "nonce": Nonce(nonce),
+            "to": contract_func.func_call.address,
+            "data": data,
+            "gas": self._gas_limit(contract_func, data),
+            "maxFeePerGas": contract_func.params.get("maxFeePerGas", 2_500_000), # 0.0025 gwei
+            "maxPriorityFeePerGas": contract_func.params.get("maxPriorityFeePerGas", 0),
+            "value": contract_func.params.get("value", 0),
+        }
+        return tx_params
 
-    async def return_transaction_data(self, contract_func: "TypedContractFunction[Any]") -> TransactionDictType:
+    async def return_transaction_data(
+        self,
+        contract_func: "TypedContractFunction[Any]",
+        reserve_nonce: bool | None = None,
+        lane: TxLane = TxLane.NEW,
+    ) -> TransactionDictType:
         """
         Return the transaction data for a contract function.
 
         Args:
             contract_func: The contract function to execute
+            reserve_nonce: Reserve the nonce locally from last_sent instead of fetching it from
+                the chain. Defaults to the scheduler's reserve_built_nonces setting. A reserved
+                nonce must be settled with commit_nonce() or release_nonce().
+            lane: Submission lane a reserved nonce is taken from
 
         Returns:
             TransactionDictType: transaction data
         """
-        # get nonce from chain for web3 default account
-        if not self.web3.eth.default_account:
-            raise ValueError("No default account set")
-        nonce = await self.web3.eth.get_transaction_count(self.web3.eth.default_account, "latest")
-        if not self.chain_id:
+        if reserve_nonce is None:
+            reserve_nonce = self.reserve_built_nonces
+        
+        if not reserve_nonce:
+            # get nonce from chain for web3 default account
+            if not self.web3.eth.default_account:
+                raise ValueError("No default account set")
+            nonce = await self.web3.eth.get_transaction_count(self.web3.eth.default_account, "latest")
+            return self._build_tx_params(contract_func, nonce)
+        
+        if self.chain_id is None:
             raise ValueError("Chain ID is not set")
-        tx_params: TransactionDictType = {
-                "chainId": self.chain_id,
-                "from": self.from_address,
-                "nonce": Nonce(nonce),
-                "to": contract_func.func_call.address,
-                "data": contract_func.func_call._encode_transaction_data(),
-                "gas": contract_func.params.get("gas", 1_000_000_000), # max gas (1 giga gas)
-                "maxFeePerGas": contract_func.params.get("maxFeePerGas", 2_500_000), # 0.0025 gwei
-                "maxPriorityFeePerGas": contract_func.params.get("maxPriorityFeePerGas", 0),
-                "value": contract_func.params.get("value", 0),
-            }
-        return tx_params
+        nonce = await self.reserve_nonce(lane)
+        try:
+            return self._build_tx_params(contract_func, nonce)
+        except Exception:
+            await self.release_nonce(nonce)
+            raise
 
-    async def _sign_transaction(self, contract_func: "TypedContractFunction[Any]") -> SignedTransaction:
+    async def _sign_transaction(
+        self, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW
+    ) -> SignedTransaction:
         """
         Sign a transaction with automatic nonce allocation.
         
         Args:
             contract_func: The contract function to execute
+            lane: Submission lane the nonce is taken from
             
         Returns:
             Signed transaction ready for submission
         """
-        await self._check_pending_window()
+        signed, _ = await self._build_and_sign(contract_func, lane)
+        return signed
+
+    async def _build_and_sign(
+        self, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW
+    ) -> tuple[SignedTransaction, TransactionDictType]:
+        """Allocate a nonce, build and sign a transaction, returning it with its params."""
+        data = await self._prepare_calldata(contract_func)
         
-        # Atomic nonce increment
-        async with self.nonce_lock:
-            nonce = self.last_sent
-            self.last_sent += 1
+        # Atomic window check and nonce allocation
+        with stage_timer(self.metrics, "nonce_wait"):
+            nonce, = await self._acquire_nonces(1, lane)
         
+        return await self._sign_at_nonce(contract_func, nonce, data, lane)
+
+    async def _prepare_calldata(self, contract_func: "TypedContractFunction[Any]") -> str | None:
+        """Encode calldata ahead of nonce allocation when the gas cache or the simulator needs it."""
+        if self.gas_cache is None and self.simulator is None:
+            return None
+        # Encode once up front so a cache miss can be estimated before a nonce is taken
+        with stage_timer(self.metrics, "abi_encode"):
+            data = contract_func.func_call._encode_transaction_data()
+        await self._ensure_gas_profile(contract_func, data)
+        if self.simulator is not None:
+            with stage_timer(self.metrics, "simulate"):
+                await self.simulator.simulate(self.web3, {
+                    "from": self.from_address,
+                    "to": contract_func.func_call.address,
+                    "data": data,
+                    "value": contract_func.params.get("value", 0),
+                })
+        return data
+
+    async def _sign_at_nonce(
+        self,
+        contract_func: "TypedContractFunction[Any]",
+        nonce: int,
+        data: str | None = None,
+        lane: TxLane = TxLane.NEW,
+    ) -> tuple[SignedTransaction, TransactionDictType]:
+        """Build and sign a transaction at an allocated nonce, releasing the nonce on failure."""
         try:
-            if self.chain_id is None:
-                raise ValueError("Chain ID is not set")
-            
             # Build transaction with required parameters
-            tx_params: TransactionDictType = {
-                "chainId": self.chain_id,
-                "from": self.from_address,
-                "nonce": Nonce(nonce),
-                "to": contract_func.func_call.address,
-                "data": contract_func.func_call._encode_transaction_data(),
-                "gas": contract_func.params.get("gas", 1_000_000_000), # max gas (1 giga gas)
-                "maxFeePerGas": contract_func.params.get("maxFeePerGas", 2_500_000), # 0.0025 gwei
-                "maxPriorityFeePerGas": contract_func.params.get("maxPriorityFeePerGas", 0),
-                "value": contract_func.params.get("value", 0),
-            }
+            tx_params = self._build_tx_params(contract_func, nonce, data)
             
-            # Sign the transaction using the account's sign_transaction method
-            signed = self.account.sign_transaction(tx_params)
+            # Sign the transaction, off the event loop if an executor is configured
+            with stage_timer(self.metrics, "sign"):
+                signed = await self._sign_tx_params(tx_params)
             
             self.logger.debug(f"Signed transaction with nonce {nonce}: {signed.hash.hex()}")
-            return signed
+            self._journal_signed(nonce, signed, lane.name.lower())
+            self._track_inflight(nonce, tx_params, signed, lane.name.lower())
+            return signed, tx_params
             
         except Exception as e:
             # If signing fails, return the nonce to the pool
             async with self.nonce_lock:
-                self.last_sent -= 1
+                self._release_nonce(nonce)
             self.logger.error(f"Failed to sign transaction with nonce {nonce}: {e}")
             raise
 
-    async def send(self, contract_func: "TypedContractFunction[Any]") -> str:
+    def _journal_signed(self, nonce: int, signed: SignedTransaction, intent: str):
+        """Append a signed transaction to the journal, if any, before it is broadcast."""
+        if self.journal is None:
+            return
+        try:
+            self.journal.record(self.from_address, nonce, signed.hash.to_0x_hex(), signed.raw_transaction, intent)
+        except Exception as e:
+            # Losing a journal entry only weakens crash recovery; keep trading
+            self.logger.error(f"Failed to journal transaction with nonce {nonce}: {e}")
+
+    def _track_inflight(self, nonce: int, tx_params: TransactionDictType, signed: SignedTransaction, intent: str):
+        """Keep a signed transaction around so the replacement engine can rebroadcast or re-sign it."""
+        if self.replacement is not None:
+            self._inflight[nonce] = InflightTx(tx_params, bytes(signed.raw_transaction), intent)
+
+    async def _sign_tx_params(self, tx_params: TransactionDictType) -> SignedTransaction:
+        """
+        Sign fully built transaction params.
+
+        Runs inline when no signing executor is configured. Process pools receive the raw key
+        and a module-level function so the call can be pickled.
+        """
+        if self._signing_executor is None:
+            return self.account.sign_transaction(tx_params)
+        
+        loop = asyncio.get_running_loop()
+        if isinstance(self._signing_executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                self._signing_executor, sign_transaction_with_key, bytes(self.account.key), tx_params
+            )
+        return await loop.run_in_executor(self._signing_executor, self.account.sign_transaction, tx_params)
+
+    async def send(self, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW) -> str:
         """
         Send transaction with robust error handling and nonce management.
         
+        Args:
+            contract_func: The contract function to execute
+            lane: Submission lane; use TxLane.CANCEL for cancels so they overtake new orders
+        
         Returns:
             Transaction hash of the submitted transaction
         """
         try:
             # Sign and send transaction
-            signed = await self._sign_transaction(contract_func)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed.raw_transaction)
+            signed = await self._sign_transaction(contract_func, lane)
+            with stage_timer(self.metrics, "send_rpc"):
+                tx_hash = await self.web3.eth.send_raw_transaction(signed.raw_transaction)
             self.logger.debug(f"Transaction sent: {tx_hash.hex()}")
             return tx_hash.to_0x_hex()
             
         except Web3RPCError as e:
-            return await self._handle_rpc_error(e, contract_func)
+            return await self._handle_rpc_error(e, contract_func, lane)
             
         except ContractCustomError as e:
             raise convert_web3_error(e, "transaction")
             
+        except SimulationRevertError:
+            raise
+            
         except Exception as e:
             self.logger.error(f"Unexpected transaction error: {e}")
             raise Exception(f"Transaction failed: {str(e)}")
 
-    async def send_wait(self, contract_func: "TypedContractFunction[Any]") -> Any:
+    async def send_many(
+        self, contract_funcs: List["TypedContractFunction[Any]"], lane: TxLane = TxLane.NEW
+    ) -> List[BatchSendResult]:
+        """
+        Sign a burst of transactions at consecutive nonces and submit them in one JSON-RPC batch.
+
+        Nonces are allocated in list order, so transactions are mined in the order given.
+        Failures are reported per transaction instead of raised: nonce errors are resynced
+        and resent individually, "already known" counts as success, and any other rejection
+        frees its nonce for the next send, or fills it with a self-transfer if transactions
+        above it were accepted. If the batch request fails as a whole, all its nonces are freed.
+
+        Args:
+            contract_funcs: Contract functions to send, in the desired nonce order
+            lane: Submission lane for the whole batch
+
+        Returns:
+            One BatchSendResult per contract function, in the same order
+        """
+        if not contract_funcs:
+            return []
+        
+        prepared = await asyncio.gather(*(self._prepare_calldata(func) for func in contract_funcs), return_exceptions=True)
+        if any(isinstance(data, BaseException) for data in prepared):
+            # Transactions that failed before a nonce was taken are reported without one
+            passing = [func for func, data in zip(contract_funcs, prepared) if not isinstance(data, BaseException)]
+            sent = iter(await self.send_many(passing, lane) if passing else [])
+            return [
+                BatchSendResult(None, error=cast(Exception, data)) if isinstance(data, BaseException) else next(sent)
+                for data in prepared
+            ]
+        datas = cast(List[str | None], prepared)
+        with stage_timer(self.metrics, "nonce_wait"):
+            nonces = await self._acquire_nonces(len(contract_funcs), lane)
+        
+        signed_txs = await asyncio.gather(
+            *(
+                self._sign_at_nonce(func, nonce, data, lane)
+                for func, nonce, data in zip(contract_funcs, nonces, datas)
+            ),
+            return_exceptions=True,
+        )
+        
+        results: List[BatchSendResult] = []
+        batch: List[Tuple[int, SignedTransaction]] = []
+        for i, (nonce, signed) in enumerate(zip(nonces, signed_txs)):
+            if isinstance(signed, BaseException):
+                results.append(BatchSendResult(nonce, error=cast(Exception, signed)))
+            else:
+                results.append(BatchSendResult(nonce))
+                batch.append((i, signed[0]))
+        
+        if not batch:
+            return results
+        return await self._broadcast_batch(contract_funcs, nonces, results, batch, lane)
+
+    def sign_ahead_nonce(self) -> int | None:
+        """
+        Nonce sign_ahead signs from: the next one after last_sent, or None while released nonces
+        are waiting to be reused. Transactions signed ahead stay sendable while this equals the
+        nonce of the first one.
+        """
+        if self._free_nonces:
+            return None
+        return self.last_sent
+
+    async def sign_ahead(
+        self,
+        contract_funcs: List["TypedContractFunction[Any]"],
+        lane: TxLane = TxLane.CANCEL,
+        datas: List[str] | None = None,
+    ) -> List[Tuple[SignedTransaction, TransactionDictType]]:
+        """
+        Sign transactions at the nonces the next allocation would hand out, without taking them.
+
+        Nothing is journaled or tracked until send_presigned broadcasts the transactions, and
+        the nonces stay available to other sends meanwhile; sign again whenever last_sent moves.
+        Signing needs no RPC: there is no simulation or gas estimation, and the gas limit is
+        the explicit one, the cached profile or the default.
+
+        Args:
+            contract_funcs: Contract functions to sign, in the desired nonce order
+            lane: Submission lane the transactions will be sent in
+            datas: Calldata already encoded for contract_funcs, reused when signing again
+
+        Returns:
+            (signed transaction, transaction params) per contract function
+        """
+        first_nonce = self.sign_ahead_nonce()
+        if first_nonce is None:
+            raise RuntimeError(f"Nonces {sorted(self._free_nonces)} must be reused before signing ahead")
+        if datas is None:
+            with stage_timer(self.metrics, "abi_encode"):
+                datas = [func.func_call._encode_transaction_data() for func in contract_funcs]
+        signed = []
+        for offset, (func, data) in enumerate(zip(contract_funcs, datas)):
+            tx_params = self._build_tx_params(func, first_nonce + offset, data)
+            with stage_timer(self.metrics, "sign"):
+                signed.append((await self._sign_tx_params(tx_params), tx_params))
+        return signed
+
+    async def send_presigned(
+        self,
+        contract_funcs: List["TypedContractFunction[Any]"],
+        presigned: List[Tuple[SignedTransaction, TransactionDictType]],
+        lane: TxLane = TxLane.CANCEL,
+    ) -> List[BatchSendResult] | None:
+        """
+        Broadcast transactions from sign_ahead in one JSON-RPC batch.
+
+        The nonces are taken without waiting for the pending window, so a kill switch is never
+        held back by a full window.
+
+        Args:
+            contract_funcs: The contract functions that were signed, used to resend nonce failures
+            presigned: Result of sign_ahead for contract_funcs
+            lane: Submission lane the transactions were signed for
+
+        Returns:
+            One BatchSendResult per transaction, or None without sending anything if the signed
+            nonces are no longer the next ones to hand out
+        """
+        if not presigned:
+            return []
+        nonces = [int(tx_params["nonce"]) for _, tx_params in presigned]
+        async with self.nonce_lock:
+            if nonces[0] != self.sign_ahead_nonce():
+                return None
+            self.last_sent += len(nonces)
+            self._notify_window()
+        
+        intent = lane.name.lower()
+        for nonce, (signed, tx_params) in zip(nonces, presigned):
+            self._journal_signed(nonce, signed, intent)
+            self._track_inflight(nonce, tx_params, signed, intent)
+        results = [BatchSendResult(nonce) for nonce in nonces]
+        batch = [(i, signed) for i, (signed, _) in enumerate(presigned)]
+        return await self._broadcast_batch(contract_funcs, nonces, results, batch, lane)
+
+    async def _broadcast_batch(
+        self,
+        contract_funcs: List["TypedContractFunction[Any]"],
+        nonces: List[int],
+        results: List[BatchSendResult],
+        batch: List[Tuple[int, SignedTransaction]],
+        lane: TxLane,
+    ) -> List[BatchSendResult]:
+        """Submit signed transactions in one JSON-RPC batch and fill in their results."""
+        try:
+            with stage_timer(self.metrics, "send_rpc"):
+                responses = await self.web3.provider.make_batch_request([
+                    (RPCEndpoint("eth_sendRawTransaction"), [signed.raw_transaction.to_0x_hex()])
+                    for _, signed in batch
+                ])
+        except Exception as e:
+            self.logger.error(f"Batch transaction submission failed: {e}")
+            await self._release_batch_nonces(nonces, batch)
+            raise Exception(f"Batch transaction failed: {str(e)}")
+        
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            # A malformed batch gets a single error object back instead of one response per call
+            await self._release_batch_nonces(nonces, batch)
+            raise Exception(f"Batch transaction failed: {responses}")
+        
+        rejected: List[int] = []
+        nonce_errors: List[Tuple[int, str]] = []
+        for (i, signed), response in zip(batch, responses):
+            error_data = response.get("error")
+            if error_data is None:
+                results[i].tx_hash = cast(str, response.get("result"))
+                continue
+            
+            error_message = error_data.get("message", str(error_data)) if isinstance(error_data, dict) else str(error_data)
+            message = error_message.lower()
+            if "nonce too low" in message or "nonce too high" in message:
+                nonce_errors.append((i, error_message))
+            elif "already known" in message or "transaction already in pool" in message:
+                self.logger.debug("Transaction already known/in pool")
+                results[i].tx_hash = signed.hash.to_0x_hex()
+            else:
+                self.logger.warning(f"RPC Error in batch for nonce {nonces[i]}: {error_message}")
+                rejected.append(i)
+                results[i].error = Web3RPCError(error_message, rpc_response=response)
+        
+        for i in rejected:
+            # Rejected outright, so the nonce was never used. Accepted transactions above it wait
+            # behind the gap, so fill it at once; otherwise free it for the next send.
+            if any(results[j].tx_hash is not None for j in range(i + 1, len(results))):
+                if await self._cancel_stuck_nonce(nonces[i]):
+                    continue
+            async with self.nonce_lock:
+                self._release_nonce(nonces[i])
+        
+        # Resend nonce failures last, so the resync cannot hand out a nonce released above twice
+        for i, error_message in nonce_errors:
+            self.logger.warning(f"Nonce error in batch for nonce {nonces[i]}: {error_message}")
+            results[i] = await self._resend_after_nonce_error(contract_funcs[i], lane)
+        
+        self.logger.debug(
+            f"Batch sent {len(batch)} transactions, {sum(r.ok for r in results)}/{len(results)} accepted"
+        )
+        return results
+
+    async def _release_batch_nonces(self, nonces: List[int], batch: List[Tuple[int, SignedTransaction]]):
+        """Free the nonces of a batch whose submission failed as a whole."""
+        async with self.nonce_lock:
+            for i, _ in batch:
+                self._release_nonce(nonces[i])
+    
+    async def _resend_after_nonce_error(
+        self, contract_func: "TypedContractFunction[Any]", lane: TxLane
+    ) -> BatchSendResult:
+        """Resync nonces and resend one transaction of a send_many batch on its own."""
+        try:
+            await self._resync_nonces()
+            signed, tx_params = await self._build_and_sign(contract_func, lane)
+            tx_hash = await self.web3.eth.send_raw_transaction(signed.raw_transaction)
+            self.logger.info(f"Resent transaction successfully: {tx_hash.hex()}")
+            return BatchSendResult(tx_params["nonce"], tx_hash.to_0x_hex())
+        except Exception as e:
+            self.logger.error(f"Failed to resend transaction from batch: {e}")
+            return BatchSendResult(None, error=e)
+
+    async def send_wait(self, contract_func: "TypedContractFunction[Any]", lane: TxLane = TxLane.NEW) -> Any:
         """
         Send transaction and wait for receipt.
         Uses realtime endpoint if available, falls back to regular send + wait.
         """
         # Sign transaction (includes nonce increment)
-        signed = await self._sign_transaction(contract_func)
+        signed, tx_params = await self._build_and_sign(contract_func, lane)
         
         try:
-            receipt = await self._send_realtime(signed.raw_transaction)
+            with stage_timer(self.metrics, "realtime_receipt"):
+                receipt = await self._send_realtime(signed.raw_transaction)
             self.logger.debug(f"Realtime transaction completed: {signed.hash.hex()}")
             receipt = normalize_receipt(receipt)
         except Exception as realtime_error:
             self.logger.debug(f"Realtime transaction failed: {realtime_error}")
             raise
+        
+        # A receipt means this nonce (and every one below it) is mined, reverted or not
+        self.confirm_nonce(tx_params["nonce"] + 1)
+        
+        if self.gas_cache is not None:
+            self.gas_cache.record_receipt(tx_params["to"], tx_params["data"], receipt)
+        self._notify_receipt(receipt)
 
         # Parse and return event if specified, else return receipt
-        return parse_event_from_receipt(receipt, contract_func)
+        with stage_timer(self.metrics, "event_parse"):
+            return parse_event_from_receipt(receipt, contract_func)
 
     async def wait_for_receipt(self, tx_hash: HexBytes, timeout: int = 10) -> TxReceipt:
         """Wait for transaction receipt by hash."""
@@ -603,29 +1341,75 @@ class BoundedNonceTxScheduler:
             receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
             self.logger.debug(f"Received receipt for transaction: {tx_hash.hex()}")
             receipt = normalize_receipt(receipt)
-            return receipt
         except Exception as e:
             self.logger.error(f"Failed to get receipt for transaction {tx_hash.hex()}: {e}")
             raise
+        self._notify_receipt(receipt)
+        return receipt
+
+    async def get_receipts(self, tx_hashes: List[str]) -> List[TxReceipt | None]:
+        """
+        Look up the receipts of many transactions in one JSON-RPC batch, without waiting.
+
+        Receipts found are passed to the receipt listeners, like wait_for_receipt does.
+
+        Args:
+            tx_hashes: Transaction hashes to look up
+
+        Returns:
+            One receipt per hash, in the same order; None while a transaction is not mined yet
+            or its lookup failed
+        """
+        if not tx_hashes:
+            return []
+        responses = await self.web3.provider.make_batch_request([
+            (RPCEndpoint("eth_getTransactionReceipt"), [tx_hash]) for tx_hash in tx_hashes
+        ])
+        if not isinstance(responses, list) or len(responses) != len(tx_hashes):
+            raise Exception(f"Receipt batch failed: {responses}")
+
+        receipts: List[TxReceipt | None] = []
+        for tx_hash, response in zip(tx_hashes, responses):
+            if response.get("error") is not None:
+                self.logger.debug(f"Receipt of {tx_hash} unavailable: {response['error']}")
+                receipts.append(None)
+                continue
+            if not response.get("result"):
+                receipts.append(None)
+                continue
+            receipt = normalize_receipt(response["result"])
+            self._notify_receipt(receipt)
+            receipts.append(receipt)
+        return receipts
 
     async def _monitor_stuck_nonces(self):
         """
-        Background task to monitor and cancel stuck nonces.
-        Runs every _monitor_interval seconds.
+        Background task to monitor and replace or cancel stuck nonces.
+        Runs every _monitor_interval seconds, or every fee ladder step if that is shorter.
         """
         stuck_nonce_timestamps: dict[int, float] = {}
+        interval = self._monitor_interval
+        if self.replacement is not None:
+            interval = min(interval, self.replacement.ladder.interval)
         
         while True:
             try:
-                await asyncio.sleep(self._monitor_interval)
+                await asyncio.sleep(interval)
+                
+                # Nothing in flight: nothing can be stuck, so skip the RPC calls
+                if self.last_sent <= self.last_confirmed:
+                    stuck_nonce_timestamps.clear()
+                    continue
                 
                 # Get current nonce states
                 latest_nonce = await self.web3.eth.get_transaction_count(self.from_address, "latest")
                 pending_nonce = await self.web3.eth.get_transaction_count(self.from_address, "pending")
+                self.confirm_nonce(latest_nonce)
                 
                 # If pending_nonce < last_sent, we have a gap
                 # This means the network is waiting for a nonce we think we sent
-                if pending_nonce < self.last_sent:
+                # Reserved nonces are held by an external relayer and are not stuck
+                if pending_nonce < self.last_sent and pending_nonce not in self._reserved_nonces:
                     # The stuck nonce is the pending_nonce (the one the network is waiting for)
                     stuck_nonce = pending_nonce
                     current_time = time.time()
@@ -634,6 +1418,12 @@ class BoundedNonceTxScheduler:
                         stuck_nonce_timestamps[stuck_nonce] = current_time
                         self.logger.info(f"Possible stuck nonce {stuck_nonce} (latest: {latest_nonce}, last_sent: {self.last_sent})")
                     
+                    elif self.replacement is not None:
+                        stuck_for = current_time - stuck_nonce_timestamps[stuck_nonce]
+                        if await self._replace_stuck_nonce(stuck_nonce, stuck_for):
+                            # The nonce now holds a cancel, which climbs the ladder from the start
+                            stuck_nonce_timestamps[stuck_nonce] = current_time
+                    
                     elif current_time - stuck_nonce_timestamps[stuck_nonce] > self._stuck_nonce_threshold:
                         # Nonce stuck too long - submit cancel transaction
                         await self._cancel_stuck_nonce(stuck_nonce)
@@ -647,15 +1437,72 @@ class BoundedNonceTxScheduler:
             except Exception as e:
                 self.logger.error(f"Error in stuck nonce monitoring: {e}")
 
-    async def _cancel_stuck_nonce(self, stuck_nonce: int):
+    async def _replace_stuck_nonce(self, stuck_nonce: int, stuck_for: float) -> bool:
+        """
+        Apply the replacement engine's plan to a stuck nonce.
+
+        Args:
+            stuck_nonce: Nonce the network is waiting for
+            stuck_for: Seconds since the nonce was first seen stuck
+
+        Returns:
+            True if the nonce was cancelled
+        """
+        engine = cast(ReplacementEngine, self.replacement)
+        inflight = self._inflight.get(stuck_nonce)
+        action = engine.plan(inflight, stuck_for)
+        if action is None:
+            return False
+        if action is ReplacementAction.CANCEL or inflight is None:
+            await self._cancel_stuck_nonce(stuck_nonce)
+            return True
+        
+        step = int(stuck_for // engine.ladder.interval)
+        try:
+            if action is ReplacementAction.REBROADCAST:
+                await self.web3.eth.send_raw_transaction(inflight.raw_tx)
+                self.logger.info(f"Rebroadcast stuck {inflight.intent} transaction at nonce {stuck_nonce}")
+            else:
+                max_fee, priority_fee = engine.escalated_fees(inflight, step)
+                tx_params = cast(
+                    TransactionDictType,
+                    {**inflight.tx_params, "maxFeePerGas": max_fee, "maxPriorityFeePerGas": priority_fee},
+                )
+                signed = await self._sign_tx_params(tx_params)
+                self._journal_signed(stuck_nonce, signed, inflight.intent)
+                await self.web3.eth.send_raw_transaction(signed.raw_transaction)
+                inflight.raw_tx = bytes(signed.raw_transaction)
+                inflight.fees = (max_fee, priority_fee)
+                self.logger.info(
+                    f"Re-signed stuck {inflight.intent} transaction at nonce {stuck_nonce} "
+                    f"with maxFeePerGas={max_fee}, maxPriorityFeePerGas={priority_fee}"
+                )
+        except Exception as e:
+            # Typically "already known" or the nonce landed meanwhile; the next check decides
+            self.logger.warning(f"Failed to replace stuck nonce {stuck_nonce}: {e}")
+        inflight.step = step
+        return False
+
+    async def _cancel_stuck_nonce(self, stuck_nonce: int) -> bool:
         """
         Submit a cancel transaction for a stuck nonce.
         Sends 0 ETH to self with higher gas price.
+
+        Returns:
+            True if the cancel was accepted by the node
         """
         try:
             # Get current gas price info
             block = await self.web3.eth.get_block("latest")
             base_fee = block.get("baseFeePerGas", 10_000_000_000)
+            max_fee, priority_fee = int(base_fee * 2), 0
+            
+            inflight = self._inflight.get(stuck_nonce)
+            if inflight is not None:
+                # A replacement must outbid the version in the pool by at least 10%
+                last_fee, last_priority = inflight.current_fees
+                priority_fee = max((last_priority * 11 + 9) // 10, last_priority + 1)
+                max_fee = max(max_fee, (last_fee * 11 + 9) // 10, last_fee + 1, priority_fee)
             
             # Cancel transaction: send 0 ETH to self with higher fees
             cancel_tx: TransactionDictType = {
@@ -665,19 +1512,23 @@ class BoundedNonceTxScheduler:
                 "nonce": Nonce(stuck_nonce),
                 "value": 0,
                 "gas": 21000,
-                "maxFeePerGas": int(base_fee * 2),
-                "maxPriorityFeePerGas": 0,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": priority_fee,
                 "data": b"",
             }
             
             # Sign and send cancel transaction
-            signed_cancel = self.account.sign_transaction(cancel_tx)
+            signed_cancel = await self._sign_tx_params(cancel_tx)
+            self._journal_signed(stuck_nonce, signed_cancel, "nonce_cancel")
+            self._track_inflight(stuck_nonce, cancel_tx, signed_cancel, "nonce_cancel")
             tx_hash = await self.web3.eth.send_raw_transaction(signed_cancel.raw_transaction)
             
             self.logger.info(f"Submitted cancel transaction for stuck nonce {stuck_nonce}: {tx_hash.hex()}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to cancel stuck nonce {stuck_nonce}: {e}")
+            return False
 
     async def _send_realtime(self, raw_tx: HexBytes) -> TxReceipt:
         """Send transaction using realtime endpoint."""
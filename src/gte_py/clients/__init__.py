@@ -29,6 +29,7 @@ class GTEClient:
         config: NetworkConfig,
         wallet_address: ChecksumAddress | None = None,
         wallet_private_key: PrivateKeyType | None = None,
+        track_confirmations: bool = False,
     ):
         """Initializes the GTE client and subcomponents.
 
@@ -36,6 +37,8 @@ class GTEClient:
             config: Network configuration for connecting to the network.
             wallet_address: Optional user wallet address.
             wallet_private_key: Optional wallet private key for signing transactions.
+            track_confirmations: Subscribe to new block heads on config.rpc_ws so transaction
+                confirmations free the nonce window without polling.
         """
         getcontext().prec = 40
         self.config = config
@@ -59,6 +62,7 @@ class GTEClient:
             account=self._account,
             gte_router_address=config.router_address,
             info=self.info,
+            rpc_ws=config.rpc_ws if track_confirmations else None,
         )
         
         self.connected = False
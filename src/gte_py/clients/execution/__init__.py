@@ -1,7 +1,9 @@
 """Order execution functionality for the GTE client."""
 
+import asyncio
 import logging
-from typing import Optional, Tuple, Any, List
+from concurrent.futures import Executor
+from typing import Optional, Tuple, Any, Callable, Iterable, List
 import time
 from decimal import Decimal
 
@@ -16,9 +18,22 @@ from gte_py.clients.info import InfoClient
 from gte_py.api.chain.chain_client import ChainClient
 from gte_py.api.chain.events import OrderAmendedEvent, OrderCanceledEvent, FillOrderProcessedEvent, LimitOrderProcessedEvent
 from gte_py.api.chain.structs import AmendArgs, OrderSide, Settlement, LimitOrderType, FillOrderType, OperatorRole, PostFillOrderArgs, PostLimitOrderArgs, CancelArgs
-from gte_py.api.chain.utils import TypedContractFunction, BoundedNonceTxScheduler
-from gte_py.models import Market, Order, OrderStatus, TimeInForce, Token
+from gte_py.api.chain.utils import TypedContractFunction, BoundedNonceTxScheduler, TxLane
+from gte_py.api.chain.gas import GasProfileCache
+from gte_py.api.chain.journal import TxJournal
+from gte_py.api.chain.metrics import PipelineMetrics, stage_timer
+from gte_py.api.chain.replacement import ReplacementEngine
+from gte_py.api.chain.simulation import TxSimulator
+from gte_py.models import Market, MarketType, Order, OrderBookSnapshot, OrderStatus, TimeInForce, Token
 from gte_py.api.chain.erc20 import Erc20
+from gte_py.api.chain import fast_encode
+from gte_py.clients.execution.amm import AmmQuoter
+from gte_py.clients.execution.bonding import LaunchpadQuoter
+from gte_py.clients.execution.discovery import OnChainOrder, OrderDiscovery
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.clients.execution.routing import PathFinder
+from gte_py.clients.execution.rules import MarketRules, MarketRulesCache
+from gte_py.clients.execution.tob import DepthSnapshot, TobCacheStats, TobSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +47,24 @@ class ExecutionClient:
             info: InfoClient,
             gte_router_address: ChecksumAddress,
             account: LocalAccount | None = None,
+            signing_executor: Executor | None = None,
+            reserve_built_nonces: bool = False,
+            gas_cache: GasProfileCache | None = None,
+            lane_reserves: dict[TxLane, float] | None = None,
+            rpc_ws: str | None = None,
+            journal: TxJournal | None = None,
+            replacement: ReplacementEngine | None = None,
+            metrics: PipelineMetrics | None = None,
+            fast_encoding: bool = False,
+            order_store: OrderStore | None = None,
+            tob_max_age: float | None = None,
+            tob_wait: float = 0.0,
+            enforce_market_rules: bool = False,
+            amm_quoter: AmmQuoter | None = None,
+            path_finder: PathFinder | None = None,
+            launchpad_quoter: LaunchpadQuoter | None = None,
+            simulator: TxSimulator | None = None,
+            trading_account: ChecksumAddress | None = None,
     ):
         """
         Initialize the execution client.
@@ -41,6 +74,46 @@ class ExecutionClient:
             info: InfoClient instance for market data
             gte_router_address: Address of the GTE router
             account: LocalAccount instance for signing transactions
+            signing_executor: Optional thread/process pool for signing transactions off the event loop
+            reserve_built_nonces: Reserve nonces locally for return_built_tx=True instead of
+                fetching them from the chain; settle them via scheduler.commit_nonce/release_nonce
+            gas_cache: Optional gas profile cache used for transactions without an explicit gas limit
+            lane_reserves: Share of the pending window reserved per scheduler lane, so cancels and
+                amends still go through when new orders have filled the window
+            rpc_ws: Optional WebSocket RPC endpoint; new block heads then advance the scheduler's
+                confirmed nonce instead of polling for it
+            journal: Optional transaction journal; in-flight transactions are rebroadcast or
+                cancelled on init() after a restart
+            replacement: Optional stuck-nonce replacement engine (rebroadcast or fee escalation
+                per intent) instead of cancelling stuck nonces after 30 seconds
+            metrics: Optional latency registry shared with the scheduler; approval checks are
+                timed here, the other pipeline stages in the scheduler
+            fast_encoding: Opt in to encoding limit, fill, cancel and amend calldata with the
+                precompiled encoders in fast_encode instead of web3's generic ABI path
+                (byte-identical output)
+            order_store: Optional local order store; it is fed every receipt the scheduler
+                obtains (send_wait, wait_for_receipt)
+            tob_max_age: Seconds after which a cached top of book is stale and market orders are
+                priced from Clob.get_tob() instead (and get_order_book reads the REST snapshot).
+                None (the default) never expires, since the feed only pushes on change and a quiet
+                book would otherwise go stale
+            tob_wait: Seconds to wait for a fresh WebSocket update when the cached top of book is
+                missing or stale, before falling back to RPC (0 to fall back immediately)
+            enforce_market_rules: Round limit and amend prices passively to the market's tick size
+                and reject orders below its minimum size before signing; keep the rules current
+                with poll_logs()
+            amm_quoter: Optional local UniswapV2 quoter; swaps and swap quotes then compute
+                amounts from its cached reserves instead of calling the router
+            path_finder: Optional multi-hop route search; swaps without an explicit path then
+                use its best 1-3 hop path instead of the direct pair
+            launchpad_quoter: Optional local bonding-curve model; launchpad trades and quotes of
+                tokens launched on its curve then price from it instead of calling the launchpad
+            simulator: Optional pre-trade simulator; every transaction the scheduler sends is
+                first run with eth_call against pending state, and one that would revert raises
+                SimulationRevertError before it takes a nonce
+            trading_account: Optional account this wallet trades for as an operator (approved
+                with approve_operator by that account). Orders, amends and cancels then go to the
+                CLOB directly for trading_account and settle against its exchange balance
         """
         self._web3 = web3
         self._account = account
@@ -49,9 +122,25 @@ class ExecutionClient:
         self._scheduler = BoundedNonceTxScheduler(
             web3=self._web3,
             account=self._account,
+            signing_executor=signing_executor,
+            reserve_built_nonces=reserve_built_nonces,
+            gas_cache=gas_cache,
+            lane_reserves=lane_reserves,
+            rpc_ws=rpc_ws,
+            journal=journal,
+            replacement=replacement,
+            metrics=metrics,
+            simulator=simulator,
         )
+        self._metrics = metrics
+        self._fast_encoding = fast_encoding
+        self._trading_account = trading_account
         self._info = info
         
+        self._order_store = order_store
+        if order_store is not None:
+            self._scheduler.add_receipt_listener(order_store.on_receipt)
+        
         # Cache for approved clob tokens
         self._approved_spot_tokens: set[ChecksumAddress] = set()
         
@@ -62,7 +151,24 @@ class ExecutionClient:
         self._approved_launchpad_tokens: set[ChecksumAddress] = set()
         
         # TOB cache for market order optimization
-        self._tob_cache: dict[ChecksumAddress, tuple[Decimal, Decimal]] = {}  # market -> (bid, ask)
+        self._tob_cache: dict[ChecksumAddress, TobSnapshot] = {}
+        self._tob_subscriptions: set[ChecksumAddress] = set()
+        # Set on every update of a market, replaced by the next waiter
+        self._tob_updated: dict[ChecksumAddress, asyncio.Event] = {}
+        self._tob_max_age = tob_max_age
+        self._tob_wait = tob_wait
+        self._tob_stats = TobCacheStats()
+        
+        # Book levels per (market, depth) for get_order_book, None until the first update
+        self._book_cache: dict[tuple[ChecksumAddress, int], DepthSnapshot | None] = {}
+        
+        # Tick size and minimum order size per CLOB
+        self._market_rules = MarketRulesCache()
+        self._enforce_market_rules = enforce_market_rules
+        
+        self._amm_quoter = amm_quoter
+        self._path_finder = path_finder
+        self._launchpad_quoter = launchpad_quoter
         
         # Maximum approval amount (2^256 - 1)
         self._max_approval = 2**256 - 1
@@ -74,6 +180,113 @@ class ExecutionClient:
             raise ValueError("No wallet address set")
         return self._wallet_address
 
+    @property
+    def trading_account(self) -> ChecksumAddress:
+        """Get the account orders are placed for: the configured trading account, or the wallet."""
+        return self._trading_account or self.wallet_address
+
+    @property
+    def metrics(self) -> PipelineMetrics | None:
+        """Get the latency registry, if one was configured."""
+        return self._metrics
+
+    @property
+    def orders(self) -> OrderStore | None:
+        """Get the local order store, if one was configured."""
+        return self._order_store
+
+    @property
+    def tob_stats(self) -> TobCacheStats:
+        """Get the hit, miss, stale and RPC fallback counters of the top-of-book cache."""
+        return self._tob_stats
+
+    @property
+    def market_rules(self) -> MarketRulesCache:
+        """Get the per-market trading rules cache."""
+        return self._market_rules
+
+    @property
+    def enforce_market_rules(self) -> bool:
+        """Whether limit and amend prices are quantized and validated against the market rules."""
+        return self._enforce_market_rules
+
+    async def get_market_rules(self, market: Market) -> MarketRules:
+        """Get the tick size and minimum order size of a CLOB market (one RPC per market)."""
+        return await self._market_rules.get(self._chain_client.get_clob(market.address))
+
+    async def poll_logs(
+        self, market_addresses: Iterable[ChecksumAddress] = (), to_block: int | None = None
+    ) -> int:
+        """
+        Apply chain logs since the last poll: rule updates (tick size, minimum size) of every
+        market whose rules are loaded and, with an order store, order events of market_addresses.
+
+        Catches changes made by other accounts' transactions, which never appear in our own
+        receipts. Meant for a background task, not the trading path.
+
+        Args:
+            market_addresses: Markets whose order events are applied to the order store
+            to_block: Last block to read (the latest block by default)
+
+        Returns:
+            Number of logs fetched
+        """
+        if to_block is None:
+            to_block = await self._web3.eth.block_number
+        count = await self._market_rules.poll_logs(self._web3, to_block)
+        market_addresses = list(market_addresses)
+        if self._order_store is not None and market_addresses:
+            count += await self._order_store.poll_logs(self._web3, market_addresses, to_block)
+        return count
+
+    @property
+    def amm_quoter(self) -> AmmQuoter | None:
+        """Get the local UniswapV2 quoter, if one was configured."""
+        return self._amm_quoter
+
+    @property
+    def launchpad_quoter(self) -> LaunchpadQuoter | None:
+        """Get the local bonding-curve quoter, if one was configured."""
+        return self._launchpad_quoter
+
+    @property
+    def path_finder(self) -> PathFinder | None:
+        """Get the multi-hop route search, if one was configured."""
+        return self._path_finder
+
+    async def _route_out(self, token_in: Token, token_out: Token, amount_in: int,
+                         path: list[ChecksumAddress] | None) -> tuple[list[ChecksumAddress], list[int]]:
+        """Path and amounts for an exact input: the given path, the best route, or the direct pair."""
+        if path is None and self._path_finder is not None:
+            route = await self._path_finder.best_route_out(amount_in, token_in.address, token_out.address)
+            return route.path, route.amounts
+        path = path or [token_in.address, token_out.address]
+        return path, await self._get_amounts_out(amount_in, path)
+
+    async def _route_in(self, token_in: Token, token_out: Token, amount_out: int,
+                        path: list[ChecksumAddress] | None) -> tuple[list[ChecksumAddress], list[int]]:
+        """Path and amounts for an exact output: the given path, the best route, or the direct pair."""
+        if path is None and self._path_finder is not None:
+            route = await self._path_finder.best_route_in(amount_out, token_in.address, token_out.address)
+            return route.path, route.amounts
+        path = path or [token_in.address, token_out.address]
+        return path, await self._get_amounts_in(amount_out, path)
+
+    async def _get_amounts_out(self, amount_in: int, path: list[ChecksumAddress]) -> list[int]:
+        if self._amm_quoter is not None:
+            return await self._amm_quoter.get_amounts_out(amount_in, path)
+        return await self._chain_client.univ2_router.get_amounts_out(amount_in, path)
+
+    async def _get_amounts_in(self, amount_out: int, path: list[ChecksumAddress]) -> list[int]:
+        if self._amm_quoter is not None:
+            return await self._amm_quoter.get_amounts_in(amount_out, path)
+        return await self._chain_client.univ2_router.get_amounts_in(amount_out, path)
+
+    @property
+    def scheduler(self) -> BoundedNonceTxScheduler:
+        """Get the transaction scheduler used to sign and send transactions."""
+        return self._scheduler
+
     async def init(self):
         """Initialize the chain client."""
         await self._chain_client.init()
@@ -82,18 +295,25 @@ class ExecutionClient:
     async def close(self):
         """Clean up resources and unsubscribe from all WebSocket subscriptions."""
         # Unsubscribe from all TOB subscriptions
-        for market_address in list(self._tob_cache.keys()):
+        for market_address in list(self._tob_subscriptions):
             try:
                 await self._info.unsubscribe_orderbook(market_address, limit=1)
                 logger.debug(f"Unsubscribed from TOB updates for {market_address}")
             except Exception as e:
                 logger.warning(f"Error unsubscribing from {market_address}: {e}")
+        for market_address, depth in list(self._book_cache):
+            try:
+                await self._info.unsubscribe_orderbook(market_address, limit=depth)
+            except Exception as e:
+                logger.warning(f"Error unsubscribing from {market_address}: {e}")
         
         # Stop the transaction scheduler
         await self._scheduler.stop()
         
         # Clear caches
+        self._tob_subscriptions.clear()
         self._tob_cache.clear()
+        self._book_cache.clear()
         
         logger.info("ExecutionClient cleanup completed")
 
@@ -140,6 +360,30 @@ class ExecutionClient:
         # Cache the token as approved
         self._approved_spot_tokens.add(token_address)
 
+    async def _ensure_order_approval(self, token: Erc20, **kwargs):
+        """Approve the token an order spends, unless orders are placed for a trading account."""
+        if self._trading_account is not None:
+            # Operator orders settle against the trading account's exchange balance
+            return
+        with stage_timer(self._metrics, "approval_check"):
+            await self._ensure_spot_approval(token=token, **kwargs)
+
+    async def ensure_spot_approval(self, market: Market, side: OrderSide, **kwargs):
+        """
+        Approve the token an order side spends on a CLOB market, once per token.
+
+        Buys spend the quote token and sells the base token. Callers that build order
+        transactions themselves (place_limit_order_tx, amend_order_tx) call this first. Nothing
+        is approved with a trading_account, whose exchange balance operator orders settle against.
+
+        Args:
+            market: Market the orders are placed on
+            side: Order side
+            **kwargs: Additional transaction parameters for the approval
+        """
+        token = market.quote if side == OrderSide.BUY else market.base
+        await self._ensure_order_approval(self._chain_client.get_erc20(token.address), **kwargs)
+
     async def _ensure_swap_approval(
         self,
         token: Erc20,
@@ -167,8 +411,118 @@ class ExecutionClient:
         # Cache the token as approved for swaps
         self._approved_swap_tokens.add(token_address)
 
+    async def ensure_swap_approval(self, token_in: Token, **kwargs):
+        """
+        Approve a swap input token for the UniswapV2 router, once per token.
+
+        WETH needs no approval, since ETH swaps send the value with the transaction. Callers that
+        build swap transactions themselves (swap_tokens_tx, swap_tokens_for_exact_output_tx)
+        call this first.
+
+        Args:
+            token_in: Token the swaps spend
+            **kwargs: Additional transaction parameters for the approval
+        """
+        if token_in.address == self._chain_client.weth_address:
+            return
+        with stage_timer(self._metrics, "approval_check"):
+            await self._ensure_swap_approval(token=self._chain_client.get_erc20(token_in.address), **kwargs)
+
+    async def prewarm(
+        self,
+        markets: list[Market] | None = None,
+        approve_missing: bool = False,
+        **kwargs,
+    ) -> list[tuple[ChecksumAddress, ChecksumAddress]]:
+        """
+        Fill the approval caches before trading, so first orders skip the allowance round trip.
+
+        CLOB spot markets need both tokens approved for the CLOB manager, AMM markets for the
+        UniswapV2 router (except WETH) and launchpad markets for the launchpad. All allowances
+        are checked concurrently; missing approvals can be sent as one batch.
+
+        Args:
+            markets: Markets to prepare (default: every market from InfoClient.get_markets)
+            approve_missing: Send the missing approvals in one JSON-RPC batch
+            **kwargs: Additional transaction parameters for the approvals
+
+        Returns:
+            (token, spender) pairs that are still not approved
+        """
+        if markets is None:
+            markets = await self._info.get_markets(limit=1000)
+        
+        caches: dict[ChecksumAddress, set[ChecksumAddress]] = {
+            self._chain_client.clob_manager_address: self._approved_spot_tokens,
+            self._chain_client.univ2_router_address: self._approved_swap_tokens,
+            self._chain_client.launchpad_address: self._approved_launchpad_tokens,
+        }
+        spenders = {
+            MarketType.CLOB_SPOT: self._chain_client.clob_manager_address,
+            MarketType.AMM: self._chain_client.univ2_router_address,
+            MarketType.LAUNCHPAD: self._chain_client.launchpad_address,
+        }
+        
+        to_check: set[tuple[ChecksumAddress, ChecksumAddress]] = set()
+        for market in markets:
+            spender = spenders.get(market.market_type)
+            if spender is None:
+                continue
+            for token in (market.base, market.quote):
+                if spender == self._chain_client.univ2_router_address and token.address == self._chain_client.weth_address:
+                    # ETH swaps need no approval
+                    continue
+                if token.address not in caches[spender]:
+                    to_check.add((token.address, spender))
+        
+        pairs = sorted(to_check)
+        allowances = await asyncio.gather(
+            *(
+                self._chain_client.get_erc20(token).allowance(owner=self.wallet_address, spender=spender)
+                for token, spender in pairs
+            ),
+            return_exceptions=True,
+        )
+        
+        missing: list[tuple[ChecksumAddress, ChecksumAddress]] = []
+        for (token, spender), allowance in zip(pairs, allowances):
+            if isinstance(allowance, BaseException):
+                logger.warning(f"Allowance check for {token} -> {spender} failed: {allowance}")
+                missing.append((token, spender))
+            elif allowance >= self._max_approval // 2:
+                caches[spender].add(token)
+            else:
+                missing.append((token, spender))
+        logger.info(f"Prewarmed {len(pairs) - len(missing)}/{len(pairs)} approvals")
+        
+        if not approve_missing or not missing:
+            return missing
+        
+        results = await self._scheduler.send_many([
+            self._chain_client.get_erc20(token).approve(spender=spender, value=self._max_approval, **kwargs)
+            for token, spender in missing
+        ])
+        still_missing: list[tuple[ChecksumAddress, ChecksumAddress]] = []
+        for (token, spender), result in zip(missing, results):
+            if result.ok:
+                caches[spender].add(token)
+            else:
+                logger.warning(f"Approval of {token} for {spender} failed: {result.error}")
+                still_missing.append((token, spender))
+        return still_missing
+
     # ================= LAUNCHPAD OPERATIONS =================
     
+    async def _launchpad_quote_base_for_quote(self, token: ChecksumAddress, quote_amount: int, is_buy: bool) -> int:
+        if self._launchpad_quoter is not None and await self._launchpad_quoter.supports(token):
+            return await self._launchpad_quoter.quote_base_for_quote(token, quote_amount, is_buy)
+        return await self._chain_client.launchpad.quote_base_for_quote(token=token, quote_amount=quote_amount, is_buy=is_buy)
+
+    async def _launchpad_quote_quote_for_base(self, token: ChecksumAddress, base_amount: int, is_buy: bool) -> int:
+        if self._launchpad_quoter is not None and await self._launchpad_quoter.supports(token):
+            return await self._launchpad_quoter.quote_quote_for_base(token, base_amount, is_buy)
+        return await self._chain_client.launchpad.quote_quote_for_base(token=token, base_amount=base_amount, is_buy=is_buy)
+
     async def _ensure_launchpad_approval(
         self,
         token: Erc20,
@@ -229,7 +583,7 @@ class ExecutionClient:
         quote_amount_atomic = quote_token.convert_quantity_to_amount(quote_amount_in)
         
         # Get quote for how much base we'll receive
-        expected_base_out = await self._chain_client.launchpad.quote_base_for_quote(
+        expected_base_out = await self._launchpad_quote_base_for_quote(
             token=launch_token.address,
             quote_amount=quote_amount_atomic,
             is_buy=True
@@ -240,10 +594,11 @@ class ExecutionClient:
         
         # Ensure approval for quote token
         quote_token_contract = self._chain_client.get_erc20(quote_token.address)
-        await self._ensure_launchpad_approval(
-            token=quote_token_contract,
-            **kwargs,
-        )
+        with stage_timer(self._metrics, "approval_check"):
+            await self._ensure_launchpad_approval(
+                token=quote_token_contract,
+                **kwargs,
+            )
         
         logger.info(f"Buying {launch_token.symbol} with exactly {quote_amount_in} {quote_token.symbol}")
 
@@ -286,7 +641,7 @@ class ExecutionClient:
         base_amount_atomic = launch_token.convert_quantity_to_amount(base_amount_in)
         
         # Get quote for how much quote we'll receive
-        expected_quote_out = await self._chain_client.launchpad.quote_quote_for_base(
+        expected_quote_out = await self._launchpad_quote_quote_for_base(
             token=launch_token.address,
             base_amount=base_amount_atomic,
             is_buy=False
@@ -297,10 +652,11 @@ class ExecutionClient:
         
         # Ensure approval for launch token
         launch_token_contract = self._chain_client.get_erc20(launch_token.address)
-        await self._ensure_launchpad_approval(
-            token=launch_token_contract,
-            **kwargs,
-        )
+        with stage_timer(self._metrics, "approval_check"):
+            await self._ensure_launchpad_approval(
+                token=launch_token_contract,
+                **kwargs,
+            )
         
         logger.info(f"Selling exactly {base_amount_in} {launch_token.symbol} for {quote_token.symbol}")
 
@@ -337,7 +693,7 @@ class ExecutionClient:
         quote_amount_atomic = quote_token.convert_quantity_to_amount(quote_amount)
         
         # Get quote from launchpad
-        base_amount_atomic = await self._chain_client.launchpad.quote_base_for_quote(
+        base_amount_atomic = await self._launchpad_quote_base_for_quote(
             token=launch_token.address,
             quote_amount=quote_amount_atomic,
             is_buy=True
@@ -371,7 +727,7 @@ class ExecutionClient:
         base_amount_atomic = launch_token.convert_quantity_to_amount(base_amount)
         
         # Get quote from launchpad
-        quote_amount_atomic = await self._chain_client.launchpad.quote_quote_for_base(
+        quote_amount_atomic = await self._launchpad_quote_quote_for_base(
             token=launch_token.address,
             base_amount=base_amount_atomic,
             is_buy=False
@@ -395,7 +751,7 @@ class ExecutionClient:
 
     # ================= TOKEN SWAP OPERATIONS =================
     
-    def _get_swap_function(
+    def swap_tokens_tx(
         self,
         token_in: Token,
         token_out: Token,
@@ -407,6 +763,7 @@ class ExecutionClient:
     ) -> TypedContractFunction[Any]:
         """
         Get the appropriate swap function based on whether WETH is involved.
+        The input token must already be approved (ensure_swap_approval).
         
         Args:
             token_in: Input token
@@ -462,6 +819,7 @@ class ExecutionClient:
         slippage_tolerance: float = 0.01,
         deadline_seconds: int = 1200,
         return_built_tx: bool = False,
+        path: list[ChecksumAddress] | None = None,
         **kwargs: Unpack[TxParams],
     ):
         """
@@ -473,6 +831,8 @@ class ExecutionClient:
             amount_in: Amount to swap (in decimal units, e.g., Decimal('1.5'))
             slippage_tolerance: Slippage tolerance (0.01 = 1%)
             deadline_seconds: Seconds from now until transaction deadline
+            path: Swap path from token_in to token_out; defaults to the path finder's best
+                route, or the direct pair without a path finder
             **kwargs: Additional transaction parameters
              
         Returns:
@@ -481,11 +841,8 @@ class ExecutionClient:
         # Convert decimal amount to atomic units
         amount_in_atomic = token_in.convert_quantity_to_amount(amount_in)
         
-        # Create swap path
-        path = [token_in.address, token_out.address]
-        
-        # Get expected output amount
-        amounts_out = await self._chain_client.univ2_router.get_amounts_out(amount_in_atomic, path)
+        # Pick the swap path and get the expected output amount
+        path, amounts_out = await self._route_out(token_in, token_out, amount_in_atomic, path)
         expected_out = amounts_out[-1]  # Output amount is the last element
         
         # Calculate minimum output with slippage
@@ -495,17 +852,12 @@ class ExecutionClient:
         deadline = int(time.time()) + deadline_seconds
         
         # Only approve if input token is not ETH/WETH (for ETH swaps, no approval needed)
-        if token_in.address != self._chain_client.weth_address:
-            token_in_contract = self._chain_client.get_erc20(token_in.address)
-            await self._ensure_swap_approval(
-                token=token_in_contract,
-                **kwargs,
-            )
+        await self.ensure_swap_approval(token_in, **kwargs)
         
         logger.info(f"Swapping {amount_in} {token_in.symbol} for {token_out.symbol}")
 
         # Get the appropriate swap function
-        swap_tx = self._get_swap_function(
+        swap_tx = self.swap_tokens_tx(
             token_in=token_in,
             token_out=token_out,
             amount_in_atomic=amount_in_atomic,
@@ -519,7 +871,7 @@ class ExecutionClient:
             return await self._scheduler.return_transaction_data(swap_tx)
         return await self._scheduler.send(swap_tx)
 
-    def _get_swap_for_exact_function(
+    def swap_tokens_for_exact_output_tx(
         self,
         token_in: Token,
         token_out: Token,
@@ -531,6 +883,7 @@ class ExecutionClient:
     ) -> TypedContractFunction[Any]:
         """
         Get the appropriate swap function for exact output based on whether WETH is involved.
+        The input token must already be approved (ensure_swap_approval).
         
         Args:
             token_in: Input token
@@ -586,6 +939,7 @@ class ExecutionClient:
         slippage_tolerance: float = 0.01,
         deadline_seconds: int = 1200,
         return_built_tx: bool = False,
+        path: list[ChecksumAddress] | None = None,
         **kwargs: Unpack[TxParams],
     ):
         """
@@ -597,6 +951,8 @@ class ExecutionClient:
             amount_out: Exact amount to receive (in decimal units)
             slippage_tolerance: Slippage tolerance (0.01 = 1%)
             deadline_seconds: Seconds from now until transaction deadline
+            path: Swap path from token_in to token_out; defaults to the path finder's best
+                route, or the direct pair without a path finder
             **kwargs: Additional transaction parameters
             
         Returns:
@@ -605,11 +961,8 @@ class ExecutionClient:
         # Convert decimal amount to atomic units
         amount_out_atomic = token_out.convert_quantity_to_amount(amount_out)
         
-        # Create swap path
-        path = [token_in.address, token_out.address]
-        
-        # Get required input amount
-        amounts_in = await self._chain_client.univ2_router.get_amounts_in(amount_out_atomic, path)
+        # Pick the swap path and get the required input amount
+        path, amounts_in = await self._route_in(token_in, token_out, amount_out_atomic, path)
         expected_in = amounts_in[0]  # Input amount is the first element
         
         # Calculate maximum input with slippage
@@ -619,17 +972,12 @@ class ExecutionClient:
         deadline = int(time.time()) + deadline_seconds
         
         # Only approve if input token is not ETH/WETH (for ETH swaps, no approval needed)
-        if token_in.address != self._chain_client.weth_address:
-            token_in_contract = self._chain_client.get_erc20(token_in.address)
-            await self._ensure_swap_approval(
-                token=token_in_contract,
-                **kwargs,
-            )
+        await self.ensure_swap_approval(token_in, **kwargs)
         
         logger.info(f"Swapping {token_in.symbol} for exactly {amount_out} {token_out.symbol}")
 
         # Get the appropriate swap function
-        swap_tx = self._get_swap_for_exact_function(
+        swap_tx = self.swap_tokens_for_exact_output_tx(
             token_in=token_in,
             token_out=token_out,
             amount_out_atomic=amount_out_atomic,
@@ -648,6 +996,7 @@ class ExecutionClient:
         token_in: Token,
         token_out: Token,
         amount_in: Decimal,
+        path: list[ChecksumAddress] | None = None,
     ) -> tuple[Decimal, Decimal]:
         """
         Get a quote for swapping tokens.
@@ -656,6 +1005,7 @@ class ExecutionClient:
             token_in: Input token object with decimals
             token_out: Output token object with decimals
             amount_in: Amount to swap (in decimal units)
+            path: Swap path; defaults to the path finder's best route, or the direct pair
             
         Returns:
             Tuple of (expected_output_amount, effective_price)
@@ -663,12 +1013,9 @@ class ExecutionClient:
         # Convert decimal amount to atomic units
         amount_in_atomic = token_in.convert_quantity_to_amount(amount_in)
         
-        # Create swap path
-        path = [token_in.address, token_out.address]
-        
         # Get expected output amount
-        amounts_out = await self._chain_client.univ2_router.get_amounts_out(amount_in_atomic, path)
-        expected_out_atomic = amounts_out[1]
+        _, amounts_out = await self._route_out(token_in, token_out, amount_in_atomic, path)
+        expected_out_atomic = amounts_out[-1]
         
         # Convert back to decimal units
         expected_out = token_out.convert_amount_to_quantity(expected_out_atomic)
@@ -698,7 +1045,8 @@ class ExecutionClient:
         token = self._chain_client.get_erc20(token_address)
         
         # time the approval
-        await self._ensure_spot_approval(token, **kwargs)
+        with stage_timer(self._metrics, "approval_check"):
+            await self._ensure_spot_approval(token, **kwargs)
 
         tx = self._chain_client.clob_manager.deposit(
             account=self.wallet_address,
@@ -793,13 +1141,29 @@ class ExecutionClient:
 
     # ================= APPROVE OPERATIONS =================
 
-    def _encode_rules(self, roles: list[OperatorRole]) -> int:
+    @staticmethod
+    def encode_operator_roles(roles: list[OperatorRole]) -> int:
         """Encode operator roles into an integer."""
         roles_int = 0
         for role in roles:
             roles_int |= role.value
         return roles_int
 
+    async def get_operator_roles(self, operator_address: ChecksumAddress, account: ChecksumAddress | None = None) -> int:
+        """
+        Get the roles an operator holds for an account, encoded as in encode_operator_roles.
+
+        Args:
+            operator_address: Address of the operator
+            account: Account the operator acts for (defaults to the wallet)
+
+        Returns:
+            Bitmask of the granted OperatorRole values
+        """
+        return await self._chain_client.clob_manager.get_operator_role_approvals(
+            account or self.wallet_address, operator_address
+        )
+
     async def approve_operator(self, operator_address: ChecksumAddress,
                                roles: list[OperatorRole] = [],
                                unsafe_withdraw: bool = False,
@@ -824,7 +1188,7 @@ class ExecutionClient:
         if OperatorRole.LAUNCHPAD_FILL in roles and not unsafe_launchpad_fill:
             raise ValueError("Unsafe launchpad fill must be enabled to approve launchpad fill role")
         
-        roles_int = self._encode_rules(roles)
+        roles_int = self.encode_operator_roles(roles)
         logger.info(f"Approving operator {operator_address} for account {self.wallet_address} with roles {roles}")
 
         tx = self._chain_client.clob_manager.approve_operator(
@@ -850,7 +1214,7 @@ class ExecutionClient:
         Returns:
             Transaction hash from the disapprove_operator operation
         """
-        roles_int = self._encode_rules(roles)
+        roles_int = self.encode_operator_roles(roles)
         logger.info(f"Disapproving operator {operator_address} for account {self.wallet_address} with roles {roles}")
 
         return await self._scheduler.send(self._chain_client.clob_manager.disapprove_operator(
@@ -918,10 +1282,15 @@ class ExecutionClient:
                 side.value,
                 True,  # amountIsBase - since amount is in base tokens
                 fill_order_type.value,
-                settlement.value,
+                Settlement.ACCOUNT.value if self._trading_account else settlement.value,
             )
 
+            if self._trading_account is not None:
+                clob = self._chain_client.get_clob(market_address)
+                return clob.post_fill_order(account=self._trading_account, args=args, **kwargs)
             # Return the router transaction
+            if self._fast_encoding:
+                return fast_encode.clob_post_fill_order(self._chain_client.router, clob=market_address, args=args, **kwargs)
             return self._chain_client.router.clob_post_fill_order(clob=market_address, args=args, **kwargs)
         else:
             if time_in_force == TimeInForce.GTC:
@@ -939,10 +1308,15 @@ class ExecutionClient:
                 side.value,
                 client_order_id,
                 tif.value,
-                settlement.value,
+                Settlement.ACCOUNT.value if self._trading_account else settlement.value,
             )
 
+            if self._trading_account is not None:
+                clob = self._chain_client.get_clob(market_address)
+                return clob.post_limit_order(account=self._trading_account, args=args, **kwargs)
             # Return the router transaction
+            if self._fast_encoding:
+                return fast_encode.clob_post_limit_order(self._chain_client.router, clob=market_address, args=args, **kwargs)
             return self._chain_client.router.clob_post_limit_order(clob=market_address, args=args, **kwargs)
 
     async def place_limit_order(
@@ -961,6 +1335,9 @@ class ExecutionClient:
         """
         Place a limit order using the router contract.
         
+        With enforce_market_rules, resting orders (GTC, POST_ONLY) are rounded passively to the
+        market's tick size and rejected with ValueError below its minimum size.
+        
         Args:
             market: Market to place the order on
             side: Order side (BUY or SELL)
@@ -976,11 +1353,13 @@ class ExecutionClient:
         amount_atomic = market.base.convert_quantity_to_amount(amount)
         price_atomic = market.quote.convert_quantity_to_amount(price)
         
+        if self._enforce_market_rules and time_in_force in (TimeInForce.GTC, TimeInForce.POST_ONLY):
+            rules = await self.get_market_rules(market)
+            price_atomic = rules.quantize_price(price_atomic, side)
+            rules.validate_limit_order(price_atomic, amount_atomic)
+        
         token = self._chain_client.get_erc20(market.quote.address) if side == OrderSide.BUY else self._chain_client.get_erc20(market.base.address)
-        await self._ensure_spot_approval(
-            token=token,
-            **kwargs,
-        )
+        await self._ensure_order_approval(token, **kwargs)
         clob = self._chain_client.get_clob(market.address)
         tx = self.place_limit_order_tx(
             market_address=market.address,
@@ -1032,15 +1411,20 @@ class ExecutionClient:
             side.value,
             amount_is_base,
             FillOrderType.IMMEDIATE_OR_CANCEL.value,
-            Settlement.INSTANT.value,
+            Settlement.ACCOUNT.value if self._trading_account else Settlement.INSTANT.value,
         )
 
+        if self._trading_account is not None:
+            clob = self._chain_client.get_clob(market.address)
+            return clob.post_fill_order(account=self._trading_account, args=args, **kwargs)
         # Return the router transaction
+        if self._fast_encoding:
+            return fast_encode.clob_post_fill_order(self._chain_client.router, clob=market.address, args=args, **kwargs)
         return self._chain_client.router.clob_post_fill_order(clob=market.address, args=args, **kwargs)
 
     async def _ensure_tob_subscription(self, market: Market):
         """Ensure we have a live TOB subscription for this market."""
-        if market.address in self._tob_cache:
+        if market.address in self._tob_subscriptions:
             return  # Already subscribed
         
         def tob_callback(data):
@@ -1048,12 +1432,27 @@ class ExecutionClient:
             try:
                 bids = data.get("b", [])
                 asks = data.get("a", [])
+                book_time = int(data.get("t") or 0)
+                
+                previous = self._tob_cache.get(market.address)
+                if previous is not None and book_time < previous.book_time:
+                    logger.debug(f"Dropping out-of-order TOB update for {market.address}")
+                    return
                 
                 best_bid = Decimal(bids[0]["px"]) if bids else Decimal('0')
                 best_ask = Decimal(asks[0]["px"]) if asks else Decimal('0')
                 
                 # This is thread-safe because it's all in the same event loop
-                self._tob_cache[market.address] = (best_bid, best_ask)
+                self._tob_cache[market.address] = TobSnapshot(
+                    bid=best_bid,
+                    ask=best_ask,
+                    book_time=book_time,
+                    received_at=time.monotonic(),
+                    updates=previous.updates + 1 if previous else 1,
+                )
+                updated = self._tob_updated.pop(market.address, None)
+                if updated is not None:
+                    updated.set()
                 
                 logger.debug(f"TOB updated for {market.address}: {best_bid}/{best_ask}")
             except Exception as e:
@@ -1061,25 +1460,123 @@ class ExecutionClient:
         
         # This uses the existing WebSocket connection - no new threads
         await self._info.subscribe_orderbook(market.address, tob_callback, limit=1)
+        self._tob_subscriptions.add(market.address)
         
         logger.info(f"Subscribed to TOB updates for {market.address}")
 
+    def _fresh_tob(self, market: Market) -> TobSnapshot | None:
+        snapshot = self._tob_cache.get(market.address)
+        if snapshot is None or (self._tob_max_age is not None and snapshot.age() > self._tob_max_age):
+            return None
+        return snapshot
+
+    async def wait_for_tob(self, market: Market, timeout: float) -> TobSnapshot | None:
+        """
+        Wait for the next top-of-book update of a market.
+
+        Args:
+            market: Market to wait on (subscribed if needed)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The new snapshot, or None if no update arrived in time
+        """
+        await self._ensure_tob_subscription(market)
+        updated = self._tob_updated.get(market.address)
+        if updated is None:
+            updated = self._tob_updated[market.address] = asyncio.Event()
+        try:
+            await asyncio.wait_for(updated.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self._tob_cache.get(market.address)
+
     async def _get_cached_tob(self, market: Market) -> tuple[Decimal, Decimal]:
-        """Get TOB from cache or fallback to RPC."""
+        """Get a fresh TOB from cache, optionally wait for one, else fall back to RPC."""
         # Ensure subscription exists (this is async but runs in same event loop)
         await self._ensure_tob_subscription(market)
         
-        # Check cache
-        if market.address in self._tob_cache:
-            bid, ask = self._tob_cache[market.address]
+        snapshot = self._fresh_tob(market)
+        if snapshot is not None:
+            self._tob_stats.hits += 1
             logger.debug(f"Using cached TOB for {market.address}")
-            return bid, ask
+            return snapshot.bid, snapshot.ask
+        
+        if market.address in self._tob_cache:
+            self._tob_stats.stale += 1
+        else:
+            self._tob_stats.misses += 1
+        
+        if self._tob_wait > 0:
+            self._tob_stats.waits += 1
+            snapshot = await self.wait_for_tob(market, self._tob_wait)
+            if snapshot is not None:
+                return snapshot.bid, snapshot.ask
         
         # Cache miss/stale - fallback to RPC
+        self._tob_stats.rpc_fallbacks += 1
         logger.debug(f"TOB cache miss for {market.address}, using RPC fallback")
         return await self.get_tob(market)
 
-    async def _get_price_limit(self, market: Market, side: OrderSide, slippage: float = 0.01) -> int:
+    async def get_order_book(self, market: Market, depth: int = 20) -> OrderBookSnapshot:
+        """
+        Get the top levels of a market's order book from the WebSocket-fed book cache.
+
+        The first call for a depth subscribes to the book at that depth. Until its first update
+        arrives, or once the cached book is older than tob_max_age, the REST snapshot is returned.
+
+        Args:
+            market: Market to read
+            depth: Price levels per side (1-20)
+
+        Returns:
+            OrderBookSnapshot with WebSocket ("px"/"sz") or REST ("price"/"size") levels
+        """
+        key = (market.address, depth)
+        if key not in self._book_cache:
+            def book_callback(data):
+                try:
+                    book_time = int(data.get("t") or 0)
+                    previous = self._book_cache.get(key)
+                    if previous is not None and book_time < previous.book.timestamp:
+                        logger.debug(f"Dropping out-of-order book update for {market.address}")
+                        return
+                    self._book_cache[key] = DepthSnapshot(
+                        book=OrderBookSnapshot(
+                            bids=data.get("b", []),
+                            asks=data.get("a", []),
+                            timestamp=book_time,
+                            market_address=market.address,
+                        ),
+                        received_at=time.monotonic(),
+                    )
+                except Exception as e:
+                    logger.warning(f"Error processing book update for {market.address}: {e}")
+
+            await self._info.subscribe_orderbook(market.address, book_callback, limit=depth)
+            self._book_cache.setdefault(key, None)
+            logger.info(f"Subscribed to {depth}-level book updates for {market.address}")
+
+        snapshot = self._book_cache[key]
+        if snapshot is not None and (self._tob_max_age is None or snapshot.age() <= self._tob_max_age):
+            return snapshot.book
+        return await self._info.get_order_book(market.address, limit=depth)
+
+    async def subscribe_trades(self, market: Market, callback: Callable[[dict[str, Any]], Any]):
+        """
+        Subscribe to a market's trade stream over the InfoClient WebSocket.
+
+        Args:
+            market: Market to follow
+            callback: Called with each trade message ("sd", "px", "sz", ...)
+        """
+        await self._info.subscribe_trades(market.address, callback)
+
+    async def unsubscribe_trades(self, market: Market):
+        """Unsubscribe from a market's trade stream."""
+        await self._info.unsubscribe_trades(market.address)
+
+    async def get_price_limit(self, market: Market, side: OrderSide, slippage: float = 0.01) -> int:
         """
         Get the price limit for a market order with slippage applied.
         Uses cached WebSocket TOB data for better performance.
@@ -1119,13 +1616,10 @@ class ExecutionClient:
             Transaction receipt of the placed order
         """
         amount_atomic = market.base.convert_quantity_to_amount(amount) if amount_is_base else market.quote.convert_quantity_to_amount(amount)
-        price_limit = await self._get_price_limit(market, side, slippage)
+        price_limit = await self.get_price_limit(market, side, slippage)
         token = self._chain_client.get_erc20(market.quote.address) if amount_is_base else self._chain_client.get_erc20(market.base.address)
         
-        await self._ensure_spot_approval(
-            token=token,
-            **kwargs,
-        )
+        await self._ensure_order_approval(token, **kwargs)
         
         tx = self.place_market_order_tx(
             market=market,
@@ -1173,11 +1667,13 @@ class ExecutionClient:
             cancel_timestamp=0,  # No expiration
             side=side.value,
             limit_order_type=LimitOrderType.POST_ONLY.value,
-            settlement=Settlement.INSTANT.value,
+            settlement=Settlement.ACCOUNT.value if self._trading_account else Settlement.INSTANT.value,
         )
 
         # Return the transaction
-        return clob.amend(account=self.wallet_address, args=args, **kwargs)
+        if self._fast_encoding:
+            return fast_encode.clob_amend(clob, account=self.trading_account, args=args, **kwargs)
+        return clob.amend(account=self.trading_account, args=args, **kwargs)
 
     async def amend_order(
             self,
@@ -1213,12 +1709,14 @@ class ExecutionClient:
         if amount_in_base == 0 or price_in_ticks == 0:
             raise ValueError("Amount or price is 0")
         
+        if self._enforce_market_rules:
+            rules = await self.get_market_rules(market)
+            price_in_ticks = rules.quantize_price(price_in_ticks, side)
+            rules.validate_limit_order(price_in_ticks, amount_in_base)
+        
         token = self._chain_client.get_erc20(market.quote.address) if side == OrderSide.BUY else self._chain_client.get_erc20(market.base.address)
         
-        await self._ensure_spot_approval(
-            token=token,
-            **kwargs,
-        )
+        await self._ensure_order_approval(token, **kwargs)
 
         # Create and execute transaction
         tx = await self.amend_order_tx(
@@ -1230,8 +1728,8 @@ class ExecutionClient:
             **kwargs
         )
         if return_built_tx:
-            return await self._scheduler.return_transaction_data(tx)
-        return await self._scheduler.send(tx)
+            return await self._scheduler.return_transaction_data(tx, lane=TxLane.AMEND)
+        return await self._scheduler.send(tx, lane=TxLane.AMEND)
 
     def cancel_order_tx(
             self, market: Market, order_ids: list[int], **kwargs
@@ -1248,6 +1746,10 @@ class ExecutionClient:
             TypedContractFunction that can be used to execute the transaction
         """
 
+        if self._trading_account is not None:
+            clob = self._chain_client.get_clob(market.address)
+            return clob.cancel(account=self._trading_account, args=CancelArgs(order_ids, Settlement.ACCOUNT.value), **kwargs)
+
         # Create cancel args
         args = CancelArgs(
             order_ids, 
@@ -1255,6 +1757,8 @@ class ExecutionClient:
         )
 
         # Return the router transaction
+        if self._fast_encoding:
+            return fast_encode.clob_cancel(self._chain_client.router, clob=market.address, args=args, is_unwrapping=True, **kwargs)
         return self._chain_client.router.clob_cancel(clob=market.address, args=args, is_unwrapping=True, **kwargs)
 
     async def cancel_order(self, market: Market, order_id: int, return_built_tx: bool = False, **kwargs):
@@ -1272,25 +1776,45 @@ class ExecutionClient:
         clob = self._chain_client.get_clob(market.address)
         tx = self.cancel_order_tx(market=market, order_ids=[order_id], **kwargs)
         if return_built_tx:
-            return await self._scheduler.return_transaction_data(tx)
-        return await self._scheduler.send(tx)
+            return await self._scheduler.return_transaction_data(tx, lane=TxLane.CANCEL)
+        return await self._scheduler.send(tx, lane=TxLane.CANCEL)
 
-    async def cancel_all_orders(self, market: Market, order_ids: list[int], return_built_tx: bool = False, **kwargs):
+    async def discover_open_orders(self, market: Market, block_number: int | None = None) -> list[OnChainOrder]:
+        """
+        Find the trading account's resting orders on a market from chain state, without the REST API.
+
+        Args:
+            market: Market to search
+            block_number: Block to read (the latest block by default)
+
+        Returns:
+            The orders, bids best first and then asks best first
+        """
+        discovery = OrderDiscovery(self._chain_client.get_clob(market.address))
+        return await discovery.find_orders(self.trading_account, block_number)
+
+    async def cancel_all_orders(self, market: Market, order_ids: list[int] | None = None, return_built_tx: bool = False, **kwargs):
         """
         Cancel all orders for the current user on a specific market using the router.
 
         Args:
             market: Market to cancel orders on
-            order_ids: IDs of the orders to cancel
+            order_ids: IDs of the orders to cancel (None to discover them on-chain with
+                discover_open_orders)
             **kwargs: Additional transaction parameters
             
         Returns:
-            List of transaction hashes
+            List of transaction hashes, or None if no orders were found
         """
+        if order_ids is None:
+            order_ids = [order.order_id for order in await self.discover_open_orders(market)]
+            if not order_ids:
+                logger.info(f"No resting orders on {market.address}")
+                return None
         tx = self.cancel_order_tx(market=market, order_ids=order_ids, **kwargs)
         if return_built_tx:
-            return await self._scheduler.return_transaction_data(tx)
-        return await self._scheduler.send(tx)
+            return await self._scheduler.return_transaction_data(tx, lane=TxLane.CANCEL)
+        return await self._scheduler.send(tx, lane=TxLane.CANCEL)
 
     def clear_approval_cache(self):
         """Clear the approval cache. Use this if you want to force re-checking approvals."""
@@ -1301,15 +1825,16 @@ class ExecutionClient:
 
     def clear_tob_cache(self):
         """Clear TOB cache - useful for testing or if stale data is suspected.
-        Note: This also clears subscription tracking, so new subscriptions will be created as needed."""
+        Subscriptions stay open, so the cache refills with the next updates."""
         self._tob_cache.clear()
         logger.info("TOB cache cleared")
 
     async def unsubscribe_tob(self, market: Market):
         """Unsubscribe from TOB updates for a specific market."""
-        if market.address in self._tob_cache:
+        if market.address in self._tob_subscriptions:
             try:
                 await self._info.unsubscribe_orderbook(market.address, limit=1)
+                self._tob_subscriptions.discard(market.address)
                 self._tob_cache.pop(market.address, None)
                 logger.info(f"Unsubscribed from TOB updates for {market.address}")
             except Exception as e:
@@ -0,0 +1,426 @@
+"""
+Algorithmic execution of parent orders: TWAP, POV and iceberg.
+
+AlgoScheduler slices every parent order into child orders from a single driver task. On each
+tick it reads the receipts of the children still in flight in one batch request, updates fills
+(and the resting iceberg clips from the OrderStore, fed by a log poll of their markets), works
+out the next child of every active parent and sends all of them in one send_many batch.
+Market children are IOC fill orders priced from the cached top of book; POV targets follow
+the WebSocket trade stream. No task is created per child or per parent, so one process can
+work hundreds of parents.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable
+
+from eth_utils.address import to_checksum_address
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import TxLane, TypedContractFunction
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.orders import decode_clob_log
+from gte_py.models import Market, OrderStatus, TimeInForce
+
+logger = logging.getLogger(__name__)
+
+
+class AlgoMode(Enum):
+    TWAP = "twap"
+    POV = "pov"
+    ICEBERG = "iceberg"
+
+
+class AlgoStatus(Enum):
+    ACTIVE = "active"
+    DONE = "done"
+    CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class TwapParams:
+    duration: float  # seconds
+    slices: int
+
+
+@dataclass(frozen=True)
+class PovParams:
+    participation: float  # share of the market volume, 0-1
+    min_clip: int
+    max_clip: int
+
+
+@dataclass(frozen=True)
+class IcebergParams:
+    price: int
+    clip: int  # visible size
+
+
+@dataclass
+class AlgoOrder:
+    """A parent order and its fill progress; amounts are in atomic units."""
+    algo_id: int
+    market: Market
+    side: OrderSide
+    mode: AlgoMode
+    quantity: int
+    params: TwapParams | PovParams | IcebergParams
+    slippage: float
+    started_at: float  # time.monotonic()
+    status: AlgoStatus = AlgoStatus.ACTIVE
+    filled: int = 0
+    filled_quote: int = 0
+    children_sent: int = 0
+    children_failed: int = 0
+    slices_sent: int = 0  # TWAP
+    market_volume: int = 0  # POV: base traded in the market since the start
+    # Children awaiting a receipt: tx hash -> base amount
+    pending: dict[str, int] = field(default_factory=dict)
+    # Resting iceberg clips: order id -> fill already counted
+    resting: dict[int, int] = field(default_factory=dict)
+    tx_kwargs: dict[str, Any] = field(default_factory=dict, repr=False)  # for every child
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def in_flight(self) -> int:
+        """Base sent in children that are still awaiting a receipt."""
+        return sum(self.pending.values())
+
+    @property
+    def remaining(self) -> int:
+        return max(self.quantity - self.filled, 0)
+
+    @property
+    def progress(self) -> float:
+        """Filled share of the parent quantity, 0-1."""
+        return self.filled / self.quantity if self.quantity else 1.0
+
+    @property
+    def average_price(self) -> Decimal | None:
+        """Average fill price in decimal quote per base, or None before the first fill."""
+        if not self.filled:
+            return None
+        return self.market.quote.convert_amount_to_quantity(self.filled_quote) / self.market.base.convert_amount_to_quantity(self.filled)
+
+
+class AlgoScheduler:
+    """
+    Works TWAP, POV and iceberg parent orders through an ExecutionClient from one task.
+
+    Keyword arguments of the submit methods are transaction parameters (e.g. gas) used for the
+    approval and for every child of the parent.
+    """
+
+    def __init__(
+        self,
+        execution: ExecutionClient,
+        tick_interval: float = 0.5,
+        on_progress: Callable[[AlgoOrder], Any] | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            execution: Execution client whose nonce scheduler sends the children; iceberg
+                orders also need its OrderStore
+            tick_interval: Seconds between driver ticks
+            on_progress: Called with a parent order whenever its fills or status change
+        """
+        self._execution = execution
+        self._tick_interval = tick_interval
+        self._on_progress = on_progress
+        self._ids = itertools.count(1)
+        self._orders: dict[int, AlgoOrder] = {}
+        self._trade_subscriptions: dict[str, Market] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def orders(self) -> list[AlgoOrder]:
+        return list(self._orders.values())
+
+    def get(self, algo_id: int) -> AlgoOrder | None:
+        return self._orders.get(algo_id)
+
+    async def start(self):
+        """Start the driver task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the driver task; parent orders keep their state and resting clips stay on the book."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for market_address, market in list(self._trade_subscriptions.items()):
+            try:
+                await self._execution.unsubscribe_trades(market)
+            except Exception as e:
+                logger.warning(f"Error unsubscribing from trades of {market_address}: {e}")
+        self._trade_subscriptions.clear()
+
+    # ================= SUBMISSION =================
+
+    async def _submit(self, market: Market, side: OrderSide, quantity: Decimal, mode: AlgoMode,
+                      params: TwapParams | PovParams | IcebergParams, slippage: float, **kwargs) -> AlgoOrder:
+        execution = self._execution
+        amount = market.base.convert_quantity_to_amount(quantity)
+        if amount <= 0:
+            raise ValueError(f"Quantity must be positive, got {quantity}")
+        await execution.ensure_spot_approval(market, side, **kwargs)
+        order = AlgoOrder(next(self._ids), market, side, mode, amount, params, slippage, time.monotonic(), tx_kwargs=kwargs)
+        self._orders[order.algo_id] = order
+        logger.info(f"Started {mode.value} {order.algo_id}: {side.name} {quantity} {market.base.symbol}")
+        return order
+
+    async def submit_twap(self, market: Market, side: OrderSide, quantity: Decimal, duration: float,
+                          slices: int, slippage: float = 0.01, **kwargs) -> AlgoOrder:
+        """
+        Trade a quantity in equal IOC slices spread evenly over a duration.
+
+        Slices that fill partially are caught up by the next one.
+        """
+        if slices < 1 or duration <= 0:
+            raise ValueError("TWAP needs at least one slice and a positive duration")
+        return await self._submit(market, side, quantity, AlgoMode.TWAP, TwapParams(duration, slices), slippage, **kwargs)
+
+    async def submit_pov(self, market: Market, side: OrderSide, quantity: Decimal, participation: float,
+                         min_clip: Decimal, max_clip: Decimal, slippage: float = 0.01, **kwargs) -> AlgoOrder:
+        """Trade a share of the market volume reported by the trade stream, in IOC clips."""
+        if not 0 < participation < 1:
+            raise ValueError(f"Participation must be between 0 and 1, got {participation}")
+        base = market.base
+        params = PovParams(participation, base.convert_quantity_to_amount(min_clip), base.convert_quantity_to_amount(max_clip))
+        order = await self._submit(market, side, quantity, AlgoMode.POV, params, slippage, **kwargs)
+        await self._ensure_trade_subscription(market)
+        return order
+
+    async def submit_iceberg(self, market: Market, side: OrderSide, quantity: Decimal, price: Decimal,
+                             clip: Decimal, **kwargs) -> AlgoOrder:
+        """Rest one GTC clip at a time at a limit price, replacing it once it has filled."""
+        execution = self._execution
+        if execution.orders is None:
+            raise ValueError("Iceberg orders need an ExecutionClient with an order_store")
+        price_atomic = market.quote.convert_quantity_to_amount(price)
+        clip_atomic = market.base.convert_quantity_to_amount(clip)
+        if execution.enforce_market_rules:
+            rules = await execution.get_market_rules(market)
+            price_atomic = rules.quantize_price(price_atomic, side)
+            rules.validate_limit_order(price_atomic, clip_atomic)
+        return await self._submit(
+            market, side, quantity, AlgoMode.ICEBERG, IcebergParams(price_atomic, clip_atomic), 0.0, **kwargs
+        )
+
+    async def cancel(self, algo_id: int, **kwargs):
+        """Stop a parent order and cancel its resting iceberg clip; children in flight still settle."""
+        order = self._orders[algo_id]
+        if order.status != AlgoStatus.ACTIVE:
+            return
+        order.status = AlgoStatus.CANCELLED
+        if order.resting:
+            await self._execution.scheduler.send(
+                self._execution.cancel_order_tx(market=order.market, order_ids=list(order.resting), **kwargs),
+                lane=TxLane.CANCEL,
+            )
+        self._finish(order)
+
+    async def wait(self, algo_id: int, timeout: float | None = None) -> AlgoOrder:
+        """Wait until a parent order is done or cancelled."""
+        order = self._orders[algo_id]
+        await asyncio.wait_for(order.done.wait(), timeout)
+        return order
+
+    # ================= MARKET DATA =================
+
+    async def _ensure_trade_subscription(self, market: Market):
+        if market.address in self._trade_subscriptions:
+            return
+        self._trade_subscriptions[market.address] = market
+        base = market.base
+
+        def on_trade(data: dict[str, Any]):
+            try:
+                size = base.convert_quantity_to_amount(Decimal(data["sz"]))
+            except Exception as e:
+                logger.debug(f"Skipping trade message: {e}")
+                return
+            for order in self._orders.values():
+                if order.mode == AlgoMode.POV and order.status == AlgoStatus.ACTIVE and order.market.address == market.address:
+                    order.market_volume += size
+
+        try:
+            await self._execution.subscribe_trades(market, on_trade)
+        except Exception:
+            self._trade_subscriptions.pop(market.address, None)
+            raise
+
+    # ================= DRIVER =================
+
+    async def _run(self):
+        while True:
+            try:
+                await self._tick()
+            except Exception as e:
+                logger.error(f"Algo scheduler tick failed: {e}")
+            await asyncio.sleep(self._tick_interval)
+
+    async def _tick(self, now: float | None = None):
+        """Settle children in flight, then send the next child of every active parent in one batch."""
+        now = time.monotonic() if now is None else now
+        await self._poll_receipts()
+        await self._update_resting()
+
+        children: list[tuple[AlgoOrder, int]] = []
+        for order in list(self._orders.values()):
+            if order.status != AlgoStatus.ACTIVE:
+                continue
+            amount = self._next_child(order, now)
+            if amount > 0:
+                children.append((order, amount))
+            elif self._is_complete(order):
+                order.status = AlgoStatus.DONE
+                self._finish(order)
+        if not children:
+            return
+
+        txs = await asyncio.gather(*(self._child_tx(order, amount) for order, amount in children))
+        results = await self._execution.scheduler.send_many(list(txs))
+        for (order, amount), result in zip(children, results):
+            order.children_sent += 1
+            if result.ok:
+                order.pending[result.tx_hash] = amount
+            else:
+                order.children_failed += 1
+                logger.warning(f"Child of {order.mode.value} {order.algo_id} was rejected: {result.error}")
+
+    def _next_child(self, order: AlgoOrder, now: float) -> int:
+        """Base amount of the child to send now, 0 for none."""
+        available = order.quantity - order.filled - order.in_flight
+        if available <= 0:
+            return 0
+        params = order.params
+        if order.mode == AlgoMode.TWAP:
+            interval = params.duration / params.slices
+            due = min(int((now - order.started_at) / interval) + 1, params.slices)
+            if due <= order.slices_sent:
+                return 0
+            order.slices_sent = due
+            clip = order.quantity * due // params.slices - order.filled - order.in_flight
+            return min(clip, available) if clip > 0 else 0
+        if order.mode == AlgoMode.POV:
+            target = int(order.market_volume * params.participation)
+            clip = min(target - order.filled - order.in_flight, params.max_clip, available)
+            return clip if clip >= min(params.min_clip, available) and clip > 0 else 0
+        # Iceberg: one clip on the book at a time
+        if order.resting or order.pending:
+            return 0
+        return min(params.clip, available)
+
+    def _is_complete(self, order: AlgoOrder) -> bool:
+        if order.pending or order.resting:
+            return False
+        if order.filled >= order.quantity:
+            return True
+        # A TWAP ends with its last slice, even if IOC children left some of it unfilled
+        return order.mode == AlgoMode.TWAP and order.slices_sent >= order.params.slices
+
+    async def _child_tx(self, order: AlgoOrder, amount: int) -> TypedContractFunction[Any]:
+        execution = self._execution
+        if order.mode == AlgoMode.ICEBERG:
+            return execution.place_limit_order_tx(
+                market_address=order.market.address,
+                side=order.side,
+                amount=amount,
+                price=order.params.price,
+                time_in_force=TimeInForce.GTC,
+                **order.tx_kwargs,
+            )
+        price_limit = await execution.get_price_limit(order.market, order.side, order.slippage)
+        return execution.place_market_order_tx(
+            market=order.market, side=order.side, amount=amount, price_limit=price_limit, amount_is_base=True,
+            **order.tx_kwargs,
+        )
+
+    async def _poll_receipts(self):
+        pending = [(order, tx_hash) for order in self._orders.values() for tx_hash in order.pending]
+        if not pending:
+            return
+        # One batch request for every child in flight; receipts also reach the OrderStore
+        receipts = await self._execution.scheduler.get_receipts([tx_hash for _, tx_hash in pending])
+        for (order, tx_hash), receipt in zip(pending, receipts):
+            if receipt is None:
+                continue
+            del order.pending[tx_hash]
+            if receipt.get("status") == 0:
+                order.children_failed += 1
+                logger.warning(f"Child {tx_hash} of {order.mode.value} {order.algo_id} reverted")
+                continue
+            self._apply_receipt(order, receipt)
+
+    def _apply_receipt(self, order: AlgoOrder, receipt: Any):
+        account = self._execution.trading_account
+        before = order.filled
+        for log in receipt.get("logs", []):
+            try:
+                event = decode_clob_log(log)
+            except Exception:
+                continue
+            if event is None or event["event"] not in ("FillOrderProcessed", "LimitOrderProcessed"):
+                continue
+            args = event["args"]
+            if to_checksum_address(args["account"]) != account:
+                continue
+            traded = abs(args["baseTokenAmountTraded"])
+            order.filled += traded
+            order.filled_quote += abs(args["quoteTokenAmountTraded"])
+            if event["event"] == "LimitOrderProcessed" and args["amountPostedInBase"] > 0:
+                order.resting[args["orderId"]] = traded
+        if order.filled != before:
+            self._report(order)
+
+    async def _update_resting(self):
+        store = self._execution.orders
+        if store is None:
+            return
+        markets = {order.market.address for order in self._orders.values() if order.resting}
+        if not markets:
+            return
+        # Clips fill through other accounts' transactions, seen only as OrderMatched logs
+        await self._execution.poll_logs(markets)
+        for order in self._orders.values():
+            for order_id, counted in list(order.resting.items()):
+                resting = store.get(order.market.address, order_id)
+                if resting is None:
+                    continue
+                filled = resting.filled_amount or 0
+                if filled > counted:
+                    delta = filled - counted
+                    order.filled += delta
+                    order.filled_quote += delta * order.params.price // order.market.base.scale
+                    order.resting[order_id] = filled
+                    self._report(order)
+                if resting.status != OrderStatus.OPEN:
+                    del order.resting[order_id]
+
+    def _finish(self, order: AlgoOrder):
+        order.done.set()
+        logger.info(
+            f"{order.mode.value} {order.algo_id} {order.status.value}: filled {order.filled} of {order.quantity}"
+        )
+        self._report(order)
+
+    def _report(self, order: AlgoOrder):
+        if self._on_progress is None:
+            return
+        try:
+            self._on_progress(order)
+        except Exception as e:
+            logger.error(f"Algo progress callback failed: {e}")
@@ -0,0 +1,260 @@
+"""
+Local UniswapV2 quoting from cached pair reserves.
+
+UniswapRouter.get_amounts_out/get_amounts_in are one eth_call per quote. AmmQuoter finds
+pairs through the UniswapV2 factory once, caches their reserves and keeps them current from
+Sync logs (or re-reads them once they are older than max_age), and then evaluates the
+router's constant-product formulas locally, including the 0.3% fee and the exact integer
+rounding, so a quote or a slippage bound for any number of sizes costs no RPC.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+from eth_typing import ChecksumAddress
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.events import get_event_data
+from web3.types import LogReceipt
+
+from gte_py.api.chain.uniswap_factory import UniswapFactory
+from gte_py.api.chain.utils import load_abi
+
+logger = logging.getLogger(__name__)
+
+# UniswapV2Library charges 0.3% of the input: amountInWithFee = amountIn * 997 / 1000
+FEE_NUMERATOR = 997
+FEE_DENOMINATOR = 1000
+
+_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+_PAIR_ABI = load_abi("uniswap_pair")
+_CODEC = AsyncWeb3().codec
+_SYNC_ABI = next(entry for entry in _PAIR_ABI if entry.get("type") == "event" and entry["name"] == "Sync")
+SYNC_TOPIC = HexBytes(event_abi_to_log_topic(_SYNC_ABI)).to_0x_hex()
+
+# Reserves read with eth_call at block N already include every log of block N
+_AFTER_BLOCK = 2**63
+
+
+def get_amount_out(amount_in: int, reserve_in: int, reserve_out: int) -> int:
+    """UniswapV2Library.getAmountOut: output for an exact input, after the fee."""
+    if amount_in <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    amount_in_with_fee = amount_in * FEE_NUMERATOR
+    return amount_in_with_fee * reserve_out // (reserve_in * FEE_DENOMINATOR + amount_in_with_fee)
+
+
+def get_amount_in(amount_out: int, reserve_in: int, reserve_out: int) -> int:
+    """UniswapV2Library.getAmountIn: input required for an exact output, after the fee."""
+    if amount_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_OUTPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    if amount_out >= reserve_out:
+        # The router reverts on the reserveOut - amountOut underflow
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    return reserve_in * amount_out * FEE_DENOMINATOR // ((reserve_out - amount_out) * FEE_NUMERATOR) + 1
+
+
+def sort_tokens(token_a: ChecksumAddress, token_b: ChecksumAddress) -> tuple[ChecksumAddress, ChecksumAddress]:
+    """UniswapV2Library.sortTokens: (token0, token1) of a pair."""
+    if token_a == token_b:
+        raise ValueError("UniswapV2Library: IDENTICAL_ADDRESSES")
+    return (token_a, token_b) if int(token_a, 16) < int(token_b, 16) else (token_b, token_a)
+
+
+@dataclass
+class PairReserves:
+    """Cached reserves of one UniswapV2 pair."""
+    address: ChecksumAddress
+    token0: ChecksumAddress
+    token1: ChecksumAddress
+    reserve0: int
+    reserve1: int
+    block_number: int
+    log_index: int  # position of the last applied Sync within block_number
+    updated_at: float  # time.monotonic() of the last update
+
+    def reserves(self, token_in: ChecksumAddress) -> tuple[int, int]:
+        """(reserve_in, reserve_out) for a swap that sells token_in."""
+        if token_in == self.token0:
+            return self.reserve0, self.reserve1
+        return self.reserve1, self.reserve0
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the reserves were last updated."""
+        return (time.monotonic() if now is None else now) - self.updated_at
+
+
+class AmmQuoter:
+    """Constant-product quotes over UniswapV2 pairs from locally cached reserves."""
+
+    def __init__(self, web3: AsyncWeb3, factory_address: ChecksumAddress, max_age: float | None = 10.0):
+        """
+        Initialize the quoter.
+
+        Args:
+            web3: AsyncWeb3 instance used for getPair, getReserves and eth_getLogs
+            factory_address: UniswapV2 factory, e.g. await chain_client.univ2_router.factory()
+            max_age: Seconds after which cached reserves are re-read with getReserves before
+                quoting (None to rely on Sync logs and refresh() only)
+        """
+        self._web3 = web3
+        self._factory = UniswapFactory(web3=web3, address=factory_address)
+        self._max_age = max_age
+        self._pair_addresses: dict[tuple[ChecksumAddress, ChecksumAddress], ChecksumAddress] = {}
+        self._pairs: dict[ChecksumAddress, PairReserves] = {}
+        self._loading: dict[ChecksumAddress, asyncio.Future[PairReserves]] = {}
+        self.last_block = 0
+
+    @property
+    def pairs(self) -> list[PairReserves]:
+        """Get the cached pairs."""
+        return list(self._pairs.values())
+
+    def register_pair(self, token_a: ChecksumAddress, token_b: ChecksumAddress, pair_address: ChecksumAddress):
+        """Record a known pair address (e.g. from a PairCreated log) so it needs no getPair call."""
+        self._pair_addresses[sort_tokens(token_a, token_b)] = to_checksum_address(pair_address)
+
+    async def get_pair_address(self, token_a: ChecksumAddress, token_b: ChecksumAddress) -> ChecksumAddress:
+        """Pair of two tokens, looked up through the factory once."""
+        key = sort_tokens(token_a, token_b)
+        address = self._pair_addresses.get(key)
+        if address is None:
+            address = await self._factory.get_pair(*key)
+            if address == _ZERO_ADDRESS:
+                raise ValueError(f"No UniswapV2 pair for {key[0]} and {key[1]}")
+            address = self._pair_addresses[key] = to_checksum_address(address)
+        return address
+
+    async def get_pair(self, token_a: ChecksumAddress, token_b: ChecksumAddress) -> PairReserves:
+        """Cached reserves of a pair, read from the chain on first use or once older than max_age."""
+        address = await self.get_pair_address(token_a, token_b)
+        pair = self._pairs.get(address)
+        if pair is not None and (self._max_age is None or pair.age() <= self._max_age):
+            return pair
+        task = self._loading.get(address)
+        if task is None:
+            token0, token1 = sort_tokens(token_a, token_b)
+            task = self._loading[address] = asyncio.ensure_future(self._load(address, token0, token1))
+            task.add_done_callback(lambda _: self._loading.pop(address, None))
+        return await task
+
+    async def _load(self, address: ChecksumAddress, token0: ChecksumAddress, token1: ChecksumAddress,
+                    block_number: int | None = None) -> PairReserves:
+        if block_number is None:
+            block_number = await self._web3.eth.block_number
+        contract = self._web3.eth.contract(address=address, abi=_PAIR_ABI)
+        reserve0, reserve1, _ = await contract.functions.getReserves().call(block_identifier=block_number)
+        pair = self._pairs.get(address)
+        if pair is not None and (pair.block_number, pair.log_index) > (block_number, _AFTER_BLOCK):
+            # A newer Sync arrived while the call was in flight
+            return pair
+        pair = PairReserves(address, token0, token1, reserve0, reserve1, block_number, _AFTER_BLOCK, time.monotonic())
+        self._pairs[address] = pair
+        logger.debug(f"Loaded reserves of {address} at block {block_number}: {reserve0}, {reserve1}")
+        return pair
+
+    async def refresh(self, pairs: Iterable[ChecksumAddress] | None = None) -> list[PairReserves]:
+        """Re-read the reserves of the given cached pairs (all by default) at one block, concurrently."""
+        addresses = list(self._pairs) if pairs is None else [to_checksum_address(a) for a in pairs]
+        if not addresses:
+            return []
+        block_number = await self._web3.eth.block_number
+        return list(await asyncio.gather(*(
+            self._load(a, self._pairs[a].token0, self._pairs[a].token1, block_number) for a in addresses
+        )))
+
+    def on_log(self, log: LogReceipt | dict[str, Any]):
+        """
+        Apply a Sync log of a cached pair.
+
+        Every Swap, Mint and Burn ends with a Sync carrying the new absolute reserves, so Sync
+        alone keeps the cache exact without double-counting the Swap amounts.
+        """
+        topics = log.get("topics") or []
+        if not topics or HexBytes(topics[0]).to_0x_hex() != SYNC_TOPIC:
+            return
+        address = to_checksum_address(log["address"])
+        pair = self._pairs.get(address)
+        if pair is None:
+            return
+        position = (log["blockNumber"], log["logIndex"])
+        if position <= (pair.block_number, pair.log_index):
+            return
+        args = get_event_data(_CODEC, _SYNC_ABI, log)["args"]
+        pair.reserve0, pair.reserve1 = args["reserve0"], args["reserve1"]
+        pair.block_number, pair.log_index = position
+        pair.updated_at = time.monotonic()
+
+    async def poll_logs(self, to_block: int | None = None) -> int:
+        """
+        Apply the Sync logs of every cached pair since the last poll, in one eth_getLogs.
+
+        Returns:
+            Number of logs fetched
+        """
+        if not self._pairs:
+            return 0
+        if to_block is None:
+            to_block = await self._web3.eth.block_number
+        from_block = self.last_block + 1 if self.last_block else to_block
+        if from_block > to_block:
+            return 0
+        logs = await self._web3.eth.get_logs({
+            "address": list(self._pairs),
+            "topics": [SYNC_TOPIC],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        for log in logs:
+            self.on_log(log)
+        self.last_block = to_block
+        return len(logs)
+
+    async def _path_reserves(self, path: Sequence[ChecksumAddress]) -> list[tuple[int, int]]:
+        if len(path) < 2:
+            raise ValueError("UniswapV2Library: INVALID_PATH")
+        pairs = await asyncio.gather(*(self.get_pair(path[i], path[i + 1]) for i in range(len(path) - 1)))
+        return [pair.reserves(path[i]) for i, pair in enumerate(pairs)]
+
+    async def get_amounts_out(self, amount_in: int, path: Sequence[ChecksumAddress]) -> list[int]:
+        """Same result as UniswapRouter.get_amounts_out, from cached reserves."""
+        amounts = [amount_in]
+        for reserve_in, reserve_out in await self._path_reserves(path):
+            amounts.append(get_amount_out(amounts[-1], reserve_in, reserve_out))
+        return amounts
+
+    async def get_amounts_in(self, amount_out: int, path: Sequence[ChecksumAddress]) -> list[int]:
+        """Same result as UniswapRouter.get_amounts_in, from cached reserves."""
+        amounts = [amount_out]
+        for reserve_in, reserve_out in reversed(await self._path_reserves(path)):
+            amounts.append(get_amount_in(amounts[-1], reserve_in, reserve_out))
+        return amounts[::-1]
+
+    async def get_amounts_out_many(self, amounts_in: Iterable[int], path: Sequence[ChecksumAddress]) -> list[int]:
+        """Final output of each input size over the same reserves (one reserve lookup in total)."""
+        hops = await self._path_reserves(path)
+        outputs = []
+        for amount in amounts_in:
+            for reserve_in, reserve_out in hops:
+                amount = get_amount_out(amount, reserve_in, reserve_out)
+            outputs.append(amount)
+        return outputs
+
+    async def get_amounts_in_many(self, amounts_out: Iterable[int], path: Sequence[ChecksumAddress]) -> list[int]:
+        """Required input of each output size over the same reserves (one reserve lookup in total)."""
+        hops = (await self._path_reserves(path))[::-1]
+        inputs = []
+        for amount in amounts_out:
+            for reserve_in, reserve_out in hops:
+                amount = get_amount_in(amount, reserve_in, reserve_out)
+            inputs.append(amount)
+        return inputs
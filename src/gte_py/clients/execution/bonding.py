@@ -0,0 +1,295 @@
+"""
+Local launchpad quoting from a bonding-curve model.
+
+Launchpad.quote_base_for_quote/quote_quote_for_base are one eth_call per size. The launchpad
+prices every launch on a constant-product curve over virtual reserves: with base_sold and
+quote_bought from the token's LaunchData, the curve holds virtual_base - base_sold base and
+virtual_quote + quote_bought quote, and every trade keeps their product, rounding in the
+curve's favour. LaunchpadQuoter loads LaunchData once per token, follows it from Swap and
+BondingLocked logs, and evaluates the curve locally.
+
+The curve parameters are fixed per launch: LaunchData names the bonding-curve contract, and
+the virtual reserves (setVirtualReserves) and quoteScaling (TokenLaunched) in force when the
+token launched stay with it. A BondingCurve models one such set, so the first load of a token
+checks its curve contract and compares one local quote with the launchpad's; tokens that do
+not match are refused (supports() is False) rather than quoted from the wrong curve.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from eth_typing import ChecksumAddress
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.events import get_event_data
+from web3.types import LogReceipt
+
+from gte_py.api.chain.launchpad import Launchpad
+from gte_py.api.chain.structs import LaunchData
+from gte_py.api.chain.utils import load_abi
+
+logger = logging.getLogger(__name__)
+
+_CODEC = AsyncWeb3().codec
+_EVENT_ABIS: dict[bytes, dict[str, Any]] = {
+    event_abi_to_log_topic(entry): entry
+    for entry in load_abi("launchpad")
+    if entry.get("type") == "event" and entry["name"] in ("Swap", "BondingLocked")
+}
+
+# LaunchData read with eth_call at block N already includes every log of block N
+_AFTER_BLOCK = 2**63
+
+# Topics to pass to eth_getLogs for the events that move a launch along its curve
+LOG_TOPICS = [HexBytes(topic).to_0x_hex() for topic in _EVENT_ABIS]
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+@dataclass(frozen=True)
+class BondingCurve:
+    """Constant-product curve over virtual reserves; amounts are in atomic units."""
+    virtual_base: int
+    virtual_quote: int
+    bonding_supply: int  # base sold from the curve before the launch graduates
+
+    def reserves(self, base_sold: int, quote_bought: int) -> tuple[int, int]:
+        """(base, quote) virtual reserves after base_sold has been sold for quote_bought."""
+        return self.virtual_base - base_sold, self.virtual_quote + quote_bought
+
+    def quote_base_for_quote(self, base_sold: int, quote_bought: int, quote_amount: int, is_buy: bool) -> int:
+        """
+        Base for a quote amount: received when buying with quote_amount, or required to sell
+        for quote_amount.
+        """
+        base, quote = self.reserves(base_sold, quote_bought)
+        if is_buy:
+            base_out = base - _ceil_div(base * quote, quote + quote_amount)
+            if base_sold + base_out > self.bonding_supply:
+                raise ValueError("Launchpad: buy exceeds the remaining bonding supply")
+            return base_out
+        if quote_amount >= quote_bought:
+            raise ValueError("Launchpad: InsufficientBaseSold")
+        return _ceil_div(base * quote, quote - quote_amount) - base
+
+    def quote_quote_for_base(self, base_sold: int, quote_bought: int, base_amount: int, is_buy: bool) -> int:
+        """
+        Quote for a base amount: required to buy base_amount, or received when selling it.
+        """
+        base, quote = self.reserves(base_sold, quote_bought)
+        if is_buy:
+            if base_sold + base_amount > self.bonding_supply:
+                raise ValueError("Launchpad: buy exceeds the remaining bonding supply")
+            return _ceil_div(base * quote, base - base_amount) - quote
+        if base_amount > base_sold:
+            raise ValueError("Launchpad: InsufficientBaseSold")
+        return quote - _ceil_div(base * quote, base + base_amount)
+
+
+@dataclass
+class LaunchState:
+    """Curve position of one launch token."""
+    token: ChecksumAddress
+    active: bool
+    bonding_curve: ChecksumAddress
+    base_sold: int
+    quote_bought: int
+    block_number: int
+    log_index: int  # position of the last applied log within block_number
+    updated_at: float  # time.monotonic() of the last update
+
+
+class LaunchpadQuoter:
+    """Launchpad quotes computed locally from LaunchData and a BondingCurve."""
+
+    def __init__(self, launchpad: Launchpad, curve: BondingCurve, curve_address: ChecksumAddress):
+        """
+        Initialize the quoter.
+
+        Args:
+            launchpad: Launchpad contract whose launches are quoted
+            curve: Curve parameters of the launches to quote (virtual reserves and
+                BONDING_SUPPLY)
+            curve_address: Bonding-curve contract of those launches; tokens launched on
+                another curve are not quoted
+        """
+        self._launchpad = launchpad
+        self.curve = curve
+        self.curve_address = curve_address
+        self._launches: dict[ChecksumAddress, LaunchState] = {}
+        # Whether a token's launch was found to follow self.curve, checked once per token
+        self._matches: dict[ChecksumAddress, bool] = {}
+        self._loading: dict[ChecksumAddress, asyncio.Future[LaunchState]] = {}
+        self.last_block = 0
+
+    @classmethod
+    async def create(cls, launchpad: Launchpad, virtual_base: int, virtual_quote: int) -> "LaunchpadQuoter":
+        """Create a quoter for the launchpad's current bonding curve, reading BONDING_SUPPLY."""
+        bonding_supply, curve_address = await asyncio.gather(launchpad.bonding_supply(), launchpad.bonding_curve())
+        return cls(launchpad, BondingCurve(virtual_base, virtual_quote, bonding_supply), curve_address)
+
+    async def get_launch(self, token: ChecksumAddress) -> LaunchState:
+        """Curve position of a launch, read from the chain on first use."""
+        state = self._launches.get(token)
+        if state is not None:
+            return state
+        task = self._loading.get(token)
+        if task is None:
+            task = self._loading[token] = asyncio.ensure_future(self._load(token))
+            task.add_done_callback(lambda _: self._loading.pop(token, None))
+        return await task
+
+    async def _load(self, token: ChecksumAddress, block_number: int | None = None) -> LaunchState:
+        if block_number is None:
+            block_number = await self._launchpad.web3.eth.block_number
+        launch = LaunchData(*await self._launchpad.contract.functions.launches(token).call(block_identifier=block_number))
+        if token not in self._matches:
+            self._matches[token] = await self._check_curve(token, launch, block_number)
+        state = self._launches.get(token)
+        if state is not None and (state.block_number, state.log_index) > (block_number, _AFTER_BLOCK):
+            # A newer Swap arrived while the call was in flight
+            return state
+        state = LaunchState(
+            token, launch.active, to_checksum_address(launch.bonding_curve), launch.base_sold_from_curve,
+            launch.quote_bought_by_curve, block_number, _AFTER_BLOCK, time.monotonic(),
+        )
+        self._launches[token] = state
+        logger.debug(f"Loaded launch {token}: {state}")
+        return state
+
+    async def _check_curve(self, token: ChecksumAddress, launch: LaunchData, block_number: int) -> bool:
+        """Whether a launch follows self.curve: same curve contract and the same quote for one size."""
+        if to_checksum_address(launch.bonding_curve) != self.curve_address:
+            logger.warning(f"Launch {token} uses bonding curve {launch.bonding_curve}, not {self.curve_address}")
+            return False
+        remaining = self.curve.bonding_supply - launch.base_sold_from_curve
+        if not launch.active or remaining <= 0:
+            return True
+        # Virtual reserves and quoteScaling of the launch both show in the quote
+        size = max(1, min(remaining // 2, self.curve.bonding_supply // 100))
+        local = self.curve.quote_quote_for_base(launch.base_sold_from_curve, launch.quote_bought_by_curve, size, True)
+        remote = await self._launchpad.contract.functions.quoteQuoteForBase(token, size, True).call(
+            block_identifier=block_number
+        )
+        if local != remote:
+            logger.warning(f"Launch {token} does not follow the configured curve: {size} base costs {remote}, model {local}")
+        return local == remote
+
+    async def supports(self, token: ChecksumAddress) -> bool:
+        """Whether a token's launch follows the configured curve, so the quoter can price it."""
+        await self.get_launch(token)
+        return self._matches[token]
+
+    async def refresh(self, token: ChecksumAddress) -> LaunchState:
+        """Re-read the LaunchData of a token."""
+        self._launches.pop(token, None)
+        return await self.get_launch(token)
+
+    def on_log(self, log: LogReceipt | dict[str, Any]):
+        """Apply a Swap or BondingLocked log of a loaded launch."""
+        topics = log.get("topics") or []
+        event_abi = _EVENT_ABIS.get(bytes(HexBytes(topics[0]))) if topics else None
+        if event_abi is None or to_checksum_address(log["address"]) != self._launchpad.address:
+            return
+        event = get_event_data(_CODEC, event_abi, log)
+        args = event["args"]
+        state = self._launches.get(to_checksum_address(args["token"]))
+        position = (log["blockNumber"], log["logIndex"])
+        if state is None or position <= (state.block_number, state.log_index):
+            return
+        if event["event"] == "BondingLocked":
+            state.active = False
+        else:
+            # quoteDelta is signed from the trader's side; the curve moves the other way
+            if args["nextAmountSold"] >= state.base_sold:
+                state.quote_bought += abs(args["quoteDelta"])
+            else:
+                state.quote_bought -= abs(args["quoteDelta"])
+            state.base_sold = args["nextAmountSold"]
+        state.block_number, state.log_index = position
+        state.updated_at = time.monotonic()
+
+    async def poll_logs(self, to_block: int | None = None) -> int:
+        """
+        Apply the launchpad's Swap and BondingLocked logs since the last poll, in one eth_getLogs.
+
+        Returns:
+            Number of logs fetched
+        """
+        if not self._launches:
+            return 0
+        web3 = self._launchpad.web3
+        if to_block is None:
+            to_block = await web3.eth.block_number
+        from_block = self.last_block + 1 if self.last_block else to_block
+        if from_block > to_block:
+            return 0
+        logs = await web3.eth.get_logs({
+            "address": self._launchpad.address,
+            "topics": [LOG_TOPICS],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        for log in logs:
+            self.on_log(log)
+        self.last_block = to_block
+        return len(logs)
+
+    async def _active_launch(self, token: ChecksumAddress) -> LaunchState:
+        state = await self.get_launch(token)
+        if not self._matches[token]:
+            raise ValueError(f"Launch {token} does not follow the configured bonding curve")
+        if not state.active:
+            raise ValueError(f"Launchpad: BondingInactive for {token}")
+        return state
+
+    async def quote_base_for_quote(self, token: ChecksumAddress, quote_amount: int, is_buy: bool) -> int:
+        """Same result as Launchpad.quote_base_for_quote, without an RPC once the launch is loaded."""
+        state = await self._active_launch(token)
+        return self.curve.quote_base_for_quote(state.base_sold, state.quote_bought, quote_amount, is_buy)
+
+    async def quote_quote_for_base(self, token: ChecksumAddress, base_amount: int, is_buy: bool) -> int:
+        """Same result as Launchpad.quote_quote_for_base, without an RPC once the launch is loaded."""
+        state = await self._active_launch(token)
+        return self.curve.quote_quote_for_base(state.base_sold, state.quote_bought, base_amount, is_buy)
+
+    async def quote_base_for_quote_many(self, token: ChecksumAddress, quote_amounts: Iterable[int], is_buy: bool) -> list[int]:
+        """quote_base_for_quote of every size against the same curve position."""
+        state = await self._active_launch(token)
+        quote = self.curve.quote_base_for_quote
+        return [quote(state.base_sold, state.quote_bought, amount, is_buy) for amount in quote_amounts]
+
+    async def quote_quote_for_base_many(self, token: ChecksumAddress, base_amounts: Iterable[int], is_buy: bool) -> list[int]:
+        """quote_quote_for_base of every size against the same curve position."""
+        state = await self._active_launch(token)
+        quote = self.curve.quote_quote_for_base
+        return [quote(state.base_sold, state.quote_bought, amount, is_buy) for amount in base_amounts]
+
+    async def verify(self, token: ChecksumAddress, base_amounts: Iterable[int]) -> list[tuple[int, int, int]]:
+        """
+        Compare local buy quotes with Launchpad.quote_quote_for_base, both at the latest block.
+
+        Returns:
+            (base_amount, local, on-chain) of every size that differs; empty if the model matches
+        """
+        block_number = await self._launchpad.web3.eth.block_number
+        self._launches.pop(token, None)
+        self._matches.pop(token, None)
+        state = await self._load(token, block_number)
+        base_amounts = list(base_amounts)
+        local = [self.curve.quote_quote_for_base(state.base_sold, state.quote_bought, a, True) for a in base_amounts]
+        remote = await asyncio.gather(*(
+            self._launchpad.contract.functions.quoteQuoteForBase(token, amount, True).call(block_identifier=block_number)
+            for amount in base_amounts
+        ))
+        mismatches = [(a, l, r) for a, l, r in zip(base_amounts, local, remote) if l != r]
+        if mismatches:
+            logger.warning(f"Bonding curve model differs from the launchpad for {token} at block {block_number}: {mismatches}")
+        return mismatches
@@ -0,0 +1,114 @@
+"""
+Find an account's resting CLOB orders from chain state alone.
+
+The REST open_orders endpoint is the usual source of order ids for a mass cancel. When it
+is unavailable, the book itself holds the same information: every price level is a
+(num_orders, head_order) Limit whose orders form a linked list. OrderDiscovery walks
+the bid side down from the best bid and the ask side up from the best ask, pinned to one
+block. Both sides are walked concurrently. Each level's orders are paged with getNextOrders
+while the walk moves on to the next price, so the cost is about one call round trip per
+level rather than one per order.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from eth_typing import ChecksumAddress
+from eth_utils.address import to_checksum_address
+
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.structs import Limit, Order, OrderSide
+
+logger = logging.getLogger(__name__)
+
+# Price trees report an empty side or the end of a side with 0 or uint256 max
+_NO_PRICE = (0, 2**256 - 1)
+
+
+@dataclass(frozen=True)
+class OnChainOrder:
+    """A resting order as stored by the CLOB, in atomic units."""
+    order_id: int
+    side: OrderSide
+    price: int
+    amount: int
+    cancel_timestamp: int  # 0 for orders without an expiry
+
+
+class OrderDiscovery:
+    """Resting orders of one owner, read by walking a CLOB's price levels."""
+
+    def __init__(self, clob: Clob, page_size: int = 100, max_levels: int | None = None):
+        """
+        Initialize the discovery.
+
+        Args:
+            clob: CLOB contract to read
+            page_size: Orders read per getNextOrders call
+            max_levels: Price levels walked per side, best first (None for the whole book)
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        self._clob = clob
+        self._functions = clob.contract.functions
+        self.page_size = page_size
+        self.max_levels = max_levels
+
+    async def find_orders(self, owner: ChecksumAddress, block_number: int | None = None) -> list[OnChainOrder]:
+        """
+        Every order of owner resting on the book at one block.
+
+        Args:
+            owner: Account whose orders are returned
+            block_number: Block to read (the latest block by default)
+
+        Returns:
+            The orders, bids best first and then asks best first
+        """
+        owner = to_checksum_address(owner)
+        if block_number is None:
+            block_number = await self._clob.web3.eth.block_number
+        max_bid, min_ask = await self._functions.getTOB().call(block_identifier=block_number)
+        bids, asks = await asyncio.gather(
+            self._walk_side(owner, OrderSide.BUY, max_bid, block_number),
+            self._walk_side(owner, OrderSide.SELL, min_ask, block_number),
+        )
+        logger.debug(f"Found {len(bids)} bids and {len(asks)} asks of {owner} on {self._clob.address} at block {block_number}")
+        return bids + asks
+
+    async def _walk_side(self, owner: ChecksumAddress, side: OrderSide, price: int, block_number: int) -> list[OnChainOrder]:
+        # Bids are walked down from the best bid, asks up from the best ask
+        next_price = self._functions.getNextSmallestPrice if side == OrderSide.BUY else self._functions.getNextBiggestPrice
+        levels = []
+        while price not in _NO_PRICE and (self.max_levels is None or len(levels) < self.max_levels):
+            levels.append(asyncio.ensure_future(self._read_level(owner, side, price, block_number)))
+            following = await next_price(price, side).call(block_identifier=block_number)
+            if (following >= price) if side == OrderSide.BUY else (following <= price):
+                break
+            price = following
+        try:
+            return [order for level in await asyncio.gather(*levels) for order in level]
+        except BaseException:
+            for level in levels:
+                level.cancel()
+            raise
+
+    async def _read_level(self, owner: ChecksumAddress, side: OrderSide, price: int, block_number: int) -> list[OnChainOrder]:
+        limit = Limit(*await self._functions.getLimit(price, side).call(block_identifier=block_number))
+        orders = []
+        order_id = limit.head_order
+        remaining = limit.num_orders
+        while remaining > 0 and order_id:
+            page = [
+                Order(*raw) for raw in
+                await self._functions.getNextOrders(order_id, min(remaining, self.page_size)).call(block_identifier=block_number)
+            ]
+            if not page:
+                break
+            for order in page:
+                if order.owner == owner and order.price == price and order.amount > 0:
+                    orders.append(OnChainOrder(order.id_, side, order.price, order.amount, order.cancel_timestamp))
+            remaining -= len(page)
+            order_id = page[-1].next_order_id
+        return orders
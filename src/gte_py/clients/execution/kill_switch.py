@@ -0,0 +1,174 @@
+"""
+Pre-signed cancels for every open order, broadcast in one write on trigger.
+
+cancel_all_orders encodes, signs and sends when it is called, which is exactly when the event
+loop is likely to be busiest. KillSwitch keeps one clob_cancel per market (split into chunks of
+max_orders_per_tx) built from the OrderStore and signed at the nonces the scheduler will hand
+out next. A cheap local check re-signs them only when the open orders or the next nonce
+changed; signing reuses the encoded calldata and needs no RPC (no simulation or gas
+estimation, so pass gas=... for a tight limit). trigger() then broadcasts the whole set in one JSON-RPC batch. If the signatures went stale in the meantime,
+or orders were placed after the last signing, the rest is cancelled through send_many.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from eth_account.datastructures import SignedTransaction
+from eth_account.types import TransactionDictType
+from eth_typing import ChecksumAddress
+
+from gte_py.api.chain.utils import BatchSendResult, TxLane, TypedContractFunction
+from gte_py.clients.execution import ExecutionClient
+from gte_py.models import Market
+
+logger = logging.getLogger(__name__)
+
+# Open order ids per market, the state the signed cancels cover
+OrderKey = tuple[tuple[ChecksumAddress, tuple[int, ...]], ...]
+
+
+class KillSwitch:
+    """Cancel transactions for every open order, kept signed ahead of time."""
+
+    def __init__(
+        self,
+        execution: ExecutionClient,
+        markets: list[Market],
+        max_orders_per_tx: int = 100,
+        refresh_interval: float = 0.1,
+        **kwargs,
+    ):
+        """
+        Initialize the kill switch.
+
+        Args:
+            execution: Execution client with an OrderStore (order_store=...) and a signing account
+            markets: Markets whose open orders are cancelled
+            max_orders_per_tx: Order ids per clob_cancel transaction
+            refresh_interval: Seconds between local checks for changed orders or nonces while
+                started; the cancels are only signed again when one of them changed
+            **kwargs: Transaction parameters for the cancels (e.g. gas, maxFeePerGas)
+        """
+        if execution.orders is None:
+            raise ValueError("KillSwitch needs an execution client with an order store")
+        if max_orders_per_tx <= 0:
+            raise ValueError(f"max_orders_per_tx must be positive, got {max_orders_per_tx}")
+        self._execution = execution
+        self._markets = list(markets)
+        self._max_orders_per_tx = max_orders_per_tx
+        self._refresh_interval = refresh_interval
+        self._tx_kwargs = kwargs
+        self._key: OrderKey | None = None
+        self._funcs: list[TypedContractFunction[Any]] = []
+        # Cancels and their calldata built for an order key, reused while only the nonce moves
+        self._built: tuple[OrderKey, list[TypedContractFunction[Any]], list[str]] | None = None
+        self._presigned: list[tuple[SignedTransaction, TransactionDictType]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def armed(self) -> bool:
+        """Whether the signed cancels cover the current open orders at the next nonce."""
+        if self._key is None or self._key != self._order_key():
+            return False
+        return not self._presigned or self._presigned[0][1]["nonce"] == self._execution.scheduler.sign_ahead_nonce()
+
+    def _order_key(self) -> OrderKey:
+        store = self._execution.orders
+        assert store is not None
+        return tuple((market.address, tuple(sorted(store.open_order_ids(market.address)))) for market in self._markets)
+
+    def _cancel_funcs(self, key: OrderKey) -> list[TypedContractFunction[Any]]:
+        markets = {market.address: market for market in self._markets}
+        size = self._max_orders_per_tx
+        return [
+            self._execution.cancel_order_tx(market=markets[address], order_ids=list(order_ids[i:i + size]), **self._tx_kwargs)
+            for address, order_ids in key
+            for i in range(0, len(order_ids), size)
+        ]
+
+    async def refresh(self) -> bool:
+        """
+        Re-sign the cancels if the open orders or the next nonce changed.
+
+        Returns:
+            True if the cancels were signed again
+        """
+        if self.armed:
+            return False
+        key = self._order_key()
+        if self._built is None or self._built[0] != key:
+            funcs = self._cancel_funcs(key)
+            self._built = key, funcs, [func.func_call._encode_transaction_data() for func in funcs]
+        _, funcs, datas = self._built
+        try:
+            presigned = await self._execution.scheduler.sign_ahead(funcs, lane=TxLane.CANCEL, datas=datas)
+        except RuntimeError as e:
+            # Released nonces are pending reuse; the next check signs once they are filled
+            logger.debug(f"Kill switch not re-signed: {e}")
+            self._key = None
+            return False
+        self._key, self._funcs, self._presigned = key, funcs, presigned
+        logger.debug(f"Kill switch signed {len(funcs)} cancels for {sum(len(ids) for _, ids in key)} orders")
+        return True
+
+    async def start(self):
+        """Sign the cancels and keep them current in the background."""
+        if self._task is not None:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop refreshing; the cancels signed last are dropped."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._key, self._funcs, self._presigned, self._built = None, [], [], None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Kill switch refresh failed: {e}")
+
+    async def trigger(self) -> list[BatchSendResult]:
+        """
+        Cancel every open order of the markets now.
+
+        The signed cancels go out in one batch. Cancels for orders placed since the last
+        signing, or all cancels if the signed nonces were taken meanwhile, are signed and sent
+        afterwards through send_many.
+
+        Returns:
+            One BatchSendResult per cancel transaction sent
+        """
+        scheduler = self._execution.scheduler
+        key, funcs, presigned = self._key, self._funcs, self._presigned
+        self._key, self._funcs, self._presigned, self._built = None, [], [], None
+
+        results: list[BatchSendResult] = []
+        covered: set[tuple[ChecksumAddress, int]] = set()
+        if key is not None:
+            sent = await scheduler.send_presigned(funcs, presigned, lane=TxLane.CANCEL)
+            if sent is None:
+                logger.warning("Kill switch cancels were stale, signing them again")
+            else:
+                results = sent
+                covered = {(address, order_id) for address, order_ids in key for order_id in order_ids}
+
+        remaining = tuple(
+            (address, tuple(order_id for order_id in order_ids if (address, order_id) not in covered))
+            for address, order_ids in self._order_key()
+        )
+        late = self._cancel_funcs(remaining)
+        if late:
+            results += await scheduler.send_many(late, lane=TxLane.CANCEL)
+        logger.info(f"Kill switch sent {len(results)} cancel transactions, {sum(r.ok for r in results)} accepted")
+        return results
@@ -0,0 +1,364 @@
+"""
+In-memory order management for our own CLOB orders.
+
+OrderStore keeps the state of every order placed by one account, keyed by (market, order id)
+and (market, client order id). It is fed by transaction receipts (LimitOrderSubmitted,
+LimitOrderProcessed, FillOrderSubmitted, FillOrderProcessed) and by CLOB logs
+(OrderMatched, OrderAmended, OrderCanceled); the REST open orders endpoint is only used to
+reconcile. Lookups never touch the network.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Iterable
+
+from eth_typing import ChecksumAddress
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.events import get_event_data
+from web3.types import EventData, LogReceipt, TxReceipt
+
+from gte_py.api.chain.structs import FillOrderType, LimitOrderType, OrderSide
+from gte_py.api.chain.utils import load_abi
+from gte_py.models import Market, Order, OrderStatus, OrderType, TimeInForce
+
+logger = logging.getLogger(__name__)
+
+TRACKED_EVENTS = (
+    "LimitOrderSubmitted",
+    "LimitOrderProcessed",
+    "FillOrderSubmitted",
+    "FillOrderProcessed",
+    "OrderMatched",
+    "OrderAmended",
+    "OrderCanceled",
+)
+
+_CODEC = AsyncWeb3().codec
+_EVENT_ABIS: dict[bytes, dict[str, Any]] = {
+    event_abi_to_log_topic(entry): entry
+    for entry in load_abi("clob")
+    if entry.get("type") == "event" and entry["name"] in TRACKED_EVENTS
+}
+
+# Topics to pass to eth_getLogs for the events that change our resting orders
+LOG_TOPICS = [HexBytes(topic).to_0x_hex() for topic in _EVENT_ABIS]
+
+_TERMINAL = (OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.EXPIRED, OrderStatus.REJECTED)
+
+
+def decode_clob_log(log: LogReceipt | dict[str, Any]) -> EventData | None:
+    """Decode a CLOB log into EventData, or None if it is not an order event."""
+    topics = log.get("topics") or []
+    if not topics:
+        return None
+    event_abi = _EVENT_ABIS.get(bytes(HexBytes(topics[0])))
+    if event_abi is None:
+        return None
+    return get_event_data(_CODEC, event_abi, log)
+
+
+class OrderStore:
+    """Local view of one account's CLOB orders."""
+
+    def __init__(self, account: ChecksumAddress, max_seen_logs: int = 10_000):
+        """
+        Initialize the order store.
+
+        Args:
+            account: Owner whose orders are tracked; other owners' events are ignored
+            max_seen_logs: Number of recent (tx hash, log index) pairs remembered, so a log
+                delivered by both a receipt and a log poll is only applied once
+        """
+        self.account = to_checksum_address(account)
+        self._orders: dict[tuple[ChecksumAddress, int], Order] = {}
+        self._client_ids: dict[tuple[ChecksumAddress, int], int] = {}
+        self._open: dict[ChecksumAddress, dict[int, Order]] = {}
+        self._seen_logs: OrderedDict[tuple[bytes, int], None] = OrderedDict()
+        self._max_seen_logs = max_seen_logs
+        self.last_block = 0
+
+    # ================= LOOKUPS =================
+
+    def get(self, market_address: ChecksumAddress, order_id: int) -> Order | None:
+        return self._orders.get((market_address, order_id))
+
+    def get_by_client_id(self, market_address: ChecksumAddress, client_order_id: int) -> Order | None:
+        order_id = self._client_ids.get((market_address, client_order_id))
+        return None if order_id is None else self._orders.get((market_address, order_id))
+
+    def open_orders(self, market_address: ChecksumAddress | None = None) -> list[Order]:
+        """Open orders of one market, or of every market."""
+        if market_address is not None:
+            return list(self._open.get(market_address, {}).values())
+        return [order for orders in self._open.values() for order in orders.values()]
+
+    def open_order_ids(self, market_address: ChecksumAddress) -> list[int]:
+        return list(self._open.get(market_address, {}))
+
+    def remaining(self, market_address: ChecksumAddress, order_id: int) -> int:
+        """Remaining size in base atomic units (0 for unknown or closed orders)."""
+        order = self._open.get(market_address, {}).get(order_id)
+        return (order.remaining_amount or 0) if order else 0
+
+    def filled(self, market_address: ChecksumAddress, order_id: int) -> int:
+        """Filled size in base atomic units."""
+        order = self._orders.get((market_address, order_id))
+        return (order.filled_amount or 0) if order else 0
+
+    # ================= UPDATES =================
+
+    def on_receipt(self, receipt: TxReceipt | dict[str, Any]):
+        """Apply every order event in a receipt; use as a scheduler receipt listener."""
+        for log in receipt.get("logs", []):
+            self.on_log(log)
+
+    def on_log(self, log: LogReceipt | dict[str, Any]):
+        """Apply a single CLOB log; logs of other contracts or events are ignored."""
+        try:
+            event = decode_clob_log(log)
+        except Exception as e:
+            logger.debug(f"Skipping undecodable log: {e}")
+            return
+        if event is None:
+            return
+
+        key = (bytes(HexBytes(event["transactionHash"])), event["logIndex"])
+        if key in self._seen_logs:
+            return
+        self._seen_logs[key] = None
+        if len(self._seen_logs) > self._max_seen_logs:
+            self._seen_logs.popitem(last=False)
+        self.last_block = max(self.last_block, event["blockNumber"] or 0)
+
+        handler = getattr(self, f"_on_{event['event']}")
+        handler(to_checksum_address(event["address"]), event["args"], event)
+
+    def _upsert(self, market: ChecksumAddress, order_id: int, **fields: Any) -> Order:
+        order = self._orders.get((market, order_id))
+        if order is None:
+            defaults: dict[str, Any] = dict(
+                order_id=order_id,
+                market_address=market,
+                side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                price=None,
+                time_in_force=TimeInForce.GTC,
+                status=OrderStatus.OPEN,
+                remaining_amount=0,
+                original_amount=0,
+                filled_amount=0,
+                owner=self.account,
+                placed_at=int(time.time() * 1000),
+            )
+            order = self._orders[(market, order_id)] = Order(**{**defaults, **fields})
+        else:
+            for name, value in fields.items():
+                setattr(order, name, value)
+        self._refresh_open(order)
+        return order
+
+    def _refresh_open(self, order: Order):
+        market = to_checksum_address(order.market_address)
+        if order.status == OrderStatus.OPEN and (order.remaining_amount or 0) > 0:
+            self._open.setdefault(market, {})[order.order_id] = order
+        else:
+            open_orders = self._open.get(market)
+            if open_orders is not None:
+                open_orders.pop(order.order_id, None)
+
+    def _on_LimitOrderSubmitted(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        if to_checksum_address(args["owner"]) != self.account:
+            return
+        order_args = args["args"]
+        order = self._upsert(
+            market,
+            args["orderId"],
+            side=OrderSide(order_args["side"]),
+            order_type=OrderType.LIMIT,
+            price=order_args["price"],
+            time_in_force=TimeInForce.POST_ONLY
+            if order_args["limitOrderType"] == LimitOrderType.POST_ONLY
+            else TimeInForce.GTC,
+            original_amount=order_args["amountInBase"],
+            client_order_id=order_args["clientOrderId"] or None,
+            txn_hash=HexBytes(event["transactionHash"]),
+        )
+        if order.client_order_id:
+            self._client_ids[(market, order.client_order_id)] = order.order_id
+
+    def _on_LimitOrderProcessed(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        if to_checksum_address(args["account"]) != self.account:
+            return
+        filled = abs(args["baseTokenAmountTraded"])
+        posted = args["amountPostedInBase"]
+        if posted > 0:
+            status = OrderStatus.OPEN
+        elif filled > 0:
+            status = OrderStatus.FILLED
+        else:
+            # Nothing traded and nothing posted, e.g. a post-only order that would have crossed
+            status = OrderStatus.REJECTED
+        self._upsert(market, args["orderId"], remaining_amount=posted, filled_amount=filled, status=status)
+
+    def _on_FillOrderSubmitted(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        if to_checksum_address(args["owner"]) != self.account:
+            return
+        fill_args = args["args"]
+        self._upsert(
+            market,
+            args["orderId"],
+            side=OrderSide(fill_args["side"]),
+            order_type=OrderType.MARKET,
+            price=fill_args["priceLimit"],
+            time_in_force=TimeInForce.FOK
+            if fill_args["fillOrderType"] == FillOrderType.FILL_OR_KILL
+            else TimeInForce.IOC,
+            original_amount=fill_args["amount"] if fill_args["amountIsBase"] else None,
+            txn_hash=HexBytes(event["transactionHash"]),
+        )
+
+    def _on_FillOrderProcessed(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        if to_checksum_address(args["account"]) != self.account:
+            return
+        filled = abs(args["baseTokenAmountTraded"])
+        self._upsert(
+            market,
+            args["orderId"],
+            order_type=OrderType.MARKET,
+            remaining_amount=0,
+            filled_amount=filled,
+            status=OrderStatus.FILLED if filled > 0 else OrderStatus.CANCELLED,
+            filled_at=int(time.time() * 1000) if filled > 0 else None,
+        )
+
+    def _on_OrderMatched(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        # Our taker orders are settled by their Processed event; only resting orders change here
+        maker = args["makerOrder"]
+        if to_checksum_address(maker["owner"]) != self.account:
+            return
+        order = self._orders.get((market, args["makerOrderId"]))
+        traded = args["tradedBase"]
+        if order is None:
+            order = self._upsert(
+                market,
+                args["makerOrderId"],
+                side=OrderSide(maker["side"]),
+                price=maker["price"],
+                remaining_amount=maker["amount"],
+            )
+        remaining = max((order.remaining_amount or 0) - traded, 0)
+        self._upsert(
+            market,
+            order.order_id,
+            remaining_amount=remaining,
+            filled_amount=(order.filled_amount or 0) + traded,
+            status=OrderStatus.OPEN if remaining > 0 else OrderStatus.FILLED,
+            filled_at=int(time.time() * 1000),
+        )
+
+    def _on_OrderAmended(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        pre_amend = args["preAmend"]
+        if to_checksum_address(pre_amend["owner"]) != self.account:
+            return
+        amend_args = args["args"]
+        self._upsert(
+            market,
+            amend_args["orderId"],
+            side=OrderSide(amend_args["side"]),
+            price=amend_args["price"],
+            remaining_amount=amend_args["amountInBase"],
+            status=OrderStatus.OPEN if amend_args["amountInBase"] > 0 else OrderStatus.CANCELLED,
+        )
+
+    def _on_OrderCanceled(self, market: ChecksumAddress, args: dict[str, Any], event: EventData):
+        if to_checksum_address(args["owner"]) != self.account:
+            return
+        self._upsert(market, args["orderId"], remaining_amount=0, status=OrderStatus.CANCELLED)
+
+    # ================= SYNC =================
+
+    async def poll_logs(
+        self, web3: AsyncWeb3, market_addresses: Iterable[ChecksumAddress], to_block: int | None = None
+    ) -> int:
+        """
+        Apply the order events of some markets since the last block seen, in one eth_getLogs.
+
+        Catches fills of resting orders by other accounts' transactions, which never appear in
+        our own receipts. Meant for a background task, not the trading path.
+
+        Returns:
+            Number of logs fetched
+        """
+        if to_block is None:
+            to_block = await web3.eth.block_number
+        from_block = self.last_block + 1 if self.last_block else to_block
+        if from_block > to_block:
+            return 0
+        logs = await web3.eth.get_logs({
+            "address": list(market_addresses),
+            "topics": [LOG_TOPICS],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        for log in logs:
+            self.on_log(log)
+        self.last_block = max(self.last_block, to_block)
+        return len(logs)
+
+    def reconcile(self, market: Market, rest_orders: Iterable[dict[str, Any]], grace_ms: int = 10_000) -> int:
+        """
+        Reconcile one market with the REST open orders endpoint.
+
+        Orders the API reports but the store does not know are added. Orders the store holds as
+        open that the API no longer lists are dropped, unless they were placed within grace_ms
+        (the API lags the chain).
+
+        Args:
+            market: Market the orders belong to
+            rest_orders: Response of InfoClient.get_user_open_orders
+            grace_ms: Minimum age of a local order before the API may close it
+
+        Returns:
+            Number of orders added or closed
+        """
+        changes = 0
+        reported: set[int] = set()
+        for data in rest_orders:
+            order_id = int(data["orderId"])
+            reported.add(order_id)
+            if order_id in self._open.get(market.address, {}):
+                continue
+            original = market.base.convert_quantity_to_amount(Decimal(data["originalSize"]))
+            filled = market.base.convert_quantity_to_amount(Decimal(data.get("sizeFilled") or 0))
+            self._upsert(
+                market.address,
+                order_id,
+                side=OrderSide.BUY if data.get("side") == "bid" else OrderSide.SELL,
+                price=market.quote.convert_quantity_to_amount(Decimal(data["limitPrice"])),
+                original_amount=original,
+                filled_amount=filled,
+                remaining_amount=original - filled,
+                status=OrderStatus.OPEN,
+                placed_at=data.get("placedAt"),
+            )
+            changes += 1
+
+        cutoff = int(time.time() * 1000) - grace_ms
+        for order in self.open_orders(market.address):
+            if order.order_id not in reported and (order.placed_at or 0) < cutoff:
+                self._upsert(market.address, order.order_id, remaining_amount=0, status=OrderStatus.CANCELLED)
+                changes += 1
+        return changes
+
+    def forget_closed(self):
+        """Drop closed orders to bound memory; open orders are kept."""
+        for key, order in list(self._orders.items()):
+            if order.status in _TERMINAL:
+                del self._orders[key]
+                if order.client_order_id:
+                    self._client_ids.pop((key[0], order.client_order_id), None)
@@ -0,0 +1,253 @@
+"""
+Desired-quote reconciliation for market makers.
+
+A strategy states the ladder it wants to show on a market; the QuotingEngine diffs it against
+the orders currently resting there and sends the smallest set of transactions that turns one
+into the other: unchanged levels are left alone, moved levels are amended in place, surplus
+orders are cancelled in a single clobCancel and missing levels are posted.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Iterable
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import BatchSendResult, TxLane
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.rules import MarketRules
+from gte_py.models import Market, Order, OrderStatus, TimeInForce
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Quote:
+    """A resting order the strategy wants on the book."""
+    side: OrderSide
+    price: Decimal
+    size: Decimal
+
+
+@dataclass(frozen=True)
+class AmendInstruction:
+    """Move a live order to a new price and size (atomic units)."""
+    order_id: int
+    side: OrderSide
+    amount: int
+    price: int
+
+
+@dataclass(frozen=True)
+class PostInstruction:
+    """Post a new limit order (atomic units)."""
+    side: OrderSide
+    amount: int
+    price: int
+
+
+@dataclass
+class QuotePlan:
+    """Actions that reconcile the live orders of one market with its target ladder."""
+    amends: list[AmendInstruction] = field(default_factory=list)
+    cancels: list[int] = field(default_factory=list)
+    posts: list[PostInstruction] = field(default_factory=list)
+    kept: list[int] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.amends or self.cancels or self.posts)
+
+    @property
+    def transaction_count(self) -> int:
+        """Transactions needed to execute the plan; all cancels share one."""
+        return len(self.amends) + len(self.posts) + (1 if self.cancels else 0)
+
+
+@dataclass
+class RequoteResult:
+    """Outcome of QuotingEngine.requote."""
+    plan: QuotePlan
+    cancel_tx: str | None = None
+    amend_results: list[BatchSendResult] = field(default_factory=list)
+    post_results: list[BatchSendResult] = field(default_factory=list)
+
+
+def _best_first(side: OrderSide, price: int) -> int:
+    return -price if side == OrderSide.BUY else price
+
+
+def reconcile(
+    market: Market,
+    quotes: Iterable[Quote],
+    live_orders: Iterable[Order],
+    size_tolerance: Decimal = Decimal(0),
+    use_amends: bool = True,
+    rules: MarketRules | None = None,
+) -> QuotePlan:
+    """
+    Diff a target ladder against the live orders of a market.
+
+    Per side, a live order at a target price whose remaining size is within size_tolerance of
+    the target is kept as is. The remaining targets and live orders are paired best price
+    first and amended; surplus live orders are cancelled and surplus targets posted.
+
+    Args:
+        market: Market being quoted
+        quotes: Target ladder; zero-size quotes are ignored
+        live_orders: Our resting orders on this market (non-open orders are ignored)
+        size_tolerance: Relative size difference below which a level is left untouched
+        use_amends: Pair moved levels into amends; when False they are cancelled and reposted
+        rules: Market rules; target prices are then rounded passively to the tick size and
+            targets below the minimum order size are dropped
+
+    Returns:
+        QuotePlan with amends, cancels and posts in atomic units
+    """
+    plan = QuotePlan()
+    quotes = list(quotes)
+    live_orders = [order for order in live_orders if order.status == OrderStatus.OPEN]
+
+    for side in (OrderSide.BUY, OrderSide.SELL):
+        targets = [
+            (market.quote.convert_quantity_to_amount(quote.price), market.base.convert_quantity_to_amount(quote.size))
+            for quote in quotes
+            if quote.side == side
+        ]
+        if rules is not None:
+            targets = [
+                (rules.quantize_price(price, side), amount)
+                for price, amount in targets
+                if amount >= rules.min_limit_order_amount_in_base
+            ]
+        targets = [(price, amount) for price, amount in targets if amount > 0]
+        live = [order for order in live_orders if order.side == side]
+
+        # Leave levels that are already right alone
+        unmatched_targets: list[tuple[int, int]] = []
+        for price, amount in targets:
+            match = next(
+                (
+                    order for order in live
+                    if order.price == price
+                    and abs((order.remaining_amount or 0) - amount) <= amount * size_tolerance
+                ),
+                None,
+            )
+            if match is None:
+                unmatched_targets.append((price, amount))
+            else:
+                live.remove(match)
+                plan.kept.append(match.order_id)
+
+        unmatched_targets.sort(key=lambda target: _best_first(side, target[0]))
+        live.sort(key=lambda order: _best_first(side, order.price or 0))
+
+        paired = min(len(unmatched_targets), len(live)) if use_amends else 0
+        for (price, amount), order in zip(unmatched_targets[:paired], live[:paired]):
+            plan.amends.append(AmendInstruction(order.order_id, side, amount, price))
+        plan.cancels.extend(order.order_id for order in live[paired:])
+        plan.posts.extend(PostInstruction(side, amount, price) for price, amount in unmatched_targets[paired:])
+
+    return plan
+
+
+class QuotingEngine:
+    """Keeps a market's resting orders in line with a target ladder."""
+
+    def __init__(
+        self,
+        execution: ExecutionClient,
+        time_in_force: TimeInForce = TimeInForce.POST_ONLY,
+        size_tolerance: Decimal = Decimal(0),
+        use_amends: bool = True,
+    ):
+        """
+        Initialize the quoting engine.
+
+        Args:
+            execution: Execution client used to build and send transactions
+            time_in_force: Time in force of newly posted orders (GTC or POST_ONLY)
+            size_tolerance: Relative size difference below which a level is left untouched
+            use_amends: Amend moved levels in place instead of cancelling and reposting them
+        """
+        if time_in_force not in (TimeInForce.GTC, TimeInForce.POST_ONLY):
+            raise ValueError(f"Quotes must rest on the book, got time_in_force={time_in_force}")
+        self._execution = execution
+        self.time_in_force = time_in_force
+        self.size_tolerance = size_tolerance
+        self.use_amends = use_amends
+
+    def plan(
+        self, market: Market, quotes: Iterable[Quote], live_orders: Iterable[Order], rules: MarketRules | None = None
+    ) -> QuotePlan:
+        """Work out the actions of a requote without sending anything."""
+        return reconcile(market, quotes, live_orders, self.size_tolerance, self.use_amends, rules)
+
+    async def requote(
+        self, market: Market, quotes: Iterable[Quote], live_orders: Iterable[Order], **kwargs
+    ) -> RequoteResult:
+        """
+        Reconcile a market with its target ladder and send the resulting transactions.
+
+        Cancels go first as one transaction on the cancel lane, then amends as one JSON-RPC
+        batch on the amend lane, then posts as one batch on the new-order lane. Targets are
+        quantized with the market rules when the execution client enforces them.
+
+        Args:
+            market: Market being quoted
+            quotes: Target ladder
+            live_orders: Our resting orders on this market
+            **kwargs: Additional transaction parameters
+
+        Returns:
+            RequoteResult with the plan and per-transaction outcomes
+        """
+        rules = await self._execution.get_market_rules(market) if self._execution.enforce_market_rules else None
+        plan = self.plan(market, quotes, live_orders, rules)
+        result = RequoteResult(plan)
+        if plan.empty:
+            return result
+
+        execution = self._execution
+        scheduler = execution.scheduler
+        sides = {action.side for action in (*plan.amends, *plan.posts)}
+        for side in sides:
+            await execution.ensure_spot_approval(market, side, **kwargs)
+
+        if plan.cancels:
+            result.cancel_tx = await scheduler.send(
+                execution.cancel_order_tx(market=market, order_ids=plan.cancels, **kwargs), lane=TxLane.CANCEL
+            )
+        if plan.amends:
+            amends = [
+                await execution.amend_order_tx(
+                    market=market,
+                    order_id=amend.order_id,
+                    amount_in_base=amend.amount,
+                    price_in_ticks=amend.price,
+                    side=amend.side,
+                    **kwargs,
+                )
+                for amend in plan.amends
+            ]
+            result.amend_results = await scheduler.send_many(amends, lane=TxLane.AMEND)
+        if plan.posts:
+            posts = [
+                execution.place_limit_order_tx(
+                    market_address=market.address,
+                    side=post.side,
+                    amount=post.amount,
+                    price=post.price,
+                    time_in_force=self.time_in_force,
+                    **kwargs,
+                )
+                for post in plan.posts
+            ]
+            result.post_results = await scheduler.send_many(posts, lane=TxLane.NEW)
+
+        logger.info(
+            f"Requoted {market.address}: {len(plan.kept)} kept, {len(plan.amends)} amended, "
+            f"{len(plan.cancels)} cancelled, {len(plan.posts)} posted in {plan.transaction_count} transactions"
+        )
+        return result
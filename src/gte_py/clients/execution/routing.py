@@ -0,0 +1,217 @@
+"""
+Multi-hop route search over the UniswapV2 pair graph.
+
+PairGraph holds every factory pair as an edge between its two tokens, loaded from the
+factory's PairCreated logs and extended as new ones arrive. PathFinder enumerates the 1-3 hop
+paths between two tokens (capped at max_paths candidates, so the search stays bounded on
+graphs with thousands of pairs), evaluates each one with AmmQuoter against cached reserves,
+and returns the path with the best output (or the cheapest input for an exact output).
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from eth_typing import ChecksumAddress
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.events import get_event_data
+from web3.types import LogReceipt
+
+from gte_py.api.chain.utils import load_abi
+from gte_py.clients.execution.amm import AmmQuoter, get_amount_in, get_amount_out
+
+logger = logging.getLogger(__name__)
+
+_CODEC = AsyncWeb3().codec
+_PAIR_CREATED_ABI = next(
+    entry for entry in load_abi("uniswap_factory") if entry.get("type") == "event" and entry["name"] == "PairCreated"
+)
+PAIR_CREATED_TOPIC = HexBytes(event_abi_to_log_topic(_PAIR_CREATED_ABI)).to_0x_hex()
+
+
+class PairGraph:
+    """Tokens connected by UniswapV2 pairs."""
+
+    def __init__(self, factory_address: ChecksumAddress, start_block: int = 0):
+        """
+        Initialize an empty graph.
+
+        Args:
+            factory_address: UniswapV2 factory whose PairCreated logs build the graph
+            start_block: Block to read PairCreated logs from on the first poll (the factory's
+                deployment block avoids scanning the chain from genesis)
+        """
+        self.factory_address = to_checksum_address(factory_address)
+        self._neighbors: dict[ChecksumAddress, dict[ChecksumAddress, ChecksumAddress]] = {}
+        self.pair_count = 0
+        self.last_block = start_block - 1
+
+    def add_pair(self, token0: ChecksumAddress, token1: ChecksumAddress, pair_address: ChecksumAddress) -> bool:
+        """Add a pair; returns False if it was already known."""
+        token0, token1 = to_checksum_address(token0), to_checksum_address(token1)
+        if token1 in self._neighbors.get(token0, {}):
+            return False
+        pair_address = to_checksum_address(pair_address)
+        self._neighbors.setdefault(token0, {})[token1] = pair_address
+        self._neighbors.setdefault(token1, {})[token0] = pair_address
+        self.pair_count += 1
+        return True
+
+    def neighbors(self, token: ChecksumAddress) -> dict[ChecksumAddress, ChecksumAddress]:
+        """{token: pair address} of the tokens one hop away."""
+        return self._neighbors.get(token, {})
+
+    def pair_address(self, token_a: ChecksumAddress, token_b: ChecksumAddress) -> ChecksumAddress | None:
+        return self._neighbors.get(token_a, {}).get(token_b)
+
+    def on_log(self, log: LogReceipt | dict[str, Any]) -> bool:
+        """Apply a PairCreated log of the factory; returns True if it added a pair."""
+        topics = log.get("topics") or []
+        if not topics or HexBytes(topics[0]).to_0x_hex() != PAIR_CREATED_TOPIC:
+            return False
+        if to_checksum_address(log["address"]) != self.factory_address:
+            return False
+        args = get_event_data(_CODEC, _PAIR_CREATED_ABI, log)["args"]
+        return self.add_pair(args["token0"], args["token1"], args["pair"])
+
+    async def poll_logs(self, web3: AsyncWeb3, to_block: int | None = None) -> int:
+        """
+        Add the pairs created since the last poll (since start_block on the first one).
+
+        Returns:
+            Number of pairs added
+        """
+        if to_block is None:
+            to_block = await web3.eth.block_number
+        from_block = self.last_block + 1
+        if from_block > to_block:
+            return 0
+        logs = await web3.eth.get_logs({
+            "address": self.factory_address,
+            "topics": [PAIR_CREATED_TOPIC],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        added = sum(self.on_log(log) for log in logs)
+        self.last_block = to_block
+        if added:
+            logger.debug(f"Added {added} pairs, graph has {self.pair_count}")
+        return added
+
+    def paths(self, token_in: ChecksumAddress, token_out: ChecksumAddress, max_hops: int = 3) -> Iterator[list[ChecksumAddress]]:
+        """Simple paths of 1 to max_hops (at most 3) pairs, shortest first."""
+        if not 1 <= max_hops <= 3:
+            raise ValueError(f"max_hops must be between 1 and 3, got {max_hops}")
+        first = self.neighbors(token_in)
+        last = self.neighbors(token_out)
+        if token_out in first:
+            yield [token_in, token_out]
+        if max_hops < 2:
+            return
+        # Iterate over the smaller side
+        small, large = (first, last) if len(first) <= len(last) else (last, first)
+        for middle in small:
+            if middle in large and middle != token_in and middle != token_out:
+                yield [token_in, middle, token_out]
+        if max_hops < 3:
+            return
+        for hop1 in first:
+            if hop1 == token_out:
+                continue
+            for hop2 in self.neighbors(hop1):
+                if hop2 in last and hop2 != token_in and hop2 != token_out:
+                    yield [token_in, hop1, hop2, token_out]
+
+
+@dataclass
+class Route:
+    """A swap path and the router amounts along it."""
+    path: list[ChecksumAddress]
+    amounts: list[int]
+
+    @property
+    def amount_in(self) -> int:
+        return self.amounts[0]
+
+    @property
+    def amount_out(self) -> int:
+        return self.amounts[-1]
+
+
+class PathFinder:
+    """Best UniswapV2 path between two tokens, evaluated against AmmQuoter's cached reserves."""
+
+    def __init__(self, graph: PairGraph, quoter: AmmQuoter, max_hops: int = 3, max_paths: int = 64):
+        """
+        Initialize the path finder.
+
+        Args:
+            graph: Pair graph to search
+            quoter: Quoter holding the reserves; the pairs of every candidate are loaded into it
+            max_hops: Longest path considered, in pairs (1-3)
+            max_paths: Candidate paths evaluated per search, shortest first
+        """
+        self.graph = graph
+        self.quoter = quoter
+        self.max_hops = max_hops
+        self.max_paths = max_paths
+
+    def candidate_paths(self, token_in: ChecksumAddress, token_out: ChecksumAddress) -> list[list[ChecksumAddress]]:
+        candidates = []
+        for path in self.graph.paths(token_in, token_out, self.max_hops):
+            candidates.append(path)
+            if len(candidates) >= self.max_paths:
+                break
+        return candidates
+
+    async def _hop_reserves(self, paths: list[list[ChecksumAddress]]) -> dict[tuple[ChecksumAddress, ChecksumAddress], tuple[int, int]]:
+        """(reserve_in, reserve_out) of every hop of the paths, one reserve load per pair."""
+        hops = {(path[i], path[i + 1]) for path in paths for i in range(len(path) - 1)}
+        edges = {}
+        for token_a, token_b in hops:
+            edge = frozenset((token_a, token_b))
+            if edge not in edges:
+                self.quoter.register_pair(token_a, token_b, self.graph.pair_address(token_a, token_b))
+                edges[edge] = (token_a, token_b)
+        pairs = dict(zip(edges, await asyncio.gather(*(self.quoter.get_pair(a, b) for a, b in edges.values()))))
+        return {(a, b): pairs[frozenset((a, b))].reserves(a) for a, b in hops}
+
+    async def best_route_out(self, amount_in: int, token_in: ChecksumAddress, token_out: ChecksumAddress) -> Route:
+        """Path with the largest output for an exact input."""
+        paths = self.candidate_paths(token_in, token_out)
+        reserves = await self._hop_reserves(paths)
+        best = None
+        for path in paths:
+            amounts = [amount_in]
+            try:
+                for i in range(len(path) - 1):
+                    amounts.append(get_amount_out(amounts[-1], *reserves[path[i], path[i + 1]]))
+            except ValueError:
+                continue
+            if best is None or amounts[-1] > best.amount_out:
+                best = Route(path, amounts)
+        if best is None:
+            raise ValueError(f"No UniswapV2 route from {token_in} to {token_out}")
+        return best
+
+    async def best_route_in(self, amount_out: int, token_in: ChecksumAddress, token_out: ChecksumAddress) -> Route:
+        """Path with the smallest input for an exact output."""
+        paths = self.candidate_paths(token_in, token_out)
+        reserves = await self._hop_reserves(paths)
+        best = None
+        for path in paths:
+            amounts = [amount_out]
+            try:
+                for i in range(len(path) - 1, 0, -1):
+                    amounts.append(get_amount_in(amounts[-1], *reserves[path[i - 1], path[i]]))
+            except ValueError:
+                continue
+            if best is None or amounts[-1] < best.amount_in:
+                best = Route(path, amounts[::-1])
+        if best is None:
+            raise ValueError(f"No UniswapV2 route from {token_in} to {token_out}")
+        return best
@@ -0,0 +1,180 @@
+"""
+Per-market CLOB trading rules and integer-domain order quantization.
+
+A CLOB rejects limit orders whose price is not a multiple of its tick size or whose size is
+below its minimum limit order amount, after the transaction has already paid for gas.
+MarketRulesCache loads those settings once per market and keeps them current from the
+TickSizeUpdated, MinLimitOrderAmountInBaseUpdated and MaxLimitOrdersPerTxUpdated logs, so
+orders can be quantized and validated locally before they are signed.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, replace
+from typing import Any
+
+from eth_typing import ChecksumAddress
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.events import get_event_data
+from web3.types import LogReceipt
+
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.structs import MarketSettings, OrderSide
+from gte_py.api.chain.utils import load_abi
+
+logger = logging.getLogger(__name__)
+
+_CODEC = AsyncWeb3().codec
+_SETTINGS_EVENTS: dict[bytes, dict[str, Any]] = {
+    event_abi_to_log_topic(entry): entry
+    for entry in load_abi("clob")
+    if entry.get("type") == "event"
+    and entry["name"] in ("TickSizeUpdated", "MinLimitOrderAmountInBaseUpdated", "MaxLimitOrdersPerTxUpdated")
+}
+
+# Topics to pass to eth_getLogs for the events that change market rules
+LOG_TOPICS = [HexBytes(topic).to_0x_hex() for topic in _SETTINGS_EVENTS]
+
+
+@dataclass(frozen=True)
+class MarketRules:
+    """Trading rules of one CLOB; prices and amounts are in atomic units."""
+    market_address: ChecksumAddress
+    tick_size: int
+    min_limit_order_amount_in_base: int
+    max_limits_per_tx: int
+    active: bool = True
+
+    @classmethod
+    def from_settings(cls, market_address: ChecksumAddress, settings: Any) -> "MarketRules":
+        settings = MarketSettings(*settings)
+        return cls(
+            market_address=market_address,
+            tick_size=settings.tick_size,
+            min_limit_order_amount_in_base=settings.min_limit_order_amount_in_base,
+            max_limits_per_tx=settings.max_limits_per_tx,
+            active=settings.status,
+        )
+
+    def quantize_price(self, price: int, side: OrderSide, passive: bool = True) -> int:
+        """
+        Round a price to the tick size.
+
+        Passive rounding moves the price away from the spread (bids down, asks up), so a
+        resting order is never made more aggressive; otherwise bids round up and asks down.
+        """
+        tick = self.tick_size
+        if tick <= 1:
+            return price
+        round_down = (side == OrderSide.BUY) == passive
+        return price // tick * tick if round_down else -(-price // tick) * tick
+
+    def check_limit_order(self, price: int, amount: int) -> str | None:
+        """Reason a limit order would revert, or None if it passes the local checks."""
+        if not self.active:
+            return f"market {self.market_address} is not active"
+        if price <= 0:
+            return f"price {price} must be positive"
+        if self.tick_size > 1 and price % self.tick_size:
+            return f"price {price} is not a multiple of tick size {self.tick_size}"
+        if amount < self.min_limit_order_amount_in_base:
+            return f"amount {amount} is below the minimum limit order amount {self.min_limit_order_amount_in_base}"
+        return None
+
+    def validate_limit_order(self, price: int, amount: int):
+        """Raise ValueError if a limit order would revert on the tick size or minimum amount."""
+        reason = self.check_limit_order(price, amount)
+        if reason is not None:
+            raise ValueError(f"Invalid limit order: {reason}")
+
+
+class MarketRulesCache:
+    """MarketRules per CLOB, loaded once with getMarketSettings() and updated from logs."""
+
+    def __init__(self):
+        self._rules: dict[ChecksumAddress, MarketRules] = {}
+        self._loading: dict[ChecksumAddress, asyncio.Future[MarketRules]] = {}
+        self.last_block = 0
+
+    def get_cached(self, market_address: ChecksumAddress) -> MarketRules | None:
+        return self._rules.get(market_address)
+
+    async def get(self, clob: Clob) -> MarketRules:
+        """Rules of a CLOB, fetched on first use; concurrent first uses share one call."""
+        rules = self._rules.get(clob.address)
+        if rules is not None:
+            return rules
+        task = self._loading.get(clob.address)
+        if task is None:
+            address = clob.address
+            task = self._loading[address] = asyncio.ensure_future(self._load(clob))
+            task.add_done_callback(lambda _: self._loading.pop(address, None))
+        return await task
+
+    async def _load(self, clob: Clob) -> MarketRules:
+        rules = MarketRules.from_settings(clob.address, await clob.get_market_settings())
+        self._rules[clob.address] = rules
+        logger.debug(f"Loaded market rules for {clob.address}: {rules}")
+        return rules
+
+    async def refresh(self, clob: Clob) -> MarketRules:
+        """Reload the rules of a CLOB from the chain."""
+        self._rules.pop(clob.address, None)
+        return await self.get(clob)
+
+    def invalidate(self, market_address: ChecksumAddress | None = None):
+        """Forget the rules of one market, or of every market."""
+        if market_address is None:
+            self._rules.clear()
+        else:
+            self._rules.pop(market_address, None)
+
+    def on_log(self, log: LogReceipt | dict[str, Any]):
+        """Apply a TickSizeUpdated, MinLimitOrderAmountInBaseUpdated or MaxLimitOrdersPerTxUpdated log."""
+        topics = log.get("topics") or []
+        event_abi = _SETTINGS_EVENTS.get(bytes(HexBytes(topics[0]))) if topics else None
+        if event_abi is None:
+            return
+        event = get_event_data(_CODEC, event_abi, log)
+        market_address = to_checksum_address(event["address"])
+        rules = self._rules.get(market_address)
+        if rules is None:
+            # Not loaded yet; the first get() reads the new value from the chain
+            return
+        args = event["args"]
+        if event["event"] == "TickSizeUpdated":
+            rules = replace(rules, tick_size=args["newTickSize"])
+        elif event["event"] == "MinLimitOrderAmountInBaseUpdated":
+            rules = replace(rules, min_limit_order_amount_in_base=args["newMinLimitOrderAmountInBase"])
+        else:
+            rules = replace(rules, max_limits_per_tx=args["newMaxLimits"])
+        self._rules[market_address] = rules
+        logger.info(f"Market rules of {market_address} updated by {event['event']}: {rules}")
+
+    async def poll_logs(self, web3: AsyncWeb3, to_block: int | None = None) -> int:
+        """
+        Apply the settings logs of every loaded market since the last poll, in one eth_getLogs.
+
+        Returns:
+            Number of logs fetched
+        """
+        if not self._rules:
+            return 0
+        if to_block is None:
+            to_block = await web3.eth.block_number
+        from_block = self.last_block + 1 if self.last_block else to_block
+        if from_block > to_block:
+            return 0
+        logs = await web3.eth.get_logs({
+            "address": list(self._rules),
+            "topics": [LOG_TOPICS],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        for log in logs:
+            self.on_log(log)
+        self.last_block = to_block
+        return len(logs)
@@ -0,0 +1,256 @@
+"""
+Execution over several wallets, each with its own nonce sequence.
+
+One ExecutionClient sends every transaction from one account, so its throughput is bounded by a
+single nonce sequence and its pending window. ShardedExecutionClient spreads orders over N
+ExecutionClients (shards), routing each order by market, which keeps every market's orders,
+amends and cancels on one nonce sequence and so in order, or round-robin. The shards either
+trade their own balances, or all trade one funded account as operators approved with
+approve_operator. Open orders, fills and balances are read across the shards as if they were
+one account.
+"""
+
+import asyncio
+import itertools
+import logging
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Sequence
+
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
+
+from gte_py.api.chain.structs import OperatorRole, OrderSide
+from gte_py.api.chain.utils import make_web3
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.clients.info import InfoClient
+from gte_py.models import Market, Order, TimeInForce
+
+logger = logging.getLogger(__name__)
+
+
+class ShardRouting(Enum):
+    """How ShardedExecutionClient picks the shard for a new order."""
+    MARKET = "market"  # every order of a market on the same shard
+    ROUND_ROBIN = "round_robin"
+
+
+class ShardedExecutionClient:
+    """Several ExecutionClients, one per wallet, used as one account."""
+
+    def __init__(
+        self,
+        shards: Sequence[ExecutionClient],
+        routing: ShardRouting = ShardRouting.MARKET,
+        funding: ExecutionClient | None = None,
+    ):
+        """
+        Initialize the sharded client.
+
+        Args:
+            shards: Execution clients, each with its own wallet
+            routing: How new orders are assigned to shards
+            funding: Client of the funded account when the shards trade it as operators; every
+                shard must then have been created with trading_account=funding.wallet_address
+        """
+        if not shards:
+            raise ValueError("At least one shard is required")
+        if funding is not None:
+            for shard in shards:
+                if shard.trading_account != funding.wallet_address:
+                    raise ValueError(f"Shard {shard.wallet_address} does not trade for {funding.wallet_address}")
+        self._shards = list(shards)
+        self._routing = routing
+        self._funding = funding
+        self._next_shard = itertools.cycle(range(len(self._shards)))
+
+    @classmethod
+    def create(
+        cls,
+        rpc_url: str,
+        info: InfoClient,
+        gte_router_address: ChecksumAddress,
+        accounts: Sequence[LocalAccount],
+        funding_account: LocalAccount | None = None,
+        routing: ShardRouting = ShardRouting.MARKET,
+        **kwargs: Any,
+    ) -> "ShardedExecutionClient":
+        """
+        Create one ExecutionClient per account, each with its own AsyncWeb3 and OrderStore.
+
+        With a funding account the shards share a single OrderStore of that account, since every
+        order they place belongs to it; call approve_shards() once before trading.
+
+        Args:
+            rpc_url: HTTP RPC endpoint
+            info: InfoClient shared by every shard
+            gte_router_address: Address of the GTE router
+            accounts: Shard wallets
+            funding_account: Optional funded account the shards trade as operators
+            routing: How new orders are assigned to shards
+            **kwargs: Further ExecutionClient arguments applied to every shard (e.g. gas_cache)
+        """
+        def client(account: LocalAccount, **extra: Any) -> ExecutionClient:
+            web3, _ = make_web3(rpc_url, wallet_address=account.address)
+            return ExecutionClient(
+                web3=web3, info=info, gte_router_address=gte_router_address, account=account, **kwargs, **extra
+            )
+
+        if funding_account is None:
+            shards = [client(account, order_store=OrderStore(account.address)) for account in accounts]
+            return cls(shards, routing)
+        store = OrderStore(funding_account.address)
+        funding = client(funding_account)
+        shards = [
+            client(account, order_store=store, trading_account=funding_account.address) for account in accounts
+        ]
+        return cls(shards, routing, funding)
+
+    @property
+    def shards(self) -> list[ExecutionClient]:
+        """Get the shard clients."""
+        return list(self._shards)
+
+    @property
+    def funding(self) -> ExecutionClient | None:
+        """Get the client of the funded account, if the shards trade one as operators."""
+        return self._funding
+
+    def _clients(self) -> list[ExecutionClient]:
+        return self._shards + ([self._funding] if self._funding is not None else [])
+
+    async def init(self):
+        """Initialize every shard (and the funding client)."""
+        await asyncio.gather(*(client.init() for client in self._clients()))
+
+    async def close(self):
+        """Close every shard (and the funding client)."""
+        await asyncio.gather(*(client.close() for client in self._clients()))
+
+    async def approve_shards(self, roles: list[OperatorRole] | None = None, **kwargs) -> list[str]:
+        """
+        Approve every shard as an operator of the funded account, skipping shards that already
+        hold the roles.
+
+        Args:
+            roles: Roles to grant (default: ADMIN)
+            **kwargs: Additional transaction parameters
+
+        Returns:
+            Transaction hashes of the approvals sent
+        """
+        if self._funding is None:
+            raise ValueError("approve_shards needs a funding client")
+        funding = self._funding
+        roles = roles if roles is not None else [OperatorRole.ADMIN]
+        wanted = funding.encode_operator_roles(roles)
+        granted = await asyncio.gather(*(funding.get_operator_roles(shard.wallet_address) for shard in self._shards))
+        tx_hashes = []
+        for shard, current in zip(self._shards, granted):
+            if current & wanted == wanted:
+                continue
+            tx_hashes.append(await funding.approve_operator(shard.wallet_address, roles=roles, **kwargs))
+        return tx_hashes
+
+    # ================= ROUTING =================
+
+    def shard_for(self, market: Market) -> ExecutionClient:
+        """Shard a new order on market goes to."""
+        if self._routing == ShardRouting.MARKET:
+            return self._shards[int(market.address, 16) % len(self._shards)]
+        return self._shards[next(self._next_shard)]
+
+    def _market_shard(self, market: Market) -> ExecutionClient:
+        """Shard of a market without advancing the round-robin."""
+        return self.shard_for(market) if self._routing == ShardRouting.MARKET else self._shards[0]
+
+    def _owner(self, market: Market, order_id: int) -> ExecutionClient:
+        """Shard that can amend or cancel an order: its owner, or any shard of a funded account."""
+        if self._funding is None:
+            for shard in self._shards:
+                if shard.orders is not None and shard.orders.get(market.address, order_id) is not None:
+                    return shard
+            if self._routing != ShardRouting.MARKET:
+                raise ValueError(f"Order {order_id} on {market.address} is not known to any shard")
+        return self._market_shard(market)
+
+    # ================= ORDERS =================
+
+    async def place_limit_order(
+        self,
+        market: Market,
+        side: OrderSide,
+        amount: Decimal,
+        price: Decimal,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        **kwargs,
+    ):
+        """Place a limit order on the routed shard; see ExecutionClient.place_limit_order."""
+        return await self.shard_for(market).place_limit_order(market, side, amount, price, time_in_force, **kwargs)
+
+    async def place_market_order(self, market: Market, side: OrderSide, amount: Decimal, **kwargs):
+        """Place a market order on the routed shard; see ExecutionClient.place_market_order."""
+        return await self.shard_for(market).place_market_order(market, side, amount, **kwargs)
+
+    async def amend_order(self, market: Market, order_id: int, side: OrderSide, **kwargs):
+        """Amend an order through the shard that owns it; see ExecutionClient.amend_order."""
+        return await self._owner(market, order_id).amend_order(market, order_id, side, **kwargs)
+
+    async def cancel_order(self, market: Market, order_id: int, **kwargs):
+        """Cancel an order through the shard that owns it."""
+        return await self._owner(market, order_id).cancel_order(market, order_id, **kwargs)
+
+    async def cancel_all_orders(self, market: Market, **kwargs) -> list[Any]:
+        """
+        Cancel every open order on a market: once for a funded account, else per shard, concurrently.
+
+        Orders are discovered on-chain, so orders missing from the OrderStores are cancelled too.
+
+        Returns:
+            Per cancelling shard, its cancel_all_orders result (None if it had no orders)
+        """
+        shards = [self._market_shard(market)] if self._funding is not None else self._shards
+        return list(await asyncio.gather(*(shard.cancel_all_orders(market, **kwargs) for shard in shards)))
+
+    # ================= AGGREGATED VIEWS =================
+
+    def _stores(self) -> list[OrderStore]:
+        stores: dict[int, OrderStore] = {}
+        for shard in self._shards:
+            if shard.orders is not None:
+                stores.setdefault(id(shard.orders), shard.orders)
+        return list(stores.values())
+
+    def open_orders(self, market_address: ChecksumAddress | None = None) -> list[Order]:
+        """Open orders of every shard, of one market or of every market."""
+        return [order for store in self._stores() for order in store.open_orders(market_address)]
+
+    def get_order(self, market_address: ChecksumAddress, order_id: int) -> Order | None:
+        """An order of any shard."""
+        for store in self._stores():
+            order = store.get(market_address, order_id)
+            if order is not None:
+                return order
+        return None
+
+    def filled(self, market_address: ChecksumAddress, order_id: int) -> int:
+        """Filled size of an order of any shard, in base atomic units."""
+        order = self.get_order(market_address, order_id)
+        return (order.filled_amount or 0) if order else 0
+
+    async def get_balance(self, token_address: ChecksumAddress) -> tuple[Decimal, Decimal]:
+        """
+        Wallet and exchange balance of the funded account, or summed over the shards.
+
+        Returns:
+            Tuple of (wallet_balance, exchange_balance) in human-readable format
+        """
+        if self._funding is not None:
+            return await self._funding.get_balance(token_address)
+        balances = await asyncio.gather(*(shard.get_balance(token_address) for shard in self._shards))
+        return sum((w for w, _ in balances), Decimal(0)), sum((e for _, e in balances), Decimal(0))
+
+    async def get_pending_count(self) -> int:
+        """Pending transactions across every shard."""
+        return sum(await asyncio.gather(*(shard.scheduler.get_pending_count() for shard in self._shards)))
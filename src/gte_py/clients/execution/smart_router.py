@@ -0,0 +1,249 @@
+"""
+Split a spot order between the CLOB and the UniswapV2 pair of the same tokens.
+
+The CLOB leg costs the prices of the book levels it crosses; the AMM leg costs more per unit
+the more it takes from the pair. The cheapest split sends base to the AMM while its marginal
+price beats the price of the CLOB level the rest of the order would reach, which is found with
+a binary search over the AMM amount (both marginals are monotonic). plan_split works in
+atomic units on book levels and pair reserves; SmartOrderRouter reads those from the
+WebSocket-fed book cache and AmmQuoter and sends both legs in one scheduler batch.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import BatchSendResult
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.amm import AmmQuoter, get_amount_in, get_amount_out
+from gte_py.models import Market, MarketType
+
+logger = logging.getLogger(__name__)
+
+# 1000 / 997: the pair's input amount per unit that reaches the curve
+FEE_RATIO = 1000 / 997
+
+
+@dataclass
+class SplitPlan:
+    """How much base each venue fills and the quote it is expected to cost or pay, in atomic units."""
+    side: OrderSide
+    amount: int
+    clob_amount: int
+    amm_amount: int
+    clob_quote: int
+    amm_quote: int
+    clob_price_limit: int  # price of the last book level the CLOB leg crosses
+
+    @property
+    def total_quote(self) -> int:
+        return self.clob_quote + self.amm_quote
+
+
+def _clob_fill(levels: list[tuple[int, int]], amount: int, base_scale: int) -> tuple[int, int]:
+    """(quote, price of the last level) for filling amount against levels, best first."""
+    quote = 0
+    price = 0
+    remaining = amount
+    for price, size in levels:
+        take = min(size, remaining)
+        quote += take * price // base_scale
+        remaining -= take
+        if remaining <= 0:
+            break
+    if remaining > 0:
+        raise ValueError(f"Order book too thin for {amount}")
+    return quote, price
+
+
+def plan_split(
+    side: OrderSide,
+    amount: int,
+    levels: list[tuple[int, int]],
+    reserve_base: int,
+    reserve_quote: int,
+    base_scale: int,
+) -> SplitPlan:
+    """
+    Cheapest split of a base amount between a CLOB side and a UniswapV2 pair.
+
+    Args:
+        side: BUY takes the asks and buys base from the pair, SELL takes the bids and sells to it
+        amount: Base amount, atomic units
+        levels: (price, size) of the book side the order takes, best first; prices are atomic
+            quote per whole base token
+        reserve_base: Pair reserve of the base token
+        reserve_quote: Pair reserve of the quote token
+        base_scale: 10 ** base decimals
+
+    Returns:
+        SplitPlan; raises ValueError if the two venues together cannot fill the amount
+    """
+    if amount <= 0:
+        raise ValueError(f"Amount must be positive, got {amount}")
+    levels = [(price, size) for price, size in levels if size > 0]
+    cumulative = []
+    depth = 0
+    for _, size in levels:
+        depth += size
+        cumulative.append(depth)
+    is_buy = side == OrderSide.BUY
+    has_pool = reserve_base > 0 and reserve_quote > 0
+
+    def clob_marginal(y: int) -> float:
+        """Price per atomic base of the level holding the y-th unit of the CLOB leg."""
+        if y > depth:
+            return float("inf") if is_buy else 0.0
+        for (price, _), total in zip(levels, cumulative):
+            if y <= total:
+                return price / base_scale
+        return float("inf") if is_buy else 0.0
+
+    if is_buy:
+        max_amm = min(amount, reserve_base - 1) if has_pool else 0
+
+        def amm_better(x: int) -> bool:
+            # Marginal cost of the x-th base unit bought from the pair
+            marginal = FEE_RATIO * reserve_quote * reserve_base / (reserve_base - x) ** 2
+            return marginal <= clob_marginal(amount - x + 1)
+    else:
+        max_amm = amount if has_pool else 0
+
+        def amm_better(x: int) -> bool:
+            # Marginal proceeds of the x-th base unit sold to the pair
+            marginal = FEE_RATIO * reserve_base * reserve_quote / (FEE_RATIO * reserve_base + x) ** 2
+            return marginal >= clob_marginal(amount - x + 1)
+
+    if amount - max_amm > depth:
+        raise ValueError(f"CLOB depth {depth} and pair reserves cannot fill {amount}")
+    # Largest AMM amount whose last unit is still no worse than the CLOB unit it replaces; the
+    # pair must take whatever the book cannot
+    low, high = max(0, amount - depth), max_amm
+    while low < high:
+        middle = (low + high + 1) // 2
+        if amm_better(middle):
+            low = middle
+        else:
+            high = middle - 1
+    amm_amount = low
+    clob_amount = amount - amm_amount
+
+    clob_quote, clob_price_limit = _clob_fill(levels, clob_amount, base_scale) if clob_amount else (0, 0)
+    if not amm_amount:
+        amm_quote = 0
+    elif is_buy:
+        amm_quote = get_amount_in(amm_amount, reserve_quote, reserve_base)
+    else:
+        amm_quote = get_amount_out(amm_amount, reserve_base, reserve_quote)
+    return SplitPlan(side, amount, clob_amount, amm_amount, clob_quote, amm_quote, clob_price_limit)
+
+
+class SmartOrderRouter:
+    """Route spot market orders across a CLOB and the UniswapV2 pair of its tokens."""
+
+    def __init__(self, execution: ExecutionClient, quoter: AmmQuoter, book_depth: int = 20):
+        """
+        Initialize the router.
+
+        Args:
+            execution: Execution client used to build, approve and send both legs
+            quoter: Quoter holding the pair reserves
+            book_depth: Price levels of the cached order book (1-20); ExecutionClient keeps one
+                book subscription at this depth per market
+        """
+        self._execution = execution
+        self._quoter = quoter
+        self._book_depth = book_depth
+
+    async def plan(self, market: Market, side: OrderSide, amount: Decimal) -> SplitPlan:
+        """Split a base amount of a spot market, from the cached book and pair reserves."""
+        if market.market_type != MarketType.CLOB_SPOT:
+            raise ValueError(f"Smart routing needs a CLOB spot market, got {market.market_type}")
+        book, pair = await asyncio.gather(
+            self._execution.get_order_book(market, self._book_depth),
+            self._quoter.get_pair(market.base.address, market.quote.address),
+        )
+        levels = market.convert_levels_to_amounts(book.asks if side == OrderSide.BUY else book.bids)
+        reserve_base, reserve_quote = pair.reserves(market.base.address)
+        return plan_split(
+            side, market.base.convert_quantity_to_amount(amount), levels, reserve_base, reserve_quote, market.base.scale
+        )
+
+    async def execute(
+        self,
+        market: Market,
+        side: OrderSide,
+        amount: Decimal,
+        slippage: float = 0.01,
+        deadline_seconds: int = 1200,
+        **kwargs,
+    ) -> tuple[SplitPlan, list[BatchSendResult]]:
+        """
+        Plan a split and send the CLOB and AMM legs in one batch at consecutive nonces.
+
+        Args:
+            market: CLOB spot market; its tokens must also have a UniswapV2 pair
+            side: Order side
+            amount: Base amount in decimal units
+            slippage: Tolerance applied to the CLOB price limit and to the AMM leg's bound
+            deadline_seconds: Seconds from now until the swap deadline
+            **kwargs: Additional transaction parameters for both legs
+
+        Returns:
+            The plan and one BatchSendResult per leg sent, CLOB leg first
+        """
+        execution = self._execution
+        plan = await self.plan(market, side, amount)
+        is_buy = side == OrderSide.BUY
+        token_in, token_out = (market.quote, market.base) if is_buy else (market.base, market.quote)
+
+        approvals = []
+        if plan.clob_amount:
+            approvals.append(execution.ensure_spot_approval(market, side, **kwargs))
+        if plan.amm_amount:
+            approvals.append(execution.ensure_swap_approval(token_in, **kwargs))
+        await asyncio.gather(*approvals)
+
+        txs = []
+        if plan.clob_amount:
+            factor = Decimal(str(1 + slippage)) if is_buy else Decimal(str(1 - slippage))
+            txs.append(execution.place_market_order_tx(
+                market=market,
+                side=side,
+                amount=plan.clob_amount,
+                price_limit=int(plan.clob_price_limit * factor),
+                amount_is_base=True,
+                **kwargs,
+            ))
+        if plan.amm_amount:
+            path = [token_in.address, token_out.address]
+            deadline = int(time.time()) + deadline_seconds
+            if is_buy:
+                txs.append(execution.swap_tokens_for_exact_output_tx(
+                    token_in=token_in,
+                    token_out=token_out,
+                    amount_out_atomic=plan.amm_amount,
+                    amount_in_max=int(plan.amm_quote * (1 + slippage)),
+                    path=path,
+                    deadline=deadline,
+                    **kwargs,
+                ))
+            else:
+                txs.append(execution.swap_tokens_tx(
+                    token_in=token_in,
+                    token_out=token_out,
+                    amount_in_atomic=plan.amm_amount,
+                    amount_out_min=int(plan.amm_quote * (1 - slippage)),
+                    path=path,
+                    deadline=deadline,
+                    **kwargs,
+                ))
+
+        logger.info(
+            f"Routing {side.name} {amount} {market.base.symbol}: {plan.clob_amount} on the CLOB, "
+            f"{plan.amm_amount} on the AMM"
+        )
+        return plan, await execution.scheduler.send_many(txs)
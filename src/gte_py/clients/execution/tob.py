@@ -0,0 +1,50 @@
+"""Top-of-book cache entries fed by the orderbook WebSocket stream."""
+
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+from gte_py.models import OrderBookSnapshot
+
+
+@dataclass
+class TobSnapshot:
+    """Latest best bid/ask of a market as received from the orderbook stream."""
+    bid: Decimal
+    ask: Decimal
+    book_time: int  # "t" of the book message, milliseconds
+    received_at: float  # time.monotonic() when the message arrived
+    updates: int  # messages applied since the subscription started
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the snapshot was received."""
+        return (time.monotonic() if now is None else now) - self.received_at
+
+
+@dataclass
+class DepthSnapshot:
+    """Latest levels of a market's book at one subscribed depth, from the orderbook stream."""
+    book: OrderBookSnapshot
+    received_at: float  # time.monotonic() when the message arrived
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the snapshot was received."""
+        return (time.monotonic() if now is None else now) - self.received_at
+
+
+@dataclass
+class TobCacheStats:
+    """Counters of ExecutionClient top-of-book lookups."""
+    hits: int = 0
+    misses: int = 0  # no snapshot yet
+    stale: int = 0  # snapshot older than the max age
+    waits: int = 0  # lookups that waited for a fresh update
+    rpc_fallbacks: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.stale
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self):
+        self.hits = self.misses = self.stale = self.waits = self.rpc_fallbacks = 0
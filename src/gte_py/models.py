@@ -5,7 +5,7 @@ from decimal import Decimal
 from pydantic import BaseModel
 from enum import Enum
 from math import floor, log10
-from typing import Any
+from typing import Any, Iterable
 
 from eth_typing import ChecksumAddress
 from eth_utils.address import to_checksum_address
@@ -44,6 +44,17 @@ class MarketSide(str, Enum):
             raise ValueError(f"Invalid market side: {s}. Must be 'bid' or 'ask'.")
 
 
+# 10 ** decimals as int and as Decimal, shared by every Token with the same decimals
+_SCALES: dict[int, tuple[int, Decimal]] = {}
+
+
+def _scale(decimals: int) -> tuple[int, Decimal]:
+    scale = _SCALES.get(decimals)
+    if scale is None:
+        scale = _SCALES[decimals] = (10 ** decimals, Decimal(10 ** decimals))
+    return scale
+
+
 class OrderType(str, Enum):
     """Order type - limit or market."""
 
@@ -96,16 +107,49 @@ class Token(BaseModel):
     def get(self, key: str, default: Any = None) -> Any:
         return getattr(self, key, default)
 
+    @property
+    def scale(self) -> int:
+        """Atomic units per whole token (10 ** decimals)."""
+        return _scale(self.decimals)[0]
+
     def convert_amount_to_quantity(self, amount: int) -> Decimal:
         """Convert amount in atomic units to base units."""
         assert isinstance(amount, int), f"amount {amount} is not an integer"
-        return Decimal(amount) / Decimal(10 ** self.decimals)
-
-    def convert_quantity_to_amount(self, quantity: Decimal) -> int:
-        """Convert amount in base units to atomic units."""
+        return Decimal(amount) / _scale(self.decimals)[1]
+
+    def convert_quantity_to_amount(self, quantity: Decimal | str | int) -> int:
+        """
+        Convert amount in base units to atomic units.
+
+        Only ints are scaled in the integer domain. Decimals and decimal strings are multiplied
+        by the cached Decimal factor: with the C decimal module that is faster than splitting
+        the digits into an int in Python.
+        """
+        if type(quantity) is Decimal:
+            return int(quantity * _scale(self.decimals)[1])
+        if type(quantity) is int:
+            # Whole tokens stay in the integer domain
+            return quantity * _scale(self.decimals)[0]
+        if type(quantity) is str:
+            return int(Decimal(quantity) * _scale(self.decimals)[1])
         scaled = quantity * (10 ** self.decimals)
         return int(scaled)
 
+    def convert_amounts_to_quantities(self, amounts: Iterable[int]) -> list[Decimal]:
+        """Batch version of convert_amount_to_quantity."""
+        scale = _scale(self.decimals)[1]
+        return [Decimal(amount) / scale for amount in amounts]
+
+    def convert_quantities_to_amounts(self, quantities: Iterable[Decimal | str | int]) -> list[int]:
+        """
+        Batch version of convert_quantity_to_amount.
+
+        Accepts Decimals, ints or decimal strings such as the "px"/"sz" fields of book levels;
+        each value is parsed at most once and scaled with the cached factor.
+        """
+        scale = _scale(self.decimals)[1]
+        return [int(Decimal(quantity) * scale) for quantity in quantities]
+
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Token":
         """Create a Token object from API response data."""
@@ -141,6 +185,28 @@ class Market(BaseModel):
         """Get the trading pair symbol."""
         return f"{self.base.symbol}/{self.quote.symbol}"
 
+    def convert_levels_to_amounts(self, levels: Iterable[Any]) -> list[tuple[int, int]]:
+        """
+        Convert book levels to (price, size) in atomic quote and base units.
+
+        Args:
+            levels: Book levels, either dicts with "px" and "sz" (WebSocket format) or "price"
+                and "size" (REST format), or (price, size) pairs of Decimals, ints or decimal strings
+
+        Returns:
+            List of (price, size) tuples, in the order given
+        """
+        price_scale = _scale(self.quote.decimals)[1]
+        size_scale = _scale(self.base.decimals)[1]
+        result = []
+        for level in levels:
+            if isinstance(level, dict):
+                price, size = (level["px"], level["sz"]) if "px" in level else (level["price"], level["size"])
+            else:
+                price, size = level[0], level[1]
+            result.append((int(Decimal(price) * price_scale), int(Decimal(size) * size_scale)))
+        return result
+
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Market":
         """Create a Market object from API response data."""
@@ -368,6 +434,7 @@ class Order(BaseModel):
     filled_amount: int | None = None  # Amount filled so far
     owner: ChecksumAddress | None = None
     txn_hash: HexBytes | None = None
+    client_order_id: int | None = None
 
     def __getitem__(self, key: str):
         return getattr(self, key)
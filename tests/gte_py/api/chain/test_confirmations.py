@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from gte_py.api.chain.confirmations import HeadConfirmationTracker
+from gte_py.api.chain.simulation import TxSimulator
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = MagicMock()
+    scheduler.from_address = "0x1234567890123456789012345678901234567890"
+    scheduler.last_confirmed = 5
+    scheduler.last_sent = 5
+    return scheduler
+
+
+@pytest.fixture
+def ws_web3():
+    w3 = MagicMock()
+    w3.eth.get_transaction_count = AsyncMock(return_value=7)
+    return w3
+
+
+class TestHeadConfirmationTracker:
+    """Test HeadConfirmationTracker."""
+
+    @pytest.mark.asyncio
+    async def test_idle_head_makes_no_rpc(self, scheduler, ws_web3):
+        tracker = HeadConfirmationTracker(scheduler, "wss://example")
+
+        await tracker.on_head(ws_web3, {"number": "0x1"})
+
+        assert tracker.heads_seen == 1
+        ws_web3.eth.get_transaction_count.assert_not_awaited()
+        scheduler.confirm_nonce.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_head_confirms_pending_nonces(self, scheduler, ws_web3):
+        scheduler.last_sent = 8
+        tracker = HeadConfirmationTracker(scheduler, "wss://example")
+
+        await tracker.on_head(ws_web3, {"number": "0x2"})
+
+        ws_web3.eth.get_transaction_count.assert_awaited_once_with(scheduler.from_address, "latest")
+        scheduler.confirm_nonce.assert_called_once_with(7)
+
+    @pytest.mark.asyncio
+    async def test_head_advances_simulator_block(self, scheduler, ws_web3):
+        scheduler.simulator = TxSimulator()
+        tracker = HeadConfirmationTracker(scheduler, "wss://example")
+
+        await tracker.on_head(ws_web3, {"number": "0x2a"})
+
+        assert scheduler.simulator.block_number == 42
+
+    @pytest.mark.asyncio
+    async def test_start_stop(self, scheduler):
+        # An unreachable endpoint only makes the task retry; stop() must still cancel it
+        tracker = HeadConfirmationTracker(scheduler, "ws://127.0.0.1:9", reconnect_delay=0.01)
+        await tracker.start()
+        assert tracker.running
+
+        await tracker.stop()
+        assert not tracker.running
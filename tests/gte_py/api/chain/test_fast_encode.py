@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain import fast_encode
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.router import Router
+from gte_py.api.chain.structs import AmendArgs, CancelArgs, OrderSide, PostFillOrderArgs, PostLimitOrderArgs
+from gte_py.clients.execution import ExecutionClient
+
+ROUTER = to_checksum_address("0x86470efcEa37e50F94E74649463b737C87ada367")
+CLOB = to_checksum_address("0x0F3642714B9516e3d17a936bAced4de47A6FFa5F")
+ACCOUNT = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+
+
+@pytest.fixture
+def router():
+    return Router(AsyncWeb3(), ROUTER)
+
+
+@pytest.fixture
+def clob():
+    return Clob(AsyncWeb3(), CLOB)
+
+
+def web3_calldata(typed_func) -> str:
+    return typed_func.func_call._encode_transaction_data()
+
+
+class TestFastEncode:
+    """The precompiled encoders must match web3 byte for byte."""
+
+    @pytest.mark.parametrize("args", [
+        PostLimitOrderArgs(10**16, 3_000 * 10**18, 0, 0, 42, 1, 1),
+        PostLimitOrderArgs(2**256 - 1, 1, 2**256 - 1, 1, 2**96 - 1, 0, 0),
+    ])
+    def test_post_limit_order(self, router, args):
+        fast = fast_encode.clob_post_limit_order(router, clob=CLOB, args=args, gas=100_000)
+
+        assert fast.func_call._encode_transaction_data() == web3_calldata(router.clob_post_limit_order(CLOB, args))
+        assert fast.func_call.address == ROUTER
+        assert fast.params == {"gas": 100_000}
+
+    @pytest.mark.parametrize("amount_is_base", [True, False])
+    def test_post_fill_order(self, router, amount_is_base):
+        args = PostFillOrderArgs(10**18, 2_000 * 10**18, 1, amount_is_base, 1, 0)
+
+        assert fast_encode.encode_clob_post_fill_order(CLOB, args) == web3_calldata(router.clob_post_fill_order(CLOB, args))
+
+    @pytest.mark.parametrize("order_ids", [[], [7], [1, 2**255, 3]])
+    @pytest.mark.parametrize("is_unwrapping", [True, False])
+    def test_cancel(self, router, order_ids, is_unwrapping):
+        args = CancelArgs(order_ids, 1)
+
+        assert fast_encode.encode_clob_cancel(CLOB, args, is_unwrapping) == web3_calldata(
+            router.clob_cancel(CLOB, args, is_unwrapping)
+        )
+
+    def test_amend(self, clob):
+        args = AmendArgs(123, 10**18, 2_500 * 10**18, 0, 1, 1, 1)
+
+        assert fast_encode.encode_clob_amend(ACCOUNT, args) == web3_calldata(clob.amend(ACCOUNT, args))
+
+    def test_out_of_range_rejected(self):
+        with pytest.raises(ValueError):
+            fast_encode.encode_clob_post_limit_order(CLOB, PostLimitOrderArgs(1, 1, 0, 256, 0, 0, 0))
+        with pytest.raises(ValueError):
+            fast_encode.encode_clob_amend(ACCOUNT, AmendArgs(-1, 1, 1, 0, 0, 0, 0))
+        with pytest.raises(ValueError):
+            fast_encode.encode_clob_amend("0x1234", AmendArgs(1, 1, 1, 0, 0, 0, 0))
+
+    def test_falls_back_to_web3_function(self, clob):
+        fast = fast_encode.clob_amend(clob, ACCOUNT, AmendArgs(1, 1, 1, 0, 0, 0, 0))
+
+        assert fast.func_call.fn_name == "amend"
+        assert fast.func_call.abi["name"] == "amend"
+
+
+def test_execution_client_opts_in():
+    def limit_order(fast_encoding: bool):
+        web3 = AsyncWeb3()
+        web3.eth.default_account = ACCOUNT
+        client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, fast_encoding=fast_encoding)
+        return client.place_limit_order_tx(CLOB, OrderSide.BUY, 10**16, 3_000 * 10**18)
+
+    default, fast = limit_order(False), limit_order(True)
+
+    assert not isinstance(default.func_call, fast_encode.FastContractFunction)
+    assert isinstance(fast.func_call, fast_encode.FastContractFunction)
+    assert fast.func_call._encode_transaction_data() == web3_calldata(default)
@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from gte_py.api.chain.gas import GasProfileCache, function_selector, scale_up
+
+CONTRACT = "0xAbCdEf1234567890aBcDeF1234567890aBcDeF12"
+CALLDATA = "0x2299F16F" + "00" * 64
+
+
+class TestGasProfileCache:
+    """Test GasProfileCache."""
+
+    def test_function_selector(self):
+        assert function_selector(CALLDATA) == "0x2299f16f"
+        assert function_selector(bytes.fromhex("2299f16f00")) == "0x2299f16f"
+
+    def test_miss_returns_none(self):
+        cache = GasProfileCache()
+        assert cache.get_limit(CONTRACT, CALLDATA) is None
+
+    def test_limit_uses_peak_sample_and_margin(self):
+        cache = GasProfileCache(safety_margin=0.25)
+        cache.record(CONTRACT, CALLDATA, 100_000)
+        cache.record(CONTRACT, CALLDATA, 80_000)
+        
+        # Keyed case-insensitively by address and by selector only
+        assert cache.get_limit(CONTRACT.lower(), "0x2299f16f") == 125_000
+
+    def test_window_drops_old_samples(self):
+        cache = GasProfileCache(safety_margin=0, max_samples=2)
+        cache.record(CONTRACT, CALLDATA, 500_000)
+        cache.record(CONTRACT, CALLDATA, 100_000)
+        cache.record(CONTRACT, CALLDATA, 120_000)
+        
+        assert cache.get_limit(CONTRACT, CALLDATA) == 120_000
+
+    def test_record_receipt_ignores_reverts(self):
+        cache = GasProfileCache(safety_margin=0)
+        cache.record_receipt(CONTRACT, CALLDATA, {"status": 0, "gasUsed": 900_000})
+        cache.record_receipt(CONTRACT, CALLDATA, {"status": 1, "gasUsed": "0x186a0"})
+        
+        # 100_000 used after refunds may have needed up to 125_000
+        assert cache.get_limit(CONTRACT, CALLDATA) == 125_000
+
+    @pytest.mark.asyncio
+    async def test_estimate_is_a_floor(self):
+        web3 = MagicMock()
+        web3.eth.estimate_gas = AsyncMock(return_value=200_000)
+        cache = GasProfileCache(safety_margin=0, max_samples=2)
+        await cache.estimate(web3, {"to": CONTRACT, "data": CALLDATA})
+        
+        # A refund-heavy call (cancel) uses far less than it needs
+        for _ in range(3):
+            cache.record_receipt(CONTRACT, CALLDATA, {"status": 1, "gasUsed": 120_000})
+        
+        assert cache.get_limit(CONTRACT, CALLDATA) == 200_000
+
+    def test_scale_up_ignores_float_noise(self):
+        assert scale_up(200_000, 1.1) == 220_000
+        assert scale_up(3, 1.5) == 5
+
+    @pytest.mark.asyncio
+    async def test_estimate_records_sample(self):
+        web3 = MagicMock()
+        web3.eth.estimate_gas = AsyncMock(return_value=200_000)
+        cache = GasProfileCache(safety_margin=0.1)
+        
+        limit = await cache.estimate(web3, {"to": CONTRACT, "data": CALLDATA})
+        
+        assert limit == 220_000
+        assert cache.get_limit(CONTRACT, CALLDATA) == 220_000
@@ -0,0 +1,47 @@
+from gte_py.api.chain.journal import TxJournal
+
+ACCOUNT = "0x1234567890AbcdEF1234567890aBcdef12345678"
+
+
+class TestTxJournal:
+    """Test TxJournal."""
+
+    def test_latest_entry_per_nonce_wins(self):
+        journal = TxJournal(":memory:")
+        journal.record(ACCOUNT, 5, "0xaa", b"\x01", "new")
+        journal.record(ACCOUNT, 6, "0xbb", b"\x02", "cancel")
+        journal.record(ACCOUNT, 5, "0xcc", b"\x03", "nonce_cancel")
+
+        entries = journal.entries_from(ACCOUNT.lower(), 5)
+
+        assert sorted(entries) == [5, 6]
+        assert (entries[5].tx_hash, entries[5].raw_tx, entries[5].intent) == ("0xcc", b"\x03", "nonce_cancel")
+        assert list(journal.entries_from(ACCOUNT, 6)) == [6]
+
+    def test_prune(self):
+        journal = TxJournal(":memory:")
+        for nonce in range(5):
+            journal.record(ACCOUNT, nonce, f"0x{nonce}", b"", "new")
+        journal.record("0x0000000000000000000000000000000000000001", 0, "0x", b"", "new")
+
+        assert journal.prune(ACCOUNT, 3) == 3
+        assert sorted(journal.entries_from(ACCOUNT, 0)) == [3, 4]
+
+    def test_persists_across_reopen(self, tmp_path):
+        path = tmp_path / "journal.db"
+        journal = TxJournal(path)
+        journal.record(ACCOUNT, 7, "0xaa", b"\xde\xad", "amend")
+        journal.close()
+
+        entries = TxJournal(path).entries_from(ACCOUNT, 0)
+        assert entries[7].raw_tx == b"\xde\xad"
+
+    def test_rebroadcast_intents(self):
+        journal = TxJournal(":memory:", rebroadcast_intents=["cancel"])
+        journal.record(ACCOUNT, 1, "0xaa", b"", "cancel")
+        journal.record(ACCOUNT, 2, "0xbb", b"", "new")
+        entries = journal.entries_from(ACCOUNT, 0)
+
+        assert journal.should_rebroadcast(entries[1])
+        assert not journal.should_rebroadcast(entries[2])
+        assert TxJournal(":memory:").should_rebroadcast(entries[2])
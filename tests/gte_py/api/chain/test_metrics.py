@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+from gte_py.api.chain.metrics import LatencyHistogram, PipelineMetrics, stage_timer
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_empty_quantile_is_nan(self):
+        assert math.isnan(LatencyHistogram().quantile(0.5))
+
+    def test_quantiles_interpolate_within_bucket(self):
+        histogram = LatencyHistogram(buckets=(1.0, 2.0, 4.0))
+        for seconds in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(seconds)
+
+        assert histogram.counts == [1, 2, 1, 0]
+        assert histogram.quantile(0.5) == pytest.approx(1.5)
+        # p99 falls in the (2, 4] bucket, capped at the largest sample
+        assert histogram.quantile(0.99) == pytest.approx(2.96)
+
+    def test_overflow_bucket_returns_max(self):
+        histogram = LatencyHistogram(buckets=(1.0,))
+        histogram.observe(7.0)
+
+        assert histogram.quantile(0.99) == 7.0
+
+
+class TestPipelineMetrics:
+    """Test PipelineMetrics."""
+
+    def test_timer_records_on_exception(self):
+        metrics = PipelineMetrics()
+        with pytest.raises(RuntimeError):
+            with metrics.timer("sign"):
+                raise RuntimeError()
+
+        assert metrics.to_dict()["sign"]["count"] == 1
+
+    def test_disabled_records_nothing(self):
+        metrics = PipelineMetrics(enabled=False)
+        with stage_timer(metrics, "sign"):
+            pass
+        with stage_timer(None, "sign"):
+            pass
+        metrics.observe("sign", 1.0)
+
+        assert metrics.to_dict() == {}
+
+    def test_to_dict(self):
+        metrics = PipelineMetrics(buckets=(0.001, 0.01))
+        metrics.observe("send_rpc", 0.002)
+        metrics.observe("send_rpc", 0.004)
+
+        summary = metrics.to_dict()["send_rpc"]
+        assert summary["count"] == 2
+        assert summary["sum"] == pytest.approx(0.006)
+        assert summary["max"] == 0.004
+        assert 0.001 < summary["p50"] <= summary["p99"] <= 0.004
+
+    def test_to_prometheus(self):
+        metrics = PipelineMetrics(buckets=(0.001, 0.01))
+        metrics.observe("sign", 0.0005)
+        metrics.observe("sign", 0.005)
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE gte_tx_stage_duration_seconds histogram" in text
+        assert 'gte_tx_stage_duration_seconds_bucket{stage="sign",le="0.001"} 1' in text
+        assert 'gte_tx_stage_duration_seconds_bucket{stage="sign",le="0.01"} 2' in text
+        assert 'gte_tx_stage_duration_seconds_bucket{stage="sign",le="+Inf"} 2' in text
+        assert 'gte_tx_stage_duration_seconds_count{stage="sign"} 2' in text
+        assert text.endswith("\n")
+
+    def test_rejects_unsorted_buckets(self):
+        with pytest.raises(ValueError):
+            PipelineMetrics(buckets=(0.1, 0.01))
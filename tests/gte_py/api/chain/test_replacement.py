@@ -0,0 +1,78 @@
+import pytest
+
+from gte_py.api.chain.replacement import FeeLadder, InflightTx, ReplacementAction, ReplacementEngine
+
+
+def make_inflight(intent: str = "cancel", max_fee: int = 1_000, priority_fee: int = 100) -> InflightTx:
+    return InflightTx(
+        tx_params={"nonce": 5, "maxFeePerGas": max_fee, "maxPriorityFeePerGas": priority_fee},
+        raw_tx=b"\x01",
+        intent=intent,
+    )
+
+
+class TestFeeLadder:
+    """Test FeeLadder validation."""
+
+    def test_rejects_non_increasing(self):
+        with pytest.raises(ValueError):
+            FeeLadder(multipliers=(1.5, 1.25))
+
+    def test_rejects_multiplier_below_one(self):
+        with pytest.raises(ValueError):
+            FeeLadder(multipliers=(1.0, 2.0))
+
+    @pytest.mark.parametrize("multipliers", [(1.05, 1.5), (1.1, 1.2), (1.25, 1.5, 1.6)])
+    def test_rejects_steps_below_replacement_bump(self, multipliers):
+        with pytest.raises(ValueError, match="at least 1.1x"):
+            FeeLadder(multipliers=multipliers)
+
+    def test_accepts_ten_percent_steps(self):
+        assert FeeLadder(multipliers=(1.1, 1.21, 1.331)).multipliers == (1.1, 1.21, 1.331)
+
+
+class TestReplacementEngine:
+    """Test ReplacementEngine planning and fee escalation."""
+
+    def test_waits_for_next_step(self):
+        engine = ReplacementEngine(FeeLadder(interval=3, deadline=30))
+        inflight = make_inflight()
+
+        assert engine.plan(inflight, 2.9) is None
+        assert engine.plan(inflight, 3.0) is ReplacementAction.ESCALATE
+        inflight.step = 1
+        assert engine.plan(inflight, 5.0) is None
+
+    def test_action_per_intent(self):
+        engine = ReplacementEngine(actions={"amend": ReplacementAction.CANCEL})
+
+        assert engine.plan(make_inflight("new"), 3) is ReplacementAction.REBROADCAST
+        assert engine.plan(make_inflight("amend"), 3) is ReplacementAction.CANCEL
+        assert engine.plan(make_inflight("custom"), 3) is ReplacementAction.ESCALATE
+
+    def test_deadline_cancels(self):
+        engine = ReplacementEngine(FeeLadder(interval=3, deadline=30))
+
+        assert engine.plan(make_inflight("new"), 30) is ReplacementAction.CANCEL
+        assert engine.plan(None, 29) is None
+        assert engine.plan(None, 30) is ReplacementAction.CANCEL
+        # A cancel is never cancelled again; it keeps escalating
+        assert engine.plan(make_inflight("nonce_cancel"), 31) is ReplacementAction.ESCALATE
+
+    def test_top_of_ladder_rebroadcasts(self):
+        engine = ReplacementEngine(FeeLadder(multipliers=(2.0,), interval=1, deadline=30))
+        inflight = make_inflight()
+        inflight.step = 1
+
+        assert engine.plan(inflight, 2) is ReplacementAction.REBROADCAST
+
+    def test_escalated_fees(self):
+        engine = ReplacementEngine(FeeLadder(multipliers=(1.25, 2.0)))
+        inflight = make_inflight(max_fee=1_000, priority_fee=0)
+
+        assert engine.escalated_fees(inflight, 1) == (1_250, 1)
+        inflight.fees = (1_250, 1)
+        assert engine.escalated_fees(inflight, 2) == (2_000, 2)
+        # Past the top of the ladder the last multiplier is reused, still outbidding
+        inflight.fees = (2_000, 2)
+        assert engine.escalated_fees(inflight, 5) == (2_001, 3)
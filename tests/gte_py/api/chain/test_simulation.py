@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from eth_abi import encode
+from web3.exceptions import ContractCustomError, ContractLogicError
+
+from gte_py.api.chain.simulation import SimulationRevertError, TxSimulator, decode_revert
+
+CONTRACT = "0xAbCdEf1234567890aBcDeF1234567890aBcDeF12"
+CALLDATA = "0x2299f16f" + "00" * 31 + "01"
+SLIPPAGE = "0x6728a9f6"  # SlippageToleranceExceeded()
+
+
+def make_web3(block_number: int = 100, call=None):
+    web3 = MagicMock()
+    type(web3.eth).block_number = PropertyMock(side_effect=lambda: asyncio.sleep(0, result=block_number))
+    web3.eth.call = call or AsyncMock(return_value=b"")
+    return web3
+
+
+def tx(data: str = CALLDATA, value: int = 0) -> dict:
+    return {"from": CONTRACT, "to": CONTRACT, "data": data, "value": value}
+
+
+class TestDecodeRevert:
+    """Test decode_revert."""
+
+    def test_custom_error(self):
+        assert decode_revert(SLIPPAGE) == "SlippageToleranceExceeded()"
+        assert decode_revert({"data": SLIPPAGE + "00" * 32}) == "SlippageToleranceExceeded()"
+
+    def test_error_string_and_panic(self):
+        assert decode_revert("0x08c379a0" + encode(["string"], ["too late"]).hex()) == "Error('too late')"
+        assert decode_revert("0x4e487b71" + encode(["uint256"], [0x11]).hex()) == "Panic(0x11)"
+
+    def test_unknown(self):
+        assert decode_revert("0xdeadbeef") is None
+        assert decode_revert("execution reverted") is None
+        assert decode_revert(None) is None
+
+
+class TestTxSimulator:
+    """Test TxSimulator."""
+
+    @pytest.mark.asyncio
+    async def test_revert_is_decoded(self):
+        web3 = make_web3(call=AsyncMock(side_effect=ContractCustomError(SLIPPAGE, data=SLIPPAGE)))
+        simulator = TxSimulator()
+
+        with pytest.raises(SimulationRevertError, match="SlippageToleranceExceeded") as info:
+            await simulator.simulate(web3, tx())
+
+        assert info.value.reason == "SlippageToleranceExceeded()"
+        assert web3.eth.call.await_args.args[1] == "pending"
+        assert simulator.stats.reverts == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_per_block_and_arguments(self):
+        web3 = make_web3()
+        simulator = TxSimulator(block_refresh=60)
+
+        await simulator.simulate(web3, tx())
+        await simulator.simulate(web3, tx())
+        await simulator.simulate(web3, tx(value=1))
+        assert web3.eth.call.await_count == 2
+        assert (simulator.stats.hits, simulator.stats.misses) == (1, 2)
+
+        simulator.set_block(101)
+        await simulator.simulate(web3, tx())
+        assert web3.eth.call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_revert(self):
+        web3 = make_web3(call=AsyncMock(side_effect=ContractLogicError("execution reverted", data=SLIPPAGE)))
+        simulator = TxSimulator(block_refresh=60)
+
+        for _ in range(2):
+            with pytest.raises(SimulationRevertError):
+                await simulator.simulate(web3, tx())
+
+        assert web3.eth.call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_lets_send_through_and_fills_cache(self):
+        release = asyncio.Event()
+
+        async def slow_call(*args):
+            await release.wait()
+            raise ContractCustomError(SLIPPAGE, data=SLIPPAGE)
+
+        web3 = make_web3(call=AsyncMock(side_effect=slow_call))
+        simulator = TxSimulator(budget=0.01, block_refresh=60)
+
+        await simulator.simulate(web3, tx())
+        assert simulator.stats.skipped == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        with pytest.raises(SimulationRevertError):
+            await simulator.simulate(web3, tx())
+        assert web3.eth.call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_simulations_share_a_call(self):
+        async def call(*args):
+            await asyncio.sleep(0.001)
+            return b""
+
+        web3 = make_web3(call=AsyncMock(side_effect=call))
+        simulator = TxSimulator(block_refresh=60)
+
+        await asyncio.gather(*(simulator.simulate(web3, tx()) for _ in range(5)))
+
+        assert web3.eth.call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rpc_failure_lets_send_through(self):
+        web3 = make_web3(call=AsyncMock(side_effect=ConnectionError("down")))
+        simulator = TxSimulator()
+
+        await simulator.simulate(web3, tx())
+
+        assert simulator.stats.skipped == 1
+
+    def test_rejects_zero_budget(self):
+        with pytest.raises(ValueError):
+            TxSimulator(budget=0)
@@ -1,4 +1,5 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pytest
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 from hexbytes import HexBytes
@@ -9,9 +10,16 @@ from web3.types import EventData, TxReceipt
 from web3.exceptions import ContractCustomError
 from typing import cast
 
+from gte_py.api.chain.gas import GasProfileCache
+from gte_py.api.chain.journal import TxJournal
+from gte_py.api.chain.metrics import PipelineMetrics
+from gte_py.api.chain.replacement import FeeLadder, ReplacementAction, ReplacementEngine
+from gte_py.api.chain.simulation import SimulationRevertError, TxSimulator
 from gte_py.api.chain.utils import (
     TypedContractFunction, 
     BoundedNonceTxScheduler,
+    BatchSendResult,
+    TxLane,
     parse_event_from_receipt,
     normalize_receipt
 )
@@ -316,10 +324,32 @@ class TestBoundedNonceTxScheduler:
         assert result == {"status": 1}
         mock_web3.eth.wait_for_transaction_receipt.assert_awaited_once_with(tx_hash, timeout=10)
 
+    @pytest.mark.asyncio
+    async def test_get_receipts_in_one_batch(self, mock_web3, mock_account):
+        """Receipts are looked up in one batch request; unmined transactions give None."""
+        mock_web3.provider = MagicMock()
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": {"status": "0x1", "blockNumber": "0xa", "logs": []}},
+            {"jsonrpc": "2.0", "id": 1, "result": None},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "unavailable"}},
+        ])
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        seen = []
+        scheduler.add_receipt_listener(seen.append)
+        
+        receipts = await scheduler.get_receipts(["0x01", "0x02", "0x03"])
+        
+        assert receipts[0] == {"status": 1, "blockNumber": 10, "logs": []}
+        assert receipts[1:] == [None, None]
+        assert seen == [receipts[0]]
+        mock_web3.provider.make_batch_request.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_pending_window_full(self, mock_web3, mock_account, mock_contract_function):
         """Test behavior when pending window is full."""
         scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=2)
+        # The monitor would spin on the patched sleep once the window wait yields
+        scheduler._monitor_interval = 0
         await scheduler.start()
         
         # Fill the window: last_confirmed=5, last_sent=7 means 2 pending
@@ -374,6 +404,665 @@ class TestBoundedNonceTxScheduler:
         mock_web3.eth.send_raw_transaction.assert_awaited_once()
 
 
+class TestNonceReservation:
+    """Test local nonce reservation for built-but-unsent transactions."""
+
+    @pytest.mark.asyncio
+    async def test_reserved_build_skips_rpc(self, mock_web3, mock_account, mock_contract_function):
+        """Reserved builds take nonces from last_sent without any RPC."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, reserve_built_nonces=True)
+        await scheduler.start()
+        mock_web3.eth.get_transaction_count.reset_mock()
+        
+        tx = TypedContractFunction(mock_contract_function)
+        built = await asyncio.gather(*(scheduler.return_transaction_data(tx) for _ in range(3)))
+        
+        assert [b["nonce"] for b in built] == [5, 6, 7]
+        assert scheduler.reserved_nonces == {5, 6, 7}
+        assert scheduler.last_sent == 8
+        mock_web3.eth.get_transaction_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unreserved_build_uses_rpc(self, mock_web3, mock_account, mock_contract_function):
+        """Default builds still fetch the nonce from the chain."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        await scheduler.start()
+        
+        built = await scheduler.return_transaction_data(TypedContractFunction(mock_contract_function))
+        
+        assert built["nonce"] == 5
+        assert scheduler.last_sent == 5
+        assert mock_web3.eth.get_transaction_count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_commit_and_release(self, mock_web3, mock_account, mock_contract_function):
+        """Committed nonces are kept, released nonces are reused first."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        await scheduler.start()
+        
+        first = await scheduler.reserve_nonce()
+        second = await scheduler.reserve_nonce()
+        third = await scheduler.reserve_nonce()
+        await scheduler.commit_nonce(first)
+        await scheduler.release_nonce(second)
+        
+        assert scheduler.reserved_nonces == {third}
+        assert scheduler.last_sent == 8
+        
+        # The released nonce fills the gap before last_sent grows
+        await scheduler.send(TypedContractFunction(mock_contract_function))
+        assert mock_account.sign_transaction.call_args.args[0]["nonce"] == second
+        
+        await scheduler.release_nonce(third)
+        assert scheduler.last_sent == 7
+        
+        with pytest.raises(ValueError):
+            await scheduler.commit_nonce(third)
+
+
+class TestGasCache:
+    """Test gas limits from the gas profile cache."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_once_then_cached(self, mock_web3, mock_account, mock_contract_function):
+        """First send estimates gas, later sends reuse the cached limit without RPC."""
+        mock_web3.eth.estimate_gas = AsyncMock(return_value=100_000)
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, gas_cache=GasProfileCache(safety_margin=0.5))
+        await scheduler.start()
+        
+        tx = TypedContractFunction(mock_contract_function)
+        await scheduler.send(tx)
+        await scheduler.send(tx)
+        
+        mock_web3.eth.estimate_gas.assert_awaited_once()
+        assert [c.args[0]["gas"] for c in mock_account.sign_transaction.call_args_list] == [150_000, 150_000]
+
+    @pytest.mark.asyncio
+    async def test_explicit_gas_wins(self, mock_web3, mock_account, mock_contract_function):
+        """An explicit gas param bypasses the cache entirely."""
+        mock_web3.eth.estimate_gas = AsyncMock(return_value=100_000)
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, gas_cache=GasProfileCache())
+        await scheduler.start()
+        
+        await scheduler.send(TypedContractFunction(mock_contract_function, {"gas": 77_000}))
+        
+        mock_web3.eth.estimate_gas.assert_not_awaited()
+        assert mock_account.sign_transaction.call_args.args[0]["gas"] == 77_000
+
+    @pytest.mark.asyncio
+    async def test_send_wait_records_gas_used(self, mock_web3, mock_account, mock_contract_function):
+        """Receipts from send_wait feed gasUsed into the cache."""
+        cache = GasProfileCache(safety_margin=0, estimate_on_miss=False)
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, gas_cache=cache)
+        await scheduler.start()
+        mock_web3.manager.coro_request.return_value = {"status": "0x1", "gasUsed": "0xc350"}
+        
+        await scheduler.send_wait(TypedContractFunction(mock_contract_function))
+        
+        # gasUsed 50_000, scaled by the refund bound
+        assert cache.get_limit(mock_contract_function.address, b"encoded_data") == 62_500
+
+
+class TestSigningExecutor:
+    """Test off-loop signing with a signing executor."""
+
+    @pytest.mark.asyncio
+    async def test_send_with_thread_pool(self, mock_web3, mock_account, mock_contract_function):
+        """Signing is dispatched to the thread pool and nonces stay sequential."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, signing_executor=executor)
+            await scheduler.start()
+            
+            tx = TypedContractFunction(mock_contract_function)
+            results = await asyncio.gather(*(scheduler.send(tx) for _ in range(4)))
+        
+        assert results == ["0x0123"] * 4
+        nonces = sorted(call.args[0]["nonce"] for call in mock_account.sign_transaction.call_args_list)
+        assert nonces == [5, 6, 7, 8]
+        assert scheduler.last_sent == 9
+
+    @pytest.mark.asyncio
+    async def test_sign_with_process_pool(self, mock_web3, mock_contract_function):
+        """Process pool signing produces the same signature as inline signing."""
+        account = Account.from_key(b"\x01" * 32)
+        tx_params = {
+            "chainId": 1,
+            "nonce": 0,
+            "to": account.address,
+            "data": "0x",
+            "gas": 21000,
+            "maxFeePerGas": 2_500_000,
+            "maxPriorityFeePerGas": 0,
+            "value": 0,
+        }
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            scheduler = BoundedNonceTxScheduler(mock_web3, account, signing_executor=executor)
+            signed = await scheduler._sign_tx_params(tx_params)
+        
+        assert signed.raw_transaction == account.sign_transaction(tx_params).raw_transaction
+
+
+class TestSendMany:
+    """Test batched submission with send_many."""
+
+    @pytest.fixture
+    def scheduler(self, mock_web3, mock_account):
+        mock_web3.provider = MagicMock()
+        return BoundedNonceTxScheduler(mock_web3, mock_account)
+
+    @pytest.mark.asyncio
+    async def test_single_batch_in_nonce_order(self, scheduler, mock_web3, mock_account, mock_contract_function):
+        """All transactions go out in one batch request at consecutive nonces."""
+        mock_web3.provider.make_batch_request = AsyncMock(
+            return_value=[{"jsonrpc": "2.0", "id": i, "result": f"0x{i:064x}"} for i in range(3)]
+        )
+        await scheduler.start()
+        
+        results = await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(3)])
+        
+        assert [r.nonce for r in results] == [5, 6, 7]
+        assert [r.tx_hash for r in results] == [f"0x{i:064x}" for i in range(3)]
+        assert all(r.ok for r in results)
+        mock_web3.provider.make_batch_request.assert_awaited_once()
+        batch = mock_web3.provider.make_batch_request.call_args.args[0]
+        assert [method for method, _ in batch] == ["eth_sendRawTransaction"] * 3
+        assert [c.args[0]["nonce"] for c in mock_account.sign_transaction.call_args_list] == [5, 6, 7]
+        mock_web3.eth.send_raw_transaction.assert_not_awaited()
+        assert scheduler.last_sent == 8
+
+    @pytest.mark.asyncio
+    async def test_per_item_errors(self, scheduler, mock_web3, mock_account, mock_contract_function):
+        """Nonce errors are resent, known transactions succeed and rejections free their nonce."""
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": "0x" + "aa" * 32},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "nonce too low"}},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "already known"}},
+            {"jsonrpc": "2.0", "id": 3, "error": {"code": -32000, "message": "insufficient funds"}},
+        ])
+        await scheduler.start()
+        # After the resync the node reports nonces 5..7 as pending
+        mock_web3.eth.get_transaction_count = AsyncMock(side_effect=[8, 5])
+        
+        results = await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(4)])
+        
+        assert results[0] == BatchSendResult(5, "0x" + "aa" * 32)
+        assert results[1] == BatchSendResult(8, "0x0123")
+        assert results[2] == BatchSendResult(7, "0x0123")
+        assert results[3].nonce == 8 and not results[3].ok
+        assert "insufficient funds" in str(results[3].error)
+        mock_web3.eth.send_raw_transaction.assert_awaited_once()
+        # The rejected nonce 8 is released before the resend takes it again
+        assert scheduler.last_sent == 9
+
+    @pytest.mark.asyncio
+    async def test_rejected_tail_nonce_is_released(self, scheduler, mock_web3, mock_contract_function):
+        """A rejected last transaction hands its nonce back to the scheduler."""
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": "0x" + "aa" * 32},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "intrinsic gas too low"}},
+        ])
+        await scheduler.start()
+        
+        results = await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(2)])
+        
+        assert [r.ok for r in results] == [True, False]
+        assert scheduler.last_sent == 6
+
+    @pytest.mark.asyncio
+    async def test_batch_level_error_raises(self, scheduler, mock_web3, mock_contract_function):
+        """A single error object for the whole batch raises."""
+        mock_web3.provider.make_batch_request = AsyncMock(
+            return_value={"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid request"}}
+        )
+        await scheduler.start()
+        
+        with pytest.raises(Exception, match="Batch transaction failed"):
+            await scheduler.send_many([TypedContractFunction(mock_contract_function)])
+        assert scheduler.last_sent == 5
+
+    @pytest.mark.asyncio
+    async def test_rejected_middle_nonce_is_filled(self, scheduler, mock_web3, mock_account, mock_contract_function):
+        """A rejection below accepted transactions is filled with a self-transfer, not left as a gap."""
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": "0x" + "aa" * 32},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "intrinsic gas too low"}},
+            {"jsonrpc": "2.0", "id": 2, "result": "0x" + "cc" * 32},
+        ])
+        await scheduler.start()
+        
+        results = await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(3)])
+        
+        assert [r.ok for r in results] == [True, False, True]
+        mock_web3.eth.send_raw_transaction.assert_awaited_once()
+        filler = mock_account.sign_transaction.call_args.args[0]
+        assert (filler["nonce"], filler["to"], filler["value"]) == (6, mock_account.address, 0)
+        assert scheduler.last_sent == 8
+        assert not scheduler._free_nonces
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_releases_nonces(self, scheduler, mock_web3, mock_contract_function):
+        """A batch request that fails as a whole hands every nonce back."""
+        mock_web3.provider.make_batch_request = AsyncMock(side_effect=ConnectionError("reset"))
+        await scheduler.start()
+        
+        with pytest.raises(Exception, match="Batch transaction failed"):
+            await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(3)])
+        
+        assert scheduler.last_sent == 5
+        assert not scheduler._free_nonces
+
+    @pytest.mark.asyncio
+    async def test_batch_larger_than_window(self, scheduler, mock_contract_function):
+        """A batch that can never fit in the pending window is rejected up front."""
+        scheduler.max_pending_window = 2
+        
+        with pytest.raises(ValueError):
+            await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(3)])
+
+    @pytest.mark.asyncio
+    async def test_sign_ahead_then_send_presigned(self, scheduler, mock_web3, mock_account, mock_contract_function):
+        """Signing ahead takes no nonce; sending the signed transactions is one batch request."""
+        mock_web3.provider.make_batch_request = AsyncMock(
+            return_value=[{"jsonrpc": "2.0", "id": i, "result": f"0x{i:064x}"} for i in range(2)]
+        )
+        await scheduler.start()
+        funcs = [TypedContractFunction(mock_contract_function) for _ in range(2)]
+        
+        presigned = await scheduler.sign_ahead(funcs)
+        
+        assert [tx["nonce"] for _, tx in presigned] == [5, 6]
+        assert scheduler.last_sent == scheduler.sign_ahead_nonce() == 5
+        
+        results = await scheduler.send_presigned(funcs, presigned)
+        
+        assert [(r.nonce, r.ok) for r in results] == [(5, True), (6, True)]
+        assert mock_account.sign_transaction.call_count == 2
+        mock_web3.provider.make_batch_request.assert_awaited_once()
+        assert scheduler.last_sent == 7
+
+    @pytest.mark.asyncio
+    async def test_stale_presigned_is_not_sent(self, scheduler, mock_web3, mock_contract_function):
+        """Signed transactions whose nonces were taken meanwhile are dropped."""
+        mock_web3.provider.make_batch_request = AsyncMock()
+        await scheduler.start()
+        funcs = [TypedContractFunction(mock_contract_function)]
+        presigned = await scheduler.sign_ahead(funcs)
+        await scheduler.send(funcs[0])
+        
+        assert await scheduler.send_presigned(funcs, presigned) is None
+        mock_web3.provider.make_batch_request.assert_not_awaited()
+        assert scheduler.last_sent == 6
+
+    @pytest.mark.asyncio
+    async def test_sign_ahead_waits_for_released_nonces(self, scheduler, mock_contract_function):
+        """Released nonces are reused first, so nothing is signed past them."""
+        await scheduler.start()
+        nonce = await scheduler.reserve_nonce()
+        await scheduler.reserve_nonce()
+        await scheduler.release_nonce(nonce)
+        
+        assert scheduler.sign_ahead_nonce() is None
+        with pytest.raises(RuntimeError):
+            await scheduler.sign_ahead([TypedContractFunction(mock_contract_function)])
+
+
+class TestSimulation:
+    """Test simulate-before-send."""
+
+    REVERT = "0x6728a9f6"  # SlippageToleranceExceeded()
+
+    @pytest.fixture
+    def scheduler(self, mock_web3, mock_account):
+        type(mock_web3.eth).block_number = AsyncPropertyMock(100)
+        mock_web3.provider = MagicMock()
+        return BoundedNonceTxScheduler(mock_web3, mock_account, simulator=TxSimulator())
+
+    @pytest.mark.asyncio
+    async def test_revert_takes_no_nonce(self, scheduler, mock_web3, mock_account, mock_contract_function):
+        """A reverting transaction is neither signed nor sent."""
+        mock_web3.eth.call = AsyncMock(side_effect=ContractCustomError(self.REVERT, data=self.REVERT))
+        await scheduler.start()
+
+        with pytest.raises(SimulationRevertError, match="SlippageToleranceExceeded"):
+            await scheduler.send(TypedContractFunction(mock_contract_function))
+
+        mock_account.sign_transaction.assert_not_called()
+        mock_web3.eth.send_raw_transaction.assert_not_awaited()
+        assert scheduler.last_sent == 5
+
+    @pytest.mark.asyncio
+    async def test_passing_transaction_is_sent(self, scheduler, mock_web3, mock_contract_function):
+        """A transaction that simulates cleanly goes out as usual."""
+        mock_web3.eth.call = AsyncMock(return_value=b"")
+        await scheduler.start()
+
+        assert await scheduler.send(TypedContractFunction(mock_contract_function)) == "0x0123"
+        tx, block = mock_web3.eth.call.await_args.args
+        assert (tx["to"], tx["data"], block) == (mock_contract_function.address, b"encoded_data", "pending")
+
+    @pytest.mark.asyncio
+    async def test_send_many_skips_reverts(self, scheduler, mock_web3, mock_contract_function):
+        """Reverting items fail without a nonce; the rest share one batch at consecutive nonces."""
+        reverting = AsyncMock(spec=AsyncContractFunction)
+        reverting.address = mock_contract_function.address
+        reverting._encode_transaction_data = MagicMock(return_value="0xbad0")
+        mock_web3.eth.call = AsyncMock(side_effect=lambda tx, block: (
+            _raise(ContractCustomError(self.REVERT, data=self.REVERT)) if tx["data"] == "0xbad0" else b""
+        ))
+        mock_web3.provider.make_batch_request = AsyncMock(
+            return_value=[{"jsonrpc": "2.0", "id": i, "result": f"0x{i:064x}"} for i in range(2)]
+        )
+        await scheduler.start()
+
+        results = await scheduler.send_many([
+            TypedContractFunction(mock_contract_function),
+            TypedContractFunction(reverting),
+            TypedContractFunction(mock_contract_function),
+        ])
+
+        assert [r.nonce for r in results] == [5, None, 6]
+        assert isinstance(results[1].error, SimulationRevertError)
+        assert scheduler.last_sent == 7
+
+
+def _raise(error: Exception):
+    raise error
+
+
+class TestTxLanes:
+    """Test priority lanes and their reserved shares of the pending window."""
+
+    def test_lane_limits(self, mock_web3, mock_account):
+        """Each lane stops short of the shares reserved for the lanes above it."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=20)
+
+        assert scheduler.lane_limit(TxLane.CANCEL) == 20
+        assert scheduler.lane_limit(TxLane.AMEND) == 18
+        assert scheduler.lane_limit(TxLane.NEW) == 16
+
+    def test_invalid_reserves(self, mock_web3, mock_account):
+        """Reserves must leave room for the lowest lane."""
+        with pytest.raises(ValueError):
+            BoundedNonceTxScheduler(mock_web3, mock_account, lane_reserves={TxLane.CANCEL: 0.6, TxLane.AMEND: 0.4})
+
+    @pytest.mark.asyncio
+    async def test_cancel_uses_reserved_share(self, mock_web3, mock_account, mock_contract_function):
+        """A cancel goes out at once when new orders have filled their part of the window."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=20)
+        await scheduler.start()
+        scheduler.last_sent = 5 + scheduler.lane_limit(TxLane.NEW)
+
+        tx = TypedContractFunction(mock_contract_function)
+        with patch("gte_py.api.chain.utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            await scheduler.send(tx, lane=TxLane.CANCEL)
+
+        sleep.assert_not_awaited()
+        assert mock_account.sign_transaction.call_args.args[0]["nonce"] == 21
+
+    @pytest.mark.asyncio
+    async def test_released_nonce_wakes_waiter(self, mock_web3, mock_account):
+        """A waiting lane takes a nonce as soon as one is released, without polling the chain."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=10)
+        await scheduler.start()
+        nonces = [await scheduler.reserve_nonce() for _ in range(scheduler.lane_limit(TxLane.NEW))]
+        mock_web3.eth.get_transaction_count.reset_mock()
+
+        waiter = asyncio.create_task(scheduler.reserve_nonce(TxLane.NEW))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await scheduler.release_nonce(nonces[-1])
+        assert await asyncio.wait_for(waiter, 1) == nonces[-1]
+        mock_web3.eth.get_transaction_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_waiting_cancel_blocks_new_orders(self, mock_web3, mock_account):
+        """New orders do not take freed room while a cancel is waiting for it."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=4, lane_reserves={})
+        await scheduler.start()
+        nonces = [await scheduler.reserve_nonce() for _ in range(4)]
+
+        cancel = asyncio.create_task(scheduler.reserve_nonce(TxLane.CANCEL))
+        await asyncio.sleep(0.05)
+        new = asyncio.create_task(scheduler.reserve_nonce(TxLane.NEW))
+        await asyncio.sleep(0.05)
+
+        await scheduler.release_nonce(nonces[-1])
+        assert await asyncio.wait_for(cancel, 1) == nonces[-1]
+        assert not new.done()
+        new.cancel()
+
+
+class TestConfirmationTracking:
+    """Test push-based advancement of last_confirmed."""
+
+    @pytest.mark.asyncio
+    async def test_send_wait_receipt_confirms_nonce(self, mock_web3, mock_account, mock_contract_function):
+        """A realtime receipt frees the window without polling the chain."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        await scheduler.start()
+        mock_web3.eth.get_transaction_count.reset_mock()
+
+        await scheduler.send_wait(TypedContractFunction(mock_contract_function))
+
+        assert scheduler.last_confirmed == 6
+        assert await scheduler.get_pending_count() == 0
+        mock_web3.eth.get_transaction_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_confirm_nonce_is_monotonic(self, mock_web3, mock_account):
+        """Stale confirmations are ignored and external nonces move last_sent along."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        await scheduler.start()
+        scheduler.last_sent = 8
+
+        scheduler.confirm_nonce(7)
+        scheduler.confirm_nonce(6)
+        assert scheduler.last_confirmed == 7
+
+        scheduler.confirm_nonce(10)
+        assert (scheduler.last_confirmed, scheduler.last_sent) == (10, 10)
+
+    @pytest.mark.asyncio
+    async def test_confirmation_wakes_waiter(self, mock_web3, mock_account):
+        """A waiting transaction gets its nonce as soon as a confirmation arrives."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, max_pending_window=2, lane_reserves={})
+        await scheduler.start()
+        await scheduler.reserve_nonce()
+        await scheduler.reserve_nonce()
+
+        waiter = asyncio.create_task(scheduler.reserve_nonce())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        scheduler.confirm_nonce(6)
+        assert await asyncio.wait_for(waiter, 1) == 7
+
+    @pytest.mark.asyncio
+    async def test_monitor_idle_without_pending(self, mock_web3, mock_account):
+        """The monitor makes no RPC calls while nothing is in flight."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        scheduler._monitor_interval = 0.01
+        await scheduler.start()
+        mock_web3.eth.get_transaction_count.reset_mock()
+
+        await asyncio.sleep(0.05)
+        mock_web3.eth.get_transaction_count.assert_not_awaited()
+        await scheduler.stop()
+
+
+class TestJournalRecovery:
+    """Test the transaction journal and warm restarts."""
+
+    @pytest.mark.asyncio
+    async def test_signed_transactions_are_journaled(self, mock_web3, mock_account, mock_contract_function):
+        """Transactions are journaled with their lane as intent."""
+        journal = TxJournal(":memory:")
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, journal=journal)
+        await scheduler.start()
+
+        await scheduler.send(TypedContractFunction(mock_contract_function), lane=TxLane.CANCEL)
+
+        entry = journal.entries_from(mock_account.address, 0)[5]
+        assert (entry.raw_tx, entry.intent) == (b"\x04\x56", "cancel")
+
+    @pytest.mark.asyncio
+    async def test_restart_rebroadcasts_and_cancels_gaps(self, mock_web3, mock_account):
+        """Lost transactions are rebroadcast in one batch and unjournaled gaps cancelled."""
+        journal = TxJournal(":memory:", rebroadcast_intents=["cancel"])
+        journal.record(mock_account.address, 4, "0x04", b"\x04", "new")  # confirmed
+        journal.record(mock_account.address, 6, "0x06", b"\x06", "cancel")
+        journal.record(mock_account.address, 8, "0x08", b"\x08", "new")
+        # latest=5, pending=5: nonce 5 was never journaled, 7 is a gap
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[{"result": "0x06"}])
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, journal=journal)
+        scheduler._monitor_interval = 0
+
+        with patch.object(scheduler, "_cancel_stuck_nonce", new=AsyncMock()) as cancel:
+            await scheduler.start()
+
+        assert mock_web3.provider.make_batch_request.call_args.args[0] == [("eth_sendRawTransaction", ["0x06"])]
+        assert [c.args[0] for c in cancel.await_args_list] == [5, 7, 8]
+        assert scheduler.last_sent == 9
+        assert 4 not in journal.entries_from(mock_account.address, 0)
+
+    @pytest.mark.asyncio
+    async def test_restart_cancels_rejected_rebroadcast(self, mock_web3, mock_account):
+        """A journaled transaction the node rejects has its nonce cancelled."""
+        journal = TxJournal(":memory:")
+        journal.record(mock_account.address, 5, "0x05", b"\x05", "new")
+        journal.record(mock_account.address, 6, "0x06", b"\x06", "new")
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[
+            {"error": {"code": -32000, "message": "already known"}},
+            {"error": {"code": -32000, "message": "insufficient funds"}},
+        ])
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, journal=journal)
+        scheduler._monitor_interval = 0
+
+        with patch.object(scheduler, "_cancel_stuck_nonce", new=AsyncMock()) as cancel:
+            await scheduler.start()
+
+        cancel.assert_awaited_once_with(6)
+
+
+class TestStuckNonceReplacement:
+    """Test replacing stuck nonces through the replacement engine."""
+
+    @pytest.mark.asyncio
+    async def test_escalates_same_payload(self, mock_web3, mock_account, mock_contract_function):
+        """A stuck cancel is re-signed with the same calldata at higher fees."""
+        engine = ReplacementEngine(FeeLadder(multipliers=(2.0,), interval=1, deadline=30))
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, replacement=engine)
+        await scheduler.start()
+        await scheduler.send(TypedContractFunction(mock_contract_function), lane=TxLane.CANCEL)
+        mock_web3.eth.send_raw_transaction.reset_mock()
+
+        cancelled = await scheduler._replace_stuck_nonce(5, 1.5)
+
+        assert not cancelled
+        params = mock_account.sign_transaction.call_args.args[0]
+        assert (params["data"], params["maxFeePerGas"], params["maxPriorityFeePerGas"]) == (
+            b"encoded_data", 5_000_000, 1
+        )
+        mock_web3.eth.send_raw_transaction.assert_awaited_once()
+        assert scheduler._inflight[5].step == 1
+
+    @pytest.mark.asyncio
+    async def test_rebroadcasts_original(self, mock_web3, mock_account, mock_contract_function):
+        """A stuck new order is resent as signed, without re-signing."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, replacement=ReplacementEngine())
+        await scheduler.start()
+        await scheduler.send(TypedContractFunction(mock_contract_function))
+        mock_account.sign_transaction.reset_mock()
+
+        await scheduler._replace_stuck_nonce(5, 3)
+
+        mock_account.sign_transaction.assert_not_called()
+        mock_web3.eth.send_raw_transaction.assert_awaited_with(b"\x04\x56")
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancel_outbids_original(self, mock_web3, mock_account, mock_contract_function):
+        """The deadline cancel pays more than the transaction it replaces."""
+        scheduler = BoundedNonceTxScheduler(
+            mock_web3, mock_account, replacement=ReplacementEngine(actions={"new": ReplacementAction.ESCALATE})
+        )
+        await scheduler.start()
+        tx = TypedContractFunction(
+            mock_contract_function, {"maxFeePerGas": 10_000_000_000, "maxPriorityFeePerGas": 100}
+        )
+        await scheduler.send(tx)
+
+        assert await scheduler._replace_stuck_nonce(5, 30)
+
+        params = mock_account.sign_transaction.call_args.args[0]
+        assert params["to"] == mock_account.address and params["value"] == 0
+        assert params["maxFeePerGas"] == 11_000_000_000 and params["maxPriorityFeePerGas"] == 110
+        assert scheduler._inflight[5].intent == "nonce_cancel"
+
+    @pytest.mark.asyncio
+    async def test_confirmation_forgets_inflight(self, mock_web3, mock_account, mock_contract_function):
+        """Confirmed transactions are no longer candidates for replacement."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, replacement=ReplacementEngine())
+        await scheduler.start()
+        await scheduler.send(TypedContractFunction(mock_contract_function))
+
+        scheduler.confirm_nonce(6)
+
+        assert scheduler._inflight == {}
+
+
+class TestPipelineMetrics:
+    """Test latency instrumentation of the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_send_wait_records_stages(self, mock_web3, mock_account, mock_contract_function):
+        """Every stage of a send_wait is timed."""
+        metrics = PipelineMetrics()
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, metrics=metrics)
+        await scheduler.start()
+
+        await scheduler.send_wait(TypedContractFunction(mock_contract_function))
+
+        summary = metrics.to_dict()
+        assert set(summary) == {"nonce_wait", "abi_encode", "sign", "realtime_receipt", "event_parse"}
+        assert all(stage["count"] == 1 for stage in summary.values())
+
+    @pytest.mark.asyncio
+    async def test_send_many_times_one_batch_rpc(self, mock_web3, mock_account, mock_contract_function):
+        """A batch is one nonce wait and one send RPC."""
+        metrics = PipelineMetrics()
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account, metrics=metrics)
+        await scheduler.start()
+        mock_web3.provider.make_batch_request = AsyncMock(return_value=[{"result": "0x01"}, {"result": "0x02"}])
+
+        await scheduler.send_many([TypedContractFunction(mock_contract_function) for _ in range(2)])
+
+        summary = metrics.to_dict()
+        assert (summary["nonce_wait"]["count"], summary["send_rpc"]["count"], summary["sign"]["count"]) == (1, 1, 2)
+
+
+class TestReceiptListeners:
+    """Test receipt listeners of the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_send_wait_notifies_listeners(self, mock_web3, mock_account, mock_contract_function):
+        """Listeners see every receipt; a failing listener does not break the send."""
+        scheduler = BoundedNonceTxScheduler(mock_web3, mock_account)
+        await scheduler.start()
+        receipts = []
+        scheduler.add_receipt_listener(MagicMock(side_effect=RuntimeError("boom")))
+        scheduler.add_receipt_listener(receipts.append)
+
+        await scheduler.send_wait(TypedContractFunction(mock_contract_function))
+
+        assert len(receipts) == 1
+
+        scheduler.remove_receipt_listener(receipts.append)
+        await scheduler.send_wait(TypedContractFunction(mock_contract_function))
+
+        assert len(receipts) == 1
+
+
 class TestNormalizeReceipt:
     """Test normalize_receipt function."""
 
@@ -0,0 +1,223 @@
+import itertools
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import BatchSendResult, load_abi
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.algo import AlgoScheduler, AlgoStatus
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.clients.execution.rules import MarketRules
+from gte_py.models import Market, MarketType, Token
+
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+WALLET = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+FUNDED = to_checksum_address("0x" + "77" * 20)
+OTHER = to_checksum_address("0x" + "99" * 20)
+CLOB = to_checksum_address("0x" + "03" * 20)
+MARKET = Market(
+    address=CLOB,
+    market_type=MarketType.CLOB_SPOT,
+    base=Token(address=to_checksum_address("0x" + "01" * 20), decimals=0, name="B", symbol="B"),
+    quote=Token(address=to_checksum_address("0x" + "02" * 20), decimals=0, name="Q", symbol="Q"),
+)
+EVENTS = {entry["name"]: entry for entry in load_abi("clob") if entry.get("type") == "event"}
+
+
+def clob_log(name: str, values: dict, tx: int, block: int = 1) -> dict:
+    abi = EVENTS[name]
+    topics = [HexBytes(event_abi_to_log_topic(abi))]
+    types, data = [], []
+    for param in abi["inputs"]:
+        if param["type"] == "tuple":
+            abi_type = "(" + ",".join(c["type"] for c in param["components"]) + ")"
+            value = tuple(values[param["name"]][c["name"]] for c in param["components"])
+        else:
+            abi_type, value = param["type"], values[param["name"]]
+        if param["indexed"]:
+            topics.append(HexBytes(encode([abi_type], [value])))
+        else:
+            types.append(abi_type)
+            data.append(value)
+    return {
+        "address": HexBytes(CLOB), "topics": topics, "data": HexBytes(encode(types, data)),
+        "logIndex": 0, "transactionIndex": 0, "transactionHash": HexBytes(tx.to_bytes(32, "big")),
+        "blockHash": HexBytes(b"\x00" * 32), "blockNumber": block,
+    }
+
+
+def processed_log(name: str, order_id: int, base: int, quote: int, posted: int = 0, account: str = WALLET):
+    """FillOrderProcessed or LimitOrderProcessed of an account, as found in a receipt."""
+    values = dict(account=account, orderId=order_id, amountPostedInBase=posted, quoteTokenAmountTraded=-quote,
+                  baseTokenAmountTraded=base, takerFee=0, nonce=1)
+    return clob_log(name, values, tx=order_id)
+
+
+def matched_log(maker_order_id: int, traded: int, price: int, block: int) -> dict:
+    """OrderMatched of another account's taker order against our resting order."""
+    def order(order_id, owner, side):
+        return dict(side=side, cancelTimestamp=0, id=order_id, prevOrderId=0, nextOrderId=0,
+                    owner=owner, price=price, amount=traded)
+    values = dict(takerOrderId=99, makerOrderId=maker_order_id, takerOrder=order(99, OTHER, 1),
+                  makerOrder=order(maker_order_id, WALLET, 0), tradedBase=traded, nonce=1)
+    return clob_log("OrderMatched", values, tx=1_000 + maker_order_id, block=block)
+
+
+def mine(client, *receipts):
+    """Answer receipt lookups: the given receipts once the children exist, else not mined yet."""
+    queue = list(receipts)
+
+    async def make_batch_request(requests):
+        return [{"result": queue.pop(0) if queue else None} for _ in requests]
+
+    client._web3.provider.make_batch_request = AsyncMock(side_effect=make_batch_request)
+
+
+@pytest.fixture
+def client():
+    web3 = AsyncWeb3()
+    web3.eth.default_account = WALLET
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, order_store=OrderStore(WALLET))
+    client._web3 = client._scheduler.web3 = MagicMock()
+    client._web3.provider.make_batch_request = AsyncMock(side_effect=lambda requests: [{"result": None}] * len(requests))
+    client.ensure_spot_approval = AsyncMock()
+    client.get_price_limit = AsyncMock(return_value=110)
+    client.place_market_order_tx = MagicMock(side_effect=lambda **kwargs: ("market", kwargs["amount"]))
+    client.place_limit_order_tx = MagicMock(side_effect=lambda **kwargs: ("limit", kwargs["amount"]))
+    hashes = (f"0x{n:04x}" for n in itertools.count(1))
+    client._scheduler.send_many = AsyncMock(side_effect=lambda txs: [BatchSendResult(i, next(hashes)) for i in range(len(txs))])
+    client.market_rules._rules[CLOB] = MarketRules(CLOB, 1, 1, 20)
+    return client
+
+
+def sent(client) -> list:
+    return [call.args[0] for call in client._scheduler.send_many.await_args_list]
+
+
+class TestAlgoScheduler:
+    """Test AlgoScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_twap_slices_and_catch_up(self, client):
+        algo = AlgoScheduler(client)
+        order = await algo.submit_twap(MARKET, OrderSide.BUY, Decimal(100), duration=40, slices=4)
+        start = order.started_at
+
+        await algo._tick(start)
+        await algo._tick(start + 5)  # same slice, child still in flight
+        assert sent(client) == [[("market", 25)]]
+
+        # The first slice only filled 20
+        mine(client, {"status": 1, "logs": [processed_log("FillOrderProcessed", 1, 20, 2_000)]})
+        await algo._tick(start + 10)
+
+        assert order.filled == 20
+        assert sent(client)[-1] == [("market", 30)]
+        assert order.average_price == Decimal(100)
+
+    @pytest.mark.asyncio
+    async def test_twap_completes_after_last_slice(self, client):
+        progress = []
+        algo = AlgoScheduler(client, on_progress=lambda order: progress.append((order.filled, order.status)))
+        order = await algo.submit_twap(MARKET, OrderSide.SELL, Decimal(10), duration=1, slices=1)
+        await algo._tick(order.started_at)
+        mine(client, {"status": 1, "logs": [processed_log("FillOrderProcessed", 1, -10, 1_000)]})
+
+        await algo._tick(order.started_at + 2)
+
+        assert order.status == AlgoStatus.DONE
+        assert order.done.is_set()
+        assert progress == [(10, AlgoStatus.ACTIVE), (10, AlgoStatus.DONE)]
+
+    @pytest.mark.asyncio
+    async def test_pov_follows_trade_stream(self, client):
+        callbacks = {}
+        client._info.subscribe_trades = AsyncMock(side_effect=lambda market, callback: callbacks.setdefault(market, callback))
+        algo = AlgoScheduler(client)
+        order = await algo.submit_pov(MARKET, OrderSide.BUY, Decimal(100), participation=0.2,
+                                      min_clip=Decimal(5), max_clip=Decimal(15))
+
+        callbacks[CLOB]({"sd": "sell", "m": CLOB, "px": "100", "sz": "20"})
+        await algo._tick()  # target 4 < min clip
+        callbacks[CLOB]({"sd": "sell", "m": CLOB, "px": "100", "sz": "200"})
+        await algo._tick()
+
+        assert sent(client) == [[("market", 15)]]
+        assert order.market_volume == 220
+
+        client._info.unsubscribe_trades = AsyncMock()
+        await algo.stop()
+        client._info.unsubscribe_trades.assert_awaited_once_with(CLOB)
+
+    @pytest.mark.asyncio
+    async def test_iceberg_replenishes_after_fill(self, client):
+        algo = AlgoScheduler(client)
+        order = await algo.submit_iceberg(MARKET, OrderSide.BUY, Decimal(20), price=Decimal(99), clip=Decimal(10))
+
+        await algo._tick()
+        mine(client, {"status": 1, "logs": [processed_log("LimitOrderProcessed", 7, 0, 0, posted=10)]})
+        client._web3.eth.get_logs = AsyncMock(return_value=[])
+        type(client._web3.eth).block_number = PropertyMock(side_effect=lambda: AsyncMock(return_value=2)())
+        await algo._tick()
+        assert order.resting == {7: 0}
+        assert len(sent(client)) == 1
+
+        # Another account's order fills the clip; only a log poll of the market shows it
+        client._web3.eth.get_logs = AsyncMock(return_value=[matched_log(7, traded=10, price=99, block=3)])
+        type(client._web3.eth).block_number = PropertyMock(side_effect=lambda: AsyncMock(return_value=3)())
+        await algo._tick()
+
+        assert (order.filled, order.filled_quote) == (10, 990)
+        assert sent(client)[-1] == [("limit", 10)]
+        assert client.place_limit_order_tx.call_args.kwargs["price"] == 99
+        assert client._web3.eth.get_logs.await_args.args[0]["address"] == [CLOB]
+
+    @pytest.mark.asyncio
+    async def test_one_batch_for_many_parents(self, client):
+        algo = AlgoScheduler(client)
+        for _ in range(200):
+            await algo.submit_twap(MARKET, OrderSide.BUY, Decimal(10), duration=10, slices=2)
+
+        await algo._tick()
+        await algo._tick()
+
+        assert client._scheduler.send_many.await_count == 1
+        assert len(sent(client)[0]) == 200
+        # The 200 children in flight are looked up in one receipt batch
+        client._web3.provider.make_batch_request.assert_awaited_once()
+        assert len(client._web3.provider.make_batch_request.await_args.args[0]) == 200
+
+    @pytest.mark.asyncio
+    async def test_operator_fills_and_child_kwargs(self, client):
+        client._trading_account = FUNDED
+        algo = AlgoScheduler(client)
+        order = await algo.submit_twap(MARKET, OrderSide.BUY, Decimal(10), duration=1, slices=1, gas=300_000)
+
+        await algo._tick(order.started_at)
+        assert client.place_market_order_tx.call_args.kwargs["gas"] == 300_000
+
+        mine(client, {"status": 1, "logs": [processed_log("FillOrderProcessed", 1, 10, 1_000, account=FUNDED)]})
+        await algo._tick(order.started_at + 2)
+
+        assert order.filled == 10
+        assert order.status == AlgoStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_cancel_iceberg(self, client):
+        client._scheduler.send = AsyncMock(return_value="0xcc")
+        client.cancel_order_tx = MagicMock(return_value="cancel")
+        algo = AlgoScheduler(client)
+        order = await algo.submit_iceberg(MARKET, OrderSide.SELL, Decimal(20), price=Decimal(101), clip=Decimal(10))
+        order.resting[7] = 0
+
+        await algo.cancel(order.algo_id)
+
+        client.cancel_order_tx.assert_called_once_with(market=MARKET, order_ids=[7])
+        assert order.status == AlgoStatus.CANCELLED
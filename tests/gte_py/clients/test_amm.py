@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+
+from gte_py.clients.execution.amm import AmmQuoter, PairReserves, SYNC_TOPIC, get_amount_in, get_amount_out
+
+FACTORY = to_checksum_address("0x" + "0f" * 20)
+PAIR = to_checksum_address("0x" + "aa" * 20)
+PAIR2 = to_checksum_address("0x" + "bb" * 20)
+A = to_checksum_address("0x" + "01" * 20)
+B = to_checksum_address("0x" + "02" * 20)
+C = to_checksum_address("0x" + "03" * 20)
+
+
+def sync_log(reserve0: int, reserve1: int, block: int, index: int = 0, address: str = PAIR):
+    return {
+        "address": HexBytes(address),
+        "topics": [HexBytes(SYNC_TOPIC)],
+        "data": HexBytes(encode(["uint112", "uint112"], [reserve0, reserve1])),
+        "logIndex": index,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(b"\x01" * 32),
+        "blockHash": HexBytes(b"\x00" * 32),
+        "blockNumber": block,
+    }
+
+
+@pytest.fixture
+def web3():
+    web3 = MagicMock()
+    type(web3.eth).block_number = PropertyMock(side_effect=lambda: asyncio.sleep(0, result=100))
+    contract = web3.eth.contract.return_value
+    contract.functions.getReserves.return_value.call = AsyncMock(return_value=(1_000_000, 2_000_000, 0))
+    return web3
+
+
+@pytest.fixture
+def quoter(web3):
+    quoter = AmmQuoter(web3, FACTORY)
+    quoter._factory.get_pair = AsyncMock(side_effect=lambda a, b: PAIR if {a, b} == {A, B} else PAIR2)
+    return quoter
+
+
+class TestLibraryMath:
+    """Test the UniswapV2Library formulas."""
+
+    def test_amount_out_and_in(self):
+        assert get_amount_out(10, 1000, 1000) == 9
+        assert get_amount_in(9, 1000, 1000) == 10
+        # Round-trips never give more than was paid for
+        for amount_in in (10**4, 997 * 10**6, 10**18):
+            amount_out = get_amount_out(amount_in, 10**24, 3 * 10**21)
+            assert get_amount_in(amount_out, 10**24, 3 * 10**21) <= amount_in
+
+    def test_router_reverts(self):
+        with pytest.raises(ValueError, match="INSUFFICIENT_INPUT_AMOUNT"):
+            get_amount_out(0, 1000, 1000)
+        with pytest.raises(ValueError, match="INSUFFICIENT_LIQUIDITY"):
+            get_amount_in(1000, 1000, 1000)
+
+
+class TestAmmQuoter:
+    """Test AmmQuoter."""
+
+    @pytest.mark.asyncio
+    async def test_loads_pair_once(self, quoter, web3):
+        # B is sold for A: token0 is A, so reserve_in is reserve1
+        assert await quoter.get_amounts_out(1000, [B, A]) == [1000, get_amount_out(1000, 2_000_000, 1_000_000)]
+        assert await quoter.get_amounts_in(1000, [A, B]) == [get_amount_in(1000, 1_000_000, 2_000_000), 1000]
+
+        quoter._factory.get_pair.assert_awaited_once_with(A, B)
+        web3.eth.contract.return_value.functions.getReserves.return_value.call.assert_awaited_once_with(block_identifier=100)
+
+    @pytest.mark.asyncio
+    async def test_multi_hop_and_many_sizes(self, quoter):
+        amounts = await quoter.get_amounts_out(10_000, [A, B, C])
+        hop1 = get_amount_out(10_000, 1_000_000, 2_000_000)
+        assert amounts == [10_000, hop1, get_amount_out(hop1, 1_000_000, 2_000_000)]
+
+        assert await quoter.get_amounts_out_many([10_000, 20_000], [A, B, C]) == [
+            amounts[-1], (await quoter.get_amounts_out(20_000, [A, B, C]))[-1]
+        ]
+        amounts_in = await quoter.get_amounts_in(5_000, [A, B, C])
+        assert await quoter.get_amounts_in_many([5_000], [A, B, C]) == [amounts_in[0]]
+
+    @pytest.mark.asyncio
+    async def test_sync_logs(self, quoter):
+        await quoter.get_pair(A, B)
+
+        quoter.on_log(sync_log(10, 20, block=100))  # already included in the getReserves at block 100
+        quoter.on_log(sync_log(500, 600, block=101, index=3))
+        quoter.on_log(sync_log(700, 800, block=101, index=1))  # older than the applied one
+
+        pair = quoter._pairs[PAIR]
+        assert (pair.reserve0, pair.reserve1, pair.block_number, pair.log_index) == (500, 600, 101, 3)
+
+    @pytest.mark.asyncio
+    async def test_stale_reserves_reloaded(self, quoter, web3):
+        pair = await quoter.get_pair(A, B)
+        pair.updated_at -= 60
+
+        await quoter.get_pair(A, B)
+
+        assert web3.eth.contract.return_value.functions.getReserves.return_value.call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_logs(self, quoter, web3):
+        quoter._pairs[PAIR] = PairReserves(PAIR, A, B, 1, 1, 100, 0, 0.0)
+        web3.eth.get_logs = AsyncMock(return_value=[sync_log(5, 6, block=102)])
+        quoter.last_block = 100
+
+        assert await quoter.poll_logs(to_block=105) == 1
+
+        query = web3.eth.get_logs.await_args.args[0]
+        assert (query["fromBlock"], query["toBlock"], query["address"]) == (101, 105, [PAIR])
+        assert (quoter._pairs[PAIR].reserve0, quoter.last_block) == (5, 105)
+
+    @pytest.mark.asyncio
+    async def test_missing_pair(self, quoter):
+        quoter._factory.get_pair = AsyncMock(return_value="0x0000000000000000000000000000000000000000")
+
+        with pytest.raises(ValueError, match="No UniswapV2 pair"):
+            await quoter.get_amounts_out(1, [A, C])
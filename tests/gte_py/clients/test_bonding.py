@@ -0,0 +1,193 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.utils import load_abi
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.bonding import BondingCurve, LaunchpadQuoter
+from gte_py.models import Token
+
+LAUNCHPAD = to_checksum_address("0x000000000000000000000000000000000000cafe")
+CURVE_ADDRESS = to_checksum_address("0x000000000000000000000000000000000000c0de")
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+TOKEN = to_checksum_address("0x" + "01" * 20)
+QUOTE = to_checksum_address("0x" + "02" * 20)
+BUYER = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+
+CURVE = BondingCurve(virtual_base=1_000 * 10**18, virtual_quote=30 * 10**18, bonding_supply=800 * 10**18)
+EVENTS = {entry["name"]: entry for entry in load_abi("launchpad") if entry.get("type") == "event"}
+BASE_SOLD, QUOTE_BOUGHT = 100 * 10**18, 3_333_333_333_333_333_334
+
+
+def serve_quotes(launchpad, curve: BondingCurve):
+    """Answer quoteQuoteForBase from curve at the fixture's launch position."""
+    launchpad.contract.functions.quoteQuoteForBase = MagicMock(side_effect=lambda token, size, is_buy: MagicMock(
+        call=AsyncMock(return_value=curve.quote_quote_for_base(BASE_SOLD, QUOTE_BOUGHT, size, is_buy))
+    ))
+
+
+def swap_log(base_delta: int, quote_delta: int, next_amount_sold: int, block: int, index: int = 0):
+    return {
+        "address": HexBytes(LAUNCHPAD),
+        "topics": [
+            HexBytes(event_abi_to_log_topic(EVENTS["Swap"])),
+            HexBytes(encode(["address"], [BUYER])),
+            HexBytes(encode(["address"], [TOKEN])),
+        ],
+        "data": HexBytes(encode(
+            ["int256", "int256", "uint256", "uint256", "uint256"], [base_delta, quote_delta, next_amount_sold, 0, 1]
+        )),
+        "logIndex": index,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(b"\x01" * 32),
+        "blockHash": HexBytes(b"\x00" * 32),
+        "blockNumber": block,
+    }
+
+
+@pytest.fixture
+def launchpad():
+    launchpad = MagicMock()
+    launchpad.address = LAUNCHPAD
+    type(launchpad.web3.eth).block_number = PropertyMock(side_effect=lambda: asyncio.sleep(0, result=100))
+    launch = (True, CURVE_ADDRESS, QUOTE, 0, 0, BASE_SOLD, QUOTE_BOUGHT)
+    launchpad.contract.functions.launches.return_value.call = AsyncMock(return_value=launch)
+    serve_quotes(launchpad, CURVE)
+    return launchpad
+
+
+@pytest.fixture
+def quoter(launchpad):
+    return LaunchpadQuoter(launchpad, CURVE, CURVE_ADDRESS)
+
+
+class TestBondingCurve:
+    """Test the constant-product curve math."""
+
+    def test_rounding_favours_the_curve(self):
+        base_sold, quote_bought = 100 * 10**18, 3 * 10**18
+        k = (CURVE.virtual_base - base_sold) * (CURVE.virtual_quote + quote_bought)
+        for amount in (1, 10**15, 10**18, 50 * 10**18):
+            quote_in = CURVE.quote_quote_for_base(base_sold, quote_bought, amount, is_buy=True)
+            base, quote = CURVE.reserves(base_sold + amount, quote_bought + quote_in)
+            assert base * quote >= k
+
+            # Spending that quote buys at most the same base
+            assert CURVE.quote_base_for_quote(base_sold, quote_bought, quote_in, is_buy=True) >= amount
+            # Selling base back returns no more than was paid
+            assert CURVE.quote_quote_for_base(base_sold + amount, quote_bought + quote_in, amount, is_buy=False) <= quote_in
+
+    def test_limits(self):
+        with pytest.raises(ValueError, match="bonding supply"):
+            CURVE.quote_quote_for_base(790 * 10**18, 0, 20 * 10**18, is_buy=True)
+        with pytest.raises(ValueError, match="InsufficientBaseSold"):
+            CURVE.quote_quote_for_base(10, 0, 11, is_buy=False)
+
+
+class TestLaunchpadQuoter:
+    """Test LaunchpadQuoter."""
+
+    @pytest.mark.asyncio
+    async def test_quotes_from_loaded_launch(self, quoter, launchpad):
+        sizes = [10**18, 2 * 10**18, 5 * 10**18]
+
+        many = await quoter.quote_quote_for_base_many(TOKEN, sizes, is_buy=True)
+        single = [await quoter.quote_quote_for_base(TOKEN, size, True) for size in sizes]
+
+        assert many == single == [CURVE.quote_quote_for_base(BASE_SOLD, QUOTE_BOUGHT, s, True) for s in sizes]
+        launchpad.contract.functions.launches.return_value.call.assert_awaited_once_with(block_identifier=100)
+        # One on-chain quote checks the curve on first load
+        launchpad.contract.functions.quoteQuoteForBase.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refuses_other_curve_contract(self, quoter, launchpad):
+        launch = (True, LAUNCHPAD, QUOTE, 0, 0, BASE_SOLD, QUOTE_BOUGHT)
+        launchpad.contract.functions.launches.return_value.call = AsyncMock(return_value=launch)
+
+        assert not await quoter.supports(TOKEN)
+        with pytest.raises(ValueError, match="configured bonding curve"):
+            await quoter.quote_base_for_quote(TOKEN, 10**18, True)
+
+    @pytest.mark.asyncio
+    async def test_refuses_launch_with_other_parameters(self, quoter, launchpad):
+        # Launched after setVirtualReserves changed the virtual quote
+        serve_quotes(launchpad, BondingCurve(CURVE.virtual_base, 2 * CURVE.virtual_quote, CURVE.bonding_supply))
+
+        assert not await quoter.supports(TOKEN)
+        await quoter.refresh(TOKEN)
+        assert not await quoter.supports(TOKEN)
+        launchpad.contract.functions.quoteQuoteForBase.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_swap_logs(self, quoter):
+        state = await quoter.get_launch(TOKEN)
+        quote_bought = state.quote_bought
+
+        quoter.on_log(swap_log(10**18, -5 * 10**16, 101 * 10**18, block=100))  # already in the loaded state
+        quoter.on_log(swap_log(10**18, -5 * 10**16, 101 * 10**18, block=101))
+        quoter.on_log(swap_log(-10**18, 4 * 10**16, 100 * 10**18, block=102))
+
+        assert (state.base_sold, state.quote_bought) == (100 * 10**18, quote_bought + 10**16)
+        assert state.block_number == 102
+
+    @pytest.mark.asyncio
+    async def test_bonding_locked(self, quoter):
+        state = await quoter.get_launch(TOKEN)
+        quoter.on_log({
+            "address": HexBytes(LAUNCHPAD),
+            "topics": [
+                HexBytes(event_abi_to_log_topic(EVENTS["BondingLocked"])),
+                HexBytes(encode(["address"], [TOKEN])),
+                HexBytes(encode(["address"], [QUOTE])),
+            ],
+            "data": HexBytes(encode(["uint256"], [7])),
+            "logIndex": 0, "transactionIndex": 0, "transactionHash": HexBytes(b"\x01" * 32),
+            "blockHash": HexBytes(b"\x00" * 32), "blockNumber": 101,
+        })
+
+        assert not state.active
+        with pytest.raises(ValueError, match="BondingInactive"):
+            await quoter.quote_base_for_quote(TOKEN, 10**18, True)
+
+    @pytest.mark.asyncio
+    async def test_verify(self, quoter, launchpad):
+        expected = CURVE.quote_quote_for_base(BASE_SOLD, QUOTE_BOUGHT, 10**18, True)
+        serve_quotes(launchpad, CURVE)
+        assert await quoter.verify(TOKEN, [10**18]) == []
+
+        launchpad.contract.functions.quoteQuoteForBase.side_effect = None
+        launchpad.contract.functions.quoteQuoteForBase.return_value.call = AsyncMock(return_value=1)
+        assert await quoter.verify(TOKEN, [10**18]) == [(10**18, expected, 1)]
+        assert not await quoter.supports(TOKEN)
+
+
+@pytest.mark.asyncio
+async def test_client_quotes_locally(quoter):
+    web3 = AsyncWeb3()
+    web3.eth.default_account = BUYER
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, launchpad_quoter=quoter)
+    launch_token = Token(address=TOKEN, decimals=18, name="L", symbol="L")
+    quote_token = Token(address=QUOTE, decimals=18, name="Q", symbol="Q")
+
+    base, _ = await client.get_launchpad_quote_buy(launch_token, quote_token, Decimal(1))
+
+    expected = CURVE.quote_base_for_quote(BASE_SOLD, QUOTE_BOUGHT, 10**18, True)
+    assert base == launch_token.convert_amount_to_quantity(expected)
+
+
+@pytest.mark.asyncio
+async def test_client_falls_back_for_other_curves(quoter, launchpad):
+    serve_quotes(launchpad, BondingCurve(CURVE.virtual_base, 2 * CURVE.virtual_quote, CURVE.bonding_supply))
+    web3 = AsyncWeb3()
+    web3.eth.default_account = BUYER
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, launchpad_quoter=quoter)
+    client._chain_client._launchpad = MagicMock(quote_base_for_quote=AsyncMock(return_value=7))
+
+    assert await client._launchpad_quote_base_for_quote(TOKEN, 10**18, True) == 7
@@ -0,0 +1,145 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.clob import Clob
+from gte_py.api.chain.structs import OrderSide
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.discovery import OnChainOrder, OrderDiscovery
+from gte_py.models import Market, MarketType, Token
+
+ME = to_checksum_address("0x" + "aa" * 20)
+OTHER = to_checksum_address("0x" + "bb" * 20)
+CLOB = to_checksum_address("0x" + "03" * 20)
+MAX_UINT = 2**256 - 1
+
+
+class FakeBook:
+    """Contract functions of a CLOB holding the given levels: {(side, price): [(order_id, owner, amount)]}."""
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.orders = {}
+        self.block_numbers = set()
+        for (side, price), orders in levels.items():
+            for i, (order_id, owner, amount) in enumerate(orders):
+                prev_id = orders[i - 1][0] if i else 0
+                next_id = orders[i + 1][0] if i + 1 < len(orders) else 0
+                self.orders[order_id] = (side, 0, order_id, prev_id, next_id, owner, price, amount)
+
+    def _prices(self, side):
+        return sorted(price for s, price in self.levels if s == side)
+
+    def _call(self, result):
+        async def call(block_identifier):
+            self.block_numbers.add(block_identifier)
+            return result
+        return MagicMock(call=call)
+
+    def getTOB(self):
+        bids, asks = self._prices(OrderSide.BUY), self._prices(OrderSide.SELL)
+        return self._call((bids[-1] if bids else 0, asks[0] if asks else MAX_UINT))
+
+    def getNextSmallestPrice(self, price, side):
+        return self._call(max((p for p in self._prices(side) if p < price), default=0))
+
+    def getNextBiggestPrice(self, price, side):
+        return self._call(min((p for p in self._prices(side) if p > price), default=MAX_UINT))
+
+    def getLimit(self, price, side):
+        orders = self.levels[side, price]
+        return self._call((len(orders), orders[0][0], orders[-1][0]))
+
+    def getNextOrders(self, start_order_id, num_orders):
+        page = []
+        order_id = start_order_id
+        while order_id and len(page) < num_orders:
+            page.append(self.orders[order_id])
+            order_id = self.orders[order_id][4]
+        return self._call(page)
+
+
+def make_discovery(book, **kwargs) -> OrderDiscovery:
+    web3 = MagicMock()
+    type(web3.eth).block_number = PropertyMock(side_effect=lambda: asyncio.sleep(0, result=42))
+    discovery = OrderDiscovery(Clob(web3, CLOB), **kwargs)
+    discovery._functions = book
+    return discovery
+
+
+BOOK = {
+    (OrderSide.BUY, 100): [(1, OTHER, 5), (2, ME, 7)],
+    (OrderSide.BUY, 99): [(3, ME, 1)],
+    (OrderSide.BUY, 97): [(4, OTHER, 2)],
+    (OrderSide.SELL, 101): [(5, OTHER, 3)],
+    (OrderSide.SELL, 103): [(6, ME, 4), (7, ME, 0), (8, ME, 9)],
+}
+
+
+class TestOrderDiscovery:
+    """Test OrderDiscovery."""
+
+    @pytest.mark.asyncio
+    async def test_finds_own_orders_on_both_sides(self):
+        book = FakeBook(BOOK)
+
+        orders = await make_discovery(book, page_size=2).find_orders(ME)
+
+        assert orders == [
+            OnChainOrder(2, OrderSide.BUY, 100, 7, 0),
+            OnChainOrder(3, OrderSide.BUY, 99, 1, 0),
+            OnChainOrder(6, OrderSide.SELL, 103, 4, 0),
+            OnChainOrder(8, OrderSide.SELL, 103, 9, 0),
+        ]
+        assert book.block_numbers == {42}
+
+    @pytest.mark.asyncio
+    async def test_empty_book(self):
+        assert await make_discovery(FakeBook({})).find_orders(ME, block_number=7) == []
+
+    @pytest.mark.asyncio
+    async def test_max_levels(self):
+        orders = await make_discovery(FakeBook(BOOK), max_levels=1).find_orders(ME)
+
+        assert [order.order_id for order in orders] == [2]
+
+    def test_rejects_empty_pages(self):
+        with pytest.raises(ValueError):
+            OrderDiscovery(Clob(AsyncWeb3(), CLOB), page_size=0)
+
+
+class TestCancelAllOrders:
+    """Test cancel_all_orders with discovered orders."""
+
+    @pytest.fixture
+    def client(self):
+        web3 = AsyncWeb3()
+        web3.eth.default_account = ME
+        client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=to_checksum_address("0x" + "0b" * 20))
+        client._scheduler.send = AsyncMock(return_value="0xcc")
+        client.cancel_order_tx = MagicMock(return_value="cancel")
+        return client
+
+    @pytest.fixture
+    def market(self):
+        token = Token(address=to_checksum_address("0x" + "01" * 20), decimals=18, name="T", symbol="T")
+        return Market(address=CLOB, market_type=MarketType.CLOB_SPOT, base=token, quote=token)
+
+    @pytest.mark.asyncio
+    async def test_cancels_discovered_orders(self, client, market):
+        client.discover_open_orders = AsyncMock(return_value=[
+            OnChainOrder(2, OrderSide.BUY, 100, 7, 0), OnChainOrder(6, OrderSide.SELL, 103, 4, 0),
+        ])
+
+        assert await client.cancel_all_orders(market) == "0xcc"
+        client.cancel_order_tx.assert_called_once_with(market=market, order_ids=[2, 6])
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_cancel(self, client, market):
+        client.discover_open_orders = AsyncMock(return_value=[])
+
+        assert await client.cancel_all_orders(market) is None
+        client.cancel_order_tx.assert_not_called()
@@ -0,0 +1,288 @@
+import asyncio
+import itertools
+from decimal import Decimal
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from eth_abi import encode
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import BatchSendResult, load_abi
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.rules import MarketRules
+from gte_py.models import Market, MarketType, Token
+
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+CLOB_MANAGER = to_checksum_address("0x000000000000000000000000000000000000beef")
+UNIV2_ROUTER = to_checksum_address("0x000000000000000000000000000000000000abcd")
+LAUNCHPAD = to_checksum_address("0x000000000000000000000000000000000000cafe")
+WETH = to_checksum_address("0x000000000000000000000000000000000000feed")
+WALLET = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+
+_market_ids = itertools.count(0xaa00)
+
+
+def token(n: int) -> Token:
+    return Token(address=to_checksum_address(f"0x{n:040x}"), decimals=18, name=f"T{n}", symbol=f"T{n}")
+
+
+def market(market_type: MarketType, base: Token, quote: Token) -> Market:
+    return Market(address=to_checksum_address(f"0x{next(_market_ids):040x}"), market_type=market_type, base=base, quote=quote)
+
+
+@pytest.fixture
+def client():
+    web3 = AsyncWeb3()
+    web3.eth.default_account = WALLET
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER)
+    chain = client._chain_client
+    chain._clob_manager_address = CLOB_MANAGER
+    chain._univ2_router_address = UNIV2_ROUTER
+    chain._launchpad_address = LAUNCHPAD
+    chain._weth_address = WETH
+    return client
+
+
+def patch_allowances(client, allowances: dict[tuple, int]):
+    """Serve allowance() from a {(token, spender): value} map and record approve() calls."""
+    erc20s = {}
+
+    def get_erc20(address):
+        if address not in erc20s:
+            erc20 = MagicMock()
+            erc20.allowance = AsyncMock(side_effect=lambda owner, spender: allowances.get((address, spender), 0))
+            erc20.approve = MagicMock(side_effect=lambda spender, value, **kwargs: (address, spender))
+            erc20s[address] = erc20
+        return erc20s[address]
+
+    client._chain_client.get_erc20 = get_erc20
+    return erc20s
+
+
+class TestPrewarm:
+    """Test ExecutionClient.prewarm."""
+
+    @pytest.mark.asyncio
+    async def test_fills_approval_caches(self, client):
+        a, b, c = token(1), token(2), token(3)
+        weth = Token(address=WETH, decimals=18, name="WETH", symbol="WETH")
+        markets = [
+            market(MarketType.CLOB_SPOT, a, b),
+            market(MarketType.AMM, c, weth),
+            market(MarketType.LAUNCHPAD, c, weth),
+            market(MarketType.CLOB_PERP, a, b),
+        ]
+        erc20s = patch_allowances(client, {
+            (a.address, CLOB_MANAGER): 2**256 - 1,
+            (b.address, CLOB_MANAGER): 2**256 - 1,
+            (c.address, UNIV2_ROUTER): 2**256 - 1,
+            (c.address, LAUNCHPAD): 2**256 - 1,
+        })
+
+        missing = await client.prewarm(markets)
+
+        assert missing == [(WETH, LAUNCHPAD)]
+        assert client._approved_spot_tokens == {a.address, b.address}
+        assert client._approved_swap_tokens == {c.address}
+        assert client._approved_launchpad_tokens == {c.address}
+        # WETH never needs a router approval
+        assert all(call.kwargs["spender"] != UNIV2_ROUTER for call in erc20s[WETH].allowance.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_skips_cached_tokens(self, client):
+        a, b = token(1), token(2)
+        client._approved_spot_tokens.update({a.address, b.address})
+        erc20s = patch_allowances(client, {})
+
+        assert await client.prewarm([market(MarketType.CLOB_SPOT, a, b)]) == []
+        assert erc20s == {}
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_all_markets(self, client):
+        a, b = token(1), token(2)
+        client._info.get_markets = AsyncMock(return_value=[market(MarketType.CLOB_SPOT, a, b)])
+        patch_allowances(client, {(a.address, CLOB_MANAGER): 2**256 - 1})
+
+        assert await client.prewarm() == [(b.address, CLOB_MANAGER)]
+        client._info.get_markets.assert_awaited_once_with(limit=1000)
+
+    @pytest.mark.asyncio
+    async def test_approves_missing_in_one_batch(self, client):
+        a, b = token(1), token(2)
+        patch_allowances(client, {})
+        client._scheduler.send_many = AsyncMock(
+            return_value=[BatchSendResult(0, "0x01"), BatchSendResult(1, error=ValueError("rejected"))]
+        )
+
+        missing = await client.prewarm([market(MarketType.CLOB_SPOT, a, b)], approve_missing=True, gas=60_000)
+
+        client._scheduler.send_many.assert_awaited_once_with([(a.address, CLOB_MANAGER), (b.address, CLOB_MANAGER)])
+        assert client._approved_spot_tokens == {a.address}
+        assert missing == [(b.address, CLOB_MANAGER)]
+
+
+class TestTobCache:
+    """Test the staleness-aware top-of-book cache."""
+
+    @pytest.fixture
+    def spot(self):
+        return market(MarketType.CLOB_SPOT, token(1), token(2))
+
+    @pytest.fixture
+    def feed(self, client):
+        """Capture the orderbook callback and stub the RPC fallback."""
+        callbacks = {}
+
+        async def subscribe_orderbook(market_address, callback, limit):
+            callbacks[market_address] = callback
+
+        client._info.subscribe_orderbook = AsyncMock(side_effect=subscribe_orderbook)
+        client.get_tob = AsyncMock(return_value=(Decimal("1"), Decimal("2")))
+        return callbacks
+
+    @staticmethod
+    def book(bid: str, ask: str, t: int) -> dict:
+        return {"b": [{"px": bid, "sz": "1", "n": 1}], "a": [{"px": ask, "sz": "1", "n": 1}], "t": t}
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_and_stale(self, client, spot, feed):
+        client._tob_max_age = 5.0
+        assert await client._get_cached_tob(spot) == (Decimal("1"), Decimal("2"))
+        client._info.subscribe_orderbook.assert_awaited_once()
+
+        feed[spot.address](self.book("10", "11", t=1000))
+        assert await client._get_cached_tob(spot) == (Decimal("10"), Decimal("11"))
+
+        client._tob_cache[spot.address].received_at -= 10
+        assert await client._get_cached_tob(spot) == (Decimal("1"), Decimal("2"))
+
+        stats = client.tob_stats
+        assert (stats.hits, stats.misses, stats.stale, stats.rpc_fallbacks) == (1, 1, 1, 2)
+        # Still a single subscription, even though the first lookup found no snapshot
+        client._info.subscribe_orderbook.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_order_book_served_from_stream(self, client, spot, feed):
+        rest = MagicMock(asks=[])
+        client._info.get_order_book = AsyncMock(return_value=rest)
+
+        assert await client.get_order_book(spot, depth=5) is rest
+        feed[spot.address](self.book("10", "11", t=1000))
+        book = await client.get_order_book(spot, depth=5)
+        feed[spot.address](self.book("9", "12", t=999))
+
+        assert spot.convert_levels_to_amounts(book.asks) == [(11 * 10**18, 10**18)]
+        assert (await client.get_order_book(spot, depth=5)).timestamp == 1000
+        client._info.subscribe_orderbook.assert_awaited_once()
+        assert client._info.subscribe_orderbook.call_args.kwargs["limit"] == 5
+        client._info.get_order_book.assert_awaited_once_with(spot.address, limit=5)
+
+        client._tob_max_age = 5.0
+        client._book_cache[(spot.address, 5)].received_at -= 10
+        assert await client.get_order_book(spot, depth=5) is rest
+
+    @pytest.mark.asyncio
+    async def test_quiet_book_does_not_expire_by_default(self, client, spot, feed):
+        await client._ensure_tob_subscription(spot)
+        feed[spot.address](self.book("10", "11", t=1000))
+        client._tob_cache[spot.address].received_at -= 3600
+
+        assert await client._get_cached_tob(spot) == (Decimal("10"), Decimal("11"))
+        client.get_tob.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sequence_tracking(self, client, spot, feed):
+        await client._ensure_tob_subscription(spot)
+        feed[spot.address](self.book("10", "11", t=2000))
+        feed[spot.address](self.book("9", "12", t=1000))
+
+        snapshot = client._tob_cache[spot.address]
+        assert (snapshot.bid, snapshot.book_time, snapshot.updates) == (Decimal("10"), 2000, 1)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_fresh_update(self, client, spot, feed):
+        client._tob_wait = 1.0
+        await client._ensure_tob_subscription(spot)
+
+        async def publish():
+            await asyncio.sleep(0.01)
+            feed[spot.address](self.book("10", "11", t=1000))
+
+        publisher = asyncio.create_task(publish())
+        assert await client._get_cached_tob(spot) == (Decimal("10"), Decimal("11"))
+        await publisher
+
+        assert (client.tob_stats.waits, client.tob_stats.rpc_fallbacks) == (1, 0)
+        client.get_tob.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, client, spot, feed):
+        assert await client.wait_for_tob(spot, timeout=0.01) is None
+
+
+class TestMarketRulesEnforcement:
+    """Test that limit orders are checked against the market rules before signing."""
+
+    @pytest.fixture
+    def spot(self, client):
+        spot = Market(
+            address=to_checksum_address(f"0x{next(_market_ids):040x}"),
+            market_type=MarketType.CLOB_SPOT,
+            base=Token(address=token(1).address, decimals=2, name="B", symbol="B"),
+            quote=Token(address=token(2).address, decimals=2, name="Q", symbol="Q"),
+        )
+        client.market_rules._rules[spot.address] = MarketRules(spot.address, 5, 100, 20)
+        client._enforce_market_rules = True
+        client._approved_spot_tokens.update({spot.base.address, spot.quote.address})
+        client._scheduler.send = AsyncMock(return_value="0x01")
+        return spot
+
+    @pytest.mark.asyncio
+    async def test_price_rounded_passively(self, client, spot):
+        await client.place_limit_order(spot, OrderSide.BUY, Decimal("1"), Decimal("1.23"))
+
+        tx = client._scheduler.send.await_args.args[0]
+        assert tx.func_call.args[1][:2] == (100, 120)
+
+    @pytest.mark.asyncio
+    async def test_below_minimum_rejected_before_send(self, client, spot):
+        with pytest.raises(ValueError, match="minimum"):
+            await client.place_limit_order(spot, OrderSide.SELL, Decimal("0.5"), Decimal("1.25"))
+        client._scheduler.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, client, spot):
+        client._enforce_market_rules = False
+        await client.place_limit_order(spot, OrderSide.BUY, Decimal("0.5"), Decimal("1.23"))
+
+        tx = client._scheduler.send.await_args.args[0]
+        assert tx.func_call.args[1][:2] == (50, 123)
+
+    @pytest.mark.asyncio
+    async def test_rules_refreshed_from_logs(self, client, spot):
+        tick_size_updated = next(
+            entry for entry in load_abi("clob") if entry.get("type") == "event" and entry["name"] == "TickSizeUpdated"
+        )
+        web3 = MagicMock()
+        web3.eth.get_logs = AsyncMock(return_value=[{
+            "address": HexBytes(spot.address),
+            "topics": [HexBytes(event_abi_to_log_topic(tick_size_updated))],
+            "data": HexBytes(encode(["uint256", "uint256"], [10, 1])),
+            "logIndex": 0,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(b"\x01" * 32),
+            "blockHash": HexBytes(b"\x00" * 32),
+            "blockNumber": 10,
+        }])
+        client._web3 = web3
+
+        assert await client.poll_logs(to_block=10) == 1
+        await client.place_limit_order(spot, OrderSide.BUY, Decimal("1"), Decimal("1.29"))
+
+        tx = client._scheduler.send.await_args.args[0]
+        assert tx.func_call.args[1][:2] == (100, 120)
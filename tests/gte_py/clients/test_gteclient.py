@@ -101,9 +101,17 @@ def test_execution_client_initialization_parameters(config, private_key, patched
         account=client._account,
         gte_router_address=config.router_address,
         info=client.info,
+        rpc_ws=None,
     )
 
 
+def test_track_confirmations_passes_rpc_ws(config, private_key, patched_clients):
+    """Test that confirmation tracking hands the WebSocket RPC endpoint to ExecutionClient."""
+    GTEClient(config=config, wallet_private_key=private_key, track_confirmations=True)
+    
+    assert patched_clients["execution_class"].call_args.kwargs["rpc_ws"] == config.rpc_ws
+
+
 def test_execution_property_with_wallet(config, private_key, patched_clients):
     """Test that execution property returns the execution client when wallet is provided."""
     client = GTEClient(config=config, wallet_private_key=private_key)
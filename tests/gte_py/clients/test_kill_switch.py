@@ -0,0 +1,139 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_account import Account
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.gas import GasProfileCache
+from gte_py.api.chain.simulation import TxSimulator
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.kill_switch import KillSwitch
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.models import Market, MarketType, Token
+
+ACCOUNT = Account.from_key("0x" + "11" * 32)
+ROUTER = to_checksum_address("0x" + "0b" * 20)
+TOKEN = Token(address=to_checksum_address("0x" + "01" * 20), decimals=18, name="T", symbol="T")
+MARKET_A = Market(address=to_checksum_address("0x" + "0a" * 20), market_type=MarketType.CLOB_SPOT, base=TOKEN, quote=TOKEN)
+MARKET_B = Market(address=to_checksum_address("0x" + "0c" * 20), market_type=MarketType.CLOB_SPOT, base=TOKEN, quote=TOKEN)
+
+
+@pytest.fixture
+def client():
+    web3 = AsyncWeb3()
+    web3.eth.default_account = ACCOUNT.address
+    client = ExecutionClient(
+        web3=web3, info=MagicMock(), gte_router_address=ROUTER, account=ACCOUNT, order_store=OrderStore(ACCOUNT.address)
+    )
+    scheduler = client.scheduler
+    scheduler.chain_id, scheduler.last_confirmed, scheduler.last_sent = 1, 5, 5
+    scheduler.web3 = MagicMock()
+    scheduler.web3.provider.make_batch_request = AsyncMock(
+        side_effect=lambda requests: [{"result": f"0x{i:02x}"} for i in range(len(requests))]
+    )
+    return client
+
+
+def place(client, market, *order_ids):
+    for order_id in order_ids:
+        client.orders._upsert(market.address, order_id, remaining_amount=10)
+
+
+def batch_sizes(client) -> list[int]:
+    return [len(call.args[0]) for call in client.scheduler.web3.provider.make_batch_request.await_args_list]
+
+
+class TestKillSwitch:
+    """Test KillSwitch."""
+
+    def test_needs_order_store(self):
+        web3 = AsyncWeb3()
+        client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, account=ACCOUNT)
+        with pytest.raises(ValueError):
+            KillSwitch(client, [MARKET_A])
+
+    @pytest.mark.asyncio
+    async def test_signs_once_per_change(self, client):
+        place(client, MARKET_A, 1, 2, 3)
+        place(client, MARKET_B, 4)
+        switch = KillSwitch(client, [MARKET_A, MARKET_B], max_orders_per_tx=2)
+
+        assert await switch.refresh()
+        assert switch.armed
+        assert [tx["nonce"] for _, tx in switch._presigned] == [5, 6, 7]
+        assert not await switch.refresh()
+
+        # Another transaction takes nonce 5
+        client.scheduler.last_sent = 6
+        assert not switch.armed
+        assert await switch.refresh()
+        assert [tx["nonce"] for _, tx in switch._presigned] == [6, 7, 8]
+
+        place(client, MARKET_B, 9)
+        assert not switch.armed
+
+    @pytest.mark.asyncio
+    async def test_signing_needs_no_rpc(self, client):
+        scheduler = client.scheduler
+        scheduler.simulator = TxSimulator()
+        scheduler.gas_cache = GasProfileCache()
+        scheduler.web3.eth.call = AsyncMock()
+        scheduler.web3.eth.estimate_gas = AsyncMock()
+        place(client, MARKET_A, 1, 2)
+        switch = KillSwitch(client, [MARKET_A])
+        client.cancel_order_tx = MagicMock(wraps=client.cancel_order_tx)
+
+        await switch.refresh()
+        scheduler.last_sent = 6
+        await switch.refresh()
+
+        assert [tx["nonce"] for _, tx in switch._presigned] == [6]
+        # The calldata is built once and signed again at the new nonce
+        client.cancel_order_tx.assert_called_once()
+        scheduler.web3.eth.call.assert_not_awaited()
+        scheduler.web3.eth.estimate_gas.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_trigger_is_one_batch(self, client):
+        place(client, MARKET_A, 1, 2)
+        place(client, MARKET_B, 3)
+        switch = KillSwitch(client, [MARKET_A, MARKET_B])
+        await switch.refresh()
+        signed = [signed.raw_transaction.to_0x_hex() for signed, _ in switch._presigned]
+
+        results = await switch.trigger()
+
+        assert [result.nonce for result in results] == [5, 6]
+        assert all(result.ok for result in results)
+        assert batch_sizes(client) == [2]
+        sent = client.scheduler.web3.provider.make_batch_request.await_args.args[0]
+        assert [params[0] for _, params in sent] == signed
+        assert client.scheduler.last_sent == 7
+        assert not switch.armed
+
+    @pytest.mark.asyncio
+    async def test_trigger_cancels_late_orders(self, client):
+        place(client, MARKET_A, 1)
+        switch = KillSwitch(client, [MARKET_A])
+        await switch.refresh()
+        place(client, MARKET_A, 2)
+        client.cancel_order_tx = MagicMock(wraps=client.cancel_order_tx)
+
+        results = await switch.trigger()
+
+        assert [result.nonce for result in results] == [5, 6]
+        assert batch_sizes(client) == [1, 1]
+        client.cancel_order_tx.assert_called_once_with(market=MARKET_A, order_ids=[2])
+
+    @pytest.mark.asyncio
+    async def test_stale_signatures_are_signed_again(self, client):
+        place(client, MARKET_A, 1)
+        switch = KillSwitch(client, [MARKET_A])
+        await switch.refresh()
+        client.scheduler.last_sent = 8
+
+        results = await switch.trigger()
+
+        assert [result.nonce for result in results] == [8]
+        assert client.scheduler.last_sent == 9
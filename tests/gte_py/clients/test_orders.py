@@ -0,0 +1,193 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import load_abi
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.models import Market, MarketType, OrderStatus, OrderType, TimeInForce, Token
+
+ACCOUNT = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+OTHER = to_checksum_address("0x" + "99" * 20)
+CLOB = to_checksum_address("0x" + "03" * 20)
+
+EVENTS = {entry["name"]: entry for entry in load_abi("clob") if entry.get("type") == "event"}
+
+
+def _abi_type(param) -> str:
+    if param["type"] == "tuple":
+        return "(" + ",".join(_abi_type(c) for c in param["components"]) + ")"
+    return param["type"]
+
+
+def _abi_value(param, value):
+    if param["type"] == "tuple":
+        return tuple(_abi_value(c, value[c["name"]]) for c in param["components"])
+    return value
+
+
+def make_log(name: str, tx: int = 1, index: int = 0, block: int = 10, **args):
+    """Encode a CLOB event log the way a node returns it in a normalized receipt."""
+    abi = EVENTS[name]
+    topics = [HexBytes(event_abi_to_log_topic(abi))]
+    data_types, data_values = [], []
+    for param in abi["inputs"]:
+        value = _abi_value(param, args[param["name"]])
+        if param["indexed"]:
+            topics.append(HexBytes(encode([_abi_type(param)], [value])))
+        else:
+            data_types.append(_abi_type(param))
+            data_values.append(value)
+    return {
+        "address": HexBytes(CLOB),
+        "topics": topics,
+        "data": HexBytes(encode(data_types, data_values)),
+        "logIndex": index,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(tx.to_bytes(32, "big")),
+        "blockHash": HexBytes(b"\x00" * 32),
+        "blockNumber": block,
+    }
+
+
+def order_tuple(order_id: int, owner: str, side: int = 1, price: int = 110, amount: int = 100):
+    return dict(side=side, cancelTimestamp=0, id=order_id, prevOrderId=0, nextOrderId=0, owner=owner, price=price, amount=amount)
+
+
+def limit_order_logs(order_id: int, posted: int, traded: int = 0, client_order_id: int = 0, tx: int = 1):
+    return [
+        make_log(
+            "LimitOrderSubmitted", tx=tx, index=0,
+            owner=ACCOUNT, orderId=order_id, nonce=1,
+            args=dict(amountInBase=100, price=110, cancelTimestamp=0, side=1, clientOrderId=client_order_id,
+                      limitOrderType=1, settlement=0),
+        ),
+        make_log(
+            "LimitOrderProcessed", tx=tx, index=1,
+            account=ACCOUNT, orderId=order_id, amountPostedInBase=posted, quoteTokenAmountTraded=0,
+            baseTokenAmountTraded=-traded, takerFee=0, nonce=1,
+        ),
+    ]
+
+
+@pytest.fixture
+def store():
+    return OrderStore(ACCOUNT)
+
+
+class TestOrderStore:
+    """Test OrderStore."""
+
+    def test_limit_order_from_receipt(self, store):
+        store.on_receipt({"logs": limit_order_logs(7, posted=60, traded=40, client_order_id=42)})
+
+        order = store.get(CLOB, 7)
+        assert order.side == OrderSide.SELL
+        assert order.price == 110
+        assert order.time_in_force == TimeInForce.POST_ONLY
+        assert (order.original_amount, order.remaining_amount, order.filled_amount) == (100, 60, 40)
+        assert store.get_by_client_id(CLOB, 42) is order
+        assert store.open_order_ids(CLOB) == [7]
+        assert store.remaining(CLOB, 7) == 60
+
+    def test_duplicate_logs_applied_once(self, store):
+        store.on_receipt({"logs": limit_order_logs(7, posted=100)})
+        match = make_log(
+            "OrderMatched", tx=2, takerOrderId=9, makerOrderId=7, takerOrder=order_tuple(9, OTHER, side=0),
+            makerOrder=order_tuple(7, ACCOUNT), tradedBase=30, nonce=2,
+        )
+        store.on_log(match)
+        store.on_log(match)
+
+        assert store.remaining(CLOB, 7) == 70
+        assert store.filled(CLOB, 7) == 30
+
+    def test_maker_fill_closes_order(self, store):
+        store.on_receipt({"logs": limit_order_logs(7, posted=100)})
+        store.on_log(make_log(
+            "OrderMatched", tx=2, takerOrderId=9, makerOrderId=7, takerOrder=order_tuple(9, OTHER, side=0),
+            makerOrder=order_tuple(7, ACCOUNT), tradedBase=100, nonce=2,
+        ))
+
+        assert store.get(CLOB, 7).status == OrderStatus.FILLED
+        assert store.open_orders() == []
+
+    def test_amend_and_cancel(self, store):
+        store.on_receipt({"logs": limit_order_logs(7, posted=100)})
+        store.on_log(make_log(
+            "OrderAmended", tx=2, preAmend=order_tuple(7, ACCOUNT),
+            args=dict(orderId=7, amountInBase=50, price=105, cancelTimestamp=0, side=1, limitOrderType=1, settlement=0),
+            quoteTokenDelta=0, baseTokenDelta=50, eventNonce=2,
+        ))
+        assert (store.get(CLOB, 7).price, store.remaining(CLOB, 7)) == (105, 50)
+
+        store.on_log(make_log(
+            "OrderCanceled", tx=3, orderId=7, owner=ACCOUNT, quoteTokenRefunded=0, baseTokenRefunded=50,
+            settlement=0, nonce=3,
+        ))
+        assert store.get(CLOB, 7).status == OrderStatus.CANCELLED
+        assert store.open_orders(CLOB) == []
+
+    def test_ignores_other_owners(self, store):
+        store.on_log(make_log(
+            "OrderCanceled", orderId=7, owner=OTHER, quoteTokenRefunded=0, baseTokenRefunded=0, settlement=0, nonce=1,
+        ))
+
+        assert store.get(CLOB, 7) is None
+
+    def test_fill_order(self, store):
+        store.on_receipt({"logs": [
+            make_log(
+                "FillOrderSubmitted", index=0, owner=ACCOUNT, orderId=8, nonce=1,
+                args=dict(amount=100, priceLimit=120, side=0, amountIsBase=True, fillOrderType=0, settlement=0),
+            ),
+            make_log(
+                "FillOrderProcessed", index=1, account=ACCOUNT, orderId=8, quoteTokenAmountTraded=-110,
+                baseTokenAmountTraded=100, takerFee=0, nonce=1,
+            ),
+        ]})
+
+        order = store.get(CLOB, 8)
+        assert order.order_type == OrderType.MARKET
+        assert order.time_in_force == TimeInForce.IOC
+        assert (order.status, order.filled_amount) == (OrderStatus.FILLED, 100)
+        assert store.open_orders() == []
+
+    @pytest.mark.asyncio
+    async def test_poll_logs(self, store):
+        web3 = MagicMock()
+        web3.eth.get_logs = AsyncMock(return_value=limit_order_logs(7, posted=100))
+        store.last_block = 5
+
+        assert await store.poll_logs(web3, [CLOB], to_block=12) == 2
+
+        query = web3.eth.get_logs.await_args.args[0]
+        assert (query["fromBlock"], query["toBlock"], query["address"]) == (6, 12, [CLOB])
+        assert store.last_block == 12
+        assert store.open_order_ids(CLOB) == [7]
+
+    def test_reconcile(self, store):
+        base = Token(address=to_checksum_address("0x" + "01" * 20), decimals=2, name="Base", symbol="B")
+        quote = Token(address=to_checksum_address("0x" + "02" * 20), decimals=2, name="Quote", symbol="Q")
+        market = Market(address=CLOB, market_type=MarketType.CLOB_SPOT, base=base, quote=quote)
+        store.on_receipt({"logs": limit_order_logs(7, posted=100)})
+        store.on_receipt({"logs": limit_order_logs(8, posted=100, tx=2)})
+        store.get(CLOB, 8).placed_at = 0
+
+        changes = store.reconcile(market, [
+            {"orderId": "7", "side": "ask", "originalSize": "1", "limitPrice": "1.1", "sizeFilled": "0", "placedAt": 0},
+            {"orderId": "9", "side": "bid", "originalSize": "2", "limitPrice": "1.05", "sizeFilled": "0.5", "placedAt": 0},
+        ])
+
+        # 9 added, 8 closed; 7 is known
+        assert changes == 2
+        assert sorted(store.open_order_ids(CLOB)) == [7, 9]
+        added = store.get(CLOB, 9)
+        assert (added.side, added.price, added.remaining_amount) == (OrderSide.BUY, 105, 150)
+        assert store.get(CLOB, 8).status == OrderStatus.CANCELLED
+        assert Decimal(store.remaining(CLOB, 9)) == 150
@@ -0,0 +1,159 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.structs import OrderSide, Settlement
+from gte_py.api.chain.utils import BatchSendResult, TxLane
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.quoting import AmendInstruction, PostInstruction, Quote, QuotingEngine, reconcile
+from gte_py.clients.execution.rules import MarketRules
+from gte_py.models import Market, MarketType, Order, OrderStatus, OrderType, TimeInForce, Token
+
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+CLOB_MANAGER = to_checksum_address("0x000000000000000000000000000000000000beef")
+WALLET = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+
+BASE = Token(address=to_checksum_address("0x" + "01" * 20), decimals=2, name="Base", symbol="B")
+QUOTE = Token(address=to_checksum_address("0x" + "02" * 20), decimals=2, name="Quote", symbol="Q")
+MARKET = Market(address=to_checksum_address("0x" + "03" * 20), market_type=MarketType.CLOB_SPOT, base=BASE, quote=QUOTE)
+
+
+def order(order_id: int, side: OrderSide, price: int, amount: int, status: OrderStatus = OrderStatus.OPEN) -> Order:
+    return Order(
+        order_id=order_id,
+        market_address=MARKET.address,
+        side=side,
+        order_type=OrderType.LIMIT,
+        price=price,
+        time_in_force=TimeInForce.GTC,
+        status=status,
+        remaining_amount=amount,
+    )
+
+
+def quote(side: OrderSide, price: str, size: str) -> Quote:
+    return Quote(side, Decimal(price), Decimal(size))
+
+
+class TestReconcile:
+    """Test reconcile."""
+
+    def test_keeps_matching_levels(self):
+        plan = reconcile(
+            MARKET,
+            [quote(OrderSide.BUY, "1.00", "2"), quote(OrderSide.SELL, "1.10", "2")],
+            [order(1, OrderSide.BUY, 100, 200), order(2, OrderSide.SELL, 110, 200)],
+        )
+
+        assert plan.empty
+        assert plan.kept == [1, 2]
+        assert plan.transaction_count == 0
+
+    def test_amends_moved_levels_best_first(self):
+        plan = reconcile(
+            MARKET,
+            [quote(OrderSide.BUY, "0.99", "1"), quote(OrderSide.BUY, "0.98", "1")],
+            [order(1, OrderSide.BUY, 95, 100), order(2, OrderSide.BUY, 100, 100)],
+        )
+
+        assert plan.amends == [
+            AmendInstruction(2, OrderSide.BUY, 100, 99),
+            AmendInstruction(1, OrderSide.BUY, 100, 98),
+        ]
+        assert plan.cancels == [] and plan.posts == []
+
+    def test_cancels_surplus_and_posts_missing(self):
+        plan = reconcile(
+            MARKET,
+            [quote(OrderSide.SELL, "1.10", "1"), quote(OrderSide.SELL, "1.20", "1")],
+            [
+                order(1, OrderSide.BUY, 100, 100),
+                order(2, OrderSide.BUY, 99, 100),
+                order(3, OrderSide.BUY, 98, 100, status=OrderStatus.FILLED),
+            ],
+        )
+
+        assert plan.cancels == [1, 2]
+        assert plan.posts == [PostInstruction(OrderSide.SELL, 100, 110), PostInstruction(OrderSide.SELL, 100, 120)]
+        assert plan.transaction_count == 3
+
+    def test_size_tolerance(self):
+        quotes = [quote(OrderSide.BUY, "1.00", "2")]
+        live = [order(1, OrderSide.BUY, 100, 190)]
+
+        assert reconcile(MARKET, quotes, live).amends == [AmendInstruction(1, OrderSide.BUY, 200, 100)]
+        assert reconcile(MARKET, quotes, live, size_tolerance=Decimal("0.05")).kept == [1]
+
+    def test_without_amends(self):
+        plan = reconcile(MARKET, [quote(OrderSide.BUY, "0.99", "1")], [order(1, OrderSide.BUY, 100, 100)], use_amends=False)
+
+        assert plan.amends == []
+        assert plan.cancels == [1]
+        assert plan.posts == [PostInstruction(OrderSide.BUY, 100, 99)]
+
+    def test_quantizes_with_market_rules(self):
+        rules = MarketRules(MARKET.address, tick_size=5, min_limit_order_amount_in_base=50, max_limits_per_tx=20)
+
+        plan = reconcile(
+            MARKET,
+            [quote(OrderSide.BUY, "0.99", "1"), quote(OrderSide.SELL, "1.11", "1"), quote(OrderSide.SELL, "1.20", "0.4")],
+            [],
+            rules=rules,
+        )
+
+        assert plan.posts == [PostInstruction(OrderSide.BUY, 100, 95), PostInstruction(OrderSide.SELL, 100, 115)]
+
+
+class TestQuotingEngine:
+    """Test QuotingEngine.requote."""
+
+    @pytest.fixture
+    def execution(self):
+        web3 = AsyncWeb3()
+        web3.eth.default_account = WALLET
+        execution = ExecutionClient(web3=web3, info=AsyncMock(), gte_router_address=ROUTER)
+        execution._chain_client._clob_manager_address = CLOB_MANAGER
+        execution._approved_spot_tokens.update({BASE.address, QUOTE.address})
+        execution.market_rules._rules[MARKET.address] = MarketRules(MARKET.address, 1, 1, 20)
+        execution.scheduler.send = AsyncMock(return_value="0xcancel")
+        execution.scheduler.send_many = AsyncMock(side_effect=lambda funcs, lane: [BatchSendResult(i) for i in range(len(funcs))])
+        return execution
+
+    @pytest.mark.asyncio
+    async def test_requote_merges_cancels(self, execution):
+        engine = QuotingEngine(execution)
+
+        result = await engine.requote(
+            MARKET,
+            [quote(OrderSide.BUY, "0.99", "1"), quote(OrderSide.SELL, "1.10", "1")],
+            [order(1, OrderSide.BUY, 100, 100), order(2, OrderSide.BUY, 98, 100), order(3, OrderSide.BUY, 97, 100)],
+        )
+
+        assert result.cancel_tx == "0xcancel"
+        cancel_tx, = execution.scheduler.send.await_args.args
+        assert execution.scheduler.send.await_args.kwargs == {"lane": TxLane.CANCEL}
+        assert cancel_tx.func_call.args[1] == ([2, 3], Settlement.INSTANT.value)
+
+        (amends,), amend_kwargs = execution.scheduler.send_many.await_args_list[0]
+        (posts,), post_kwargs = execution.scheduler.send_many.await_args_list[1]
+        assert amend_kwargs == {"lane": TxLane.AMEND} and post_kwargs == {"lane": TxLane.NEW}
+        assert amends[0].func_call.args[1][:3] == (1, 100, 99)
+        assert posts[0].func_call.args[1][:2] == (100, 110)
+        assert len(result.amend_results) == 1 and len(result.post_results) == 1
+
+    @pytest.mark.asyncio
+    async def test_requote_noop(self, execution):
+        engine = QuotingEngine(execution)
+
+        result = await engine.requote(MARKET, [quote(OrderSide.BUY, "1.00", "1")], [order(1, OrderSide.BUY, 100, 100)])
+
+        assert result.plan.kept == [1]
+        execution.scheduler.send.assert_not_awaited()
+        execution.scheduler.send_many.assert_not_awaited()
+
+    def test_rejects_taking_time_in_force(self, execution):
+        with pytest.raises(ValueError):
+            QuotingEngine(execution, time_in_force=TimeInForce.IOC)
@@ -0,0 +1,137 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.amm import AmmQuoter, PairReserves, get_amount_out, sort_tokens
+from gte_py.clients.execution.routing import PAIR_CREATED_TOPIC, PairGraph, PathFinder
+from gte_py.models import Token
+
+FACTORY = to_checksum_address("0x" + "0f" * 20)
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+WALLET = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+A, B, C, D, E = (to_checksum_address(f"0x{n:040x}") for n in range(1, 6))
+
+
+def pair_address(token_a, token_b) -> str:
+    token0, token1 = sort_tokens(token_a, token_b)
+    return to_checksum_address(f"0x{int(token0, 16):020x}{int(token1, 16):020x}")
+
+
+def pair_created_log(token0, token1, index: int = 0):
+    return {
+        "address": HexBytes(FACTORY),
+        "topics": [HexBytes(PAIR_CREATED_TOPIC), HexBytes(encode(["address"], [token0])), HexBytes(encode(["address"], [token1]))],
+        "data": HexBytes(encode(["address", "uint256"], [pair_address(token0, token1), index + 1])),
+        "logIndex": index,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(b"\x01" * 32),
+        "blockHash": HexBytes(b"\x00" * 32),
+        "blockNumber": 10,
+    }
+
+
+@pytest.fixture
+def finder():
+    """A-B is shallow; A-C-B and A-D-E-B are deep."""
+    graph = PairGraph(FACTORY)
+    quoter = AmmQuoter(MagicMock(), FACTORY, max_age=None)
+    for token_a, token_b, reserve_a, reserve_b in [
+        (A, B, 1_000, 1_000),
+        (A, C, 10**9, 10**9),
+        (C, B, 10**9, 10**9),
+        (A, D, 10**9, 10**9),
+        (D, E, 10**9, 10**9),
+        (E, B, 10**9, 2 * 10**9),
+    ]:
+        address = pair_address(token_a, token_b)
+        graph.add_pair(token_a, token_b, address)
+        token0, token1 = sort_tokens(token_a, token_b)
+        reserve0, reserve1 = (reserve_a, reserve_b) if token0 == token_a else (reserve_b, reserve_a)
+        quoter._pairs[address] = PairReserves(address, token0, token1, reserve0, reserve1, 1, 0, 0.0)
+    return PathFinder(graph, quoter)
+
+
+class TestPairGraph:
+    """Test PairGraph."""
+
+    def test_pair_created_logs(self):
+        graph = PairGraph(FACTORY)
+
+        assert graph.on_log(pair_created_log(A, B))
+        assert not graph.on_log(pair_created_log(A, B))
+        assert graph.pair_address(B, A) == pair_address(A, B)
+        assert graph.pair_count == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_logs(self):
+        graph = PairGraph(FACTORY, start_block=5)
+        web3 = MagicMock()
+        web3.eth.get_logs = AsyncMock(return_value=[pair_created_log(A, B), pair_created_log(B, C, index=1)])
+
+        assert await graph.poll_logs(web3, to_block=20) == 2
+
+        query = web3.eth.get_logs.await_args.args[0]
+        assert (query["fromBlock"], query["toBlock"]) == (5, 20)
+        assert graph.last_block == 20
+
+    def test_paths(self, finder):
+        assert list(finder.graph.paths(A, B)) == [[A, B], [A, C, B], [A, D, E, B]]
+        assert list(finder.graph.paths(A, B, max_hops=2)) == [[A, B], [A, C, B]]
+
+
+class TestPathFinder:
+    """Test PathFinder."""
+
+    @pytest.mark.asyncio
+    async def test_best_route_out(self, finder):
+        large = await finder.best_route_out(10**6, A, B)
+
+        assert large.path == [A, D, E, B]
+        assert large.amounts[-1] == max(
+            get_amount_out(get_amount_out(10**6, 10**9, 10**9), 10**9, 10**9),
+            get_amount_out(get_amount_out(get_amount_out(10**6, 10**9, 10**9), 10**9, 10**9), 10**9, 2 * 10**9),
+        )
+
+    @pytest.mark.asyncio
+    async def test_best_route_in(self, finder):
+        route = await finder.best_route_in(10**6, A, B)
+
+        assert route.path == [A, D, E, B]
+        assert route.amount_out == 10**6
+
+    @pytest.mark.asyncio
+    async def test_max_paths(self, finder):
+        finder.max_paths = 1
+
+        assert (await finder.best_route_out(10**6, A, B)).path == [A, B]
+
+    @pytest.mark.asyncio
+    async def test_no_route(self, finder):
+        with pytest.raises(ValueError, match="No UniswapV2 route"):
+            await finder.best_route_out(10, A, to_checksum_address("0x" + "77" * 20))
+
+
+@pytest.mark.asyncio
+async def test_swap_uses_best_path(finder):
+    web3 = AsyncWeb3()
+    web3.eth.default_account = WALLET
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, path_finder=finder)
+    client._chain_client._weth_address = to_checksum_address("0x" + "ee" * 20)
+    client._approved_swap_tokens.add(A)
+    client.swap_tokens_tx = MagicMock(return_value="swap")
+    client._scheduler.send = AsyncMock(return_value="0x01")
+    token_a = Token(address=A, decimals=0, name="A", symbol="A")
+    token_b = Token(address=B, decimals=0, name="B", symbol="B")
+
+    await client.swap_tokens(token_a, token_b, Decimal(10**6), slippage_tolerance=0)
+
+    call = client.swap_tokens_tx.call_args.kwargs
+    assert call["path"] == [A, D, E, B]
+    assert call["amount_out_min"] == (await finder.best_route_out(10**6, A, B)).amount_out
+    client._scheduler.send.assert_awaited_once_with("swap")
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_abi import encode
+from eth_utils.abi import event_abi_to_log_topic
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import load_abi
+from gte_py.clients.execution.rules import MarketRules, MarketRulesCache
+
+CLOB = to_checksum_address("0x" + "03" * 20)
+EVENTS = {entry["name"]: entry for entry in load_abi("clob") if entry.get("type") == "event"}
+
+
+def settings_log(name: str, value: int) -> dict:
+    return {
+        "address": HexBytes(CLOB),
+        "topics": [HexBytes(event_abi_to_log_topic(EVENTS[name]))],
+        "data": HexBytes(encode(["uint256", "uint256"], [value, 1])),
+        "logIndex": 0,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(b"\x01" * 32),
+        "blockHash": HexBytes(b"\x00" * 32),
+        "blockNumber": 10,
+    }
+
+
+@pytest.fixture
+def rules():
+    return MarketRules(CLOB, tick_size=100, min_limit_order_amount_in_base=1_000, max_limits_per_tx=20)
+
+
+@pytest.fixture
+def clob():
+    clob = MagicMock()
+    clob.address = CLOB
+    clob.get_market_settings = AsyncMock(return_value=(True, 20, 1_000, 100))
+    return clob
+
+
+class TestMarketRules:
+    """Test MarketRules."""
+
+    @pytest.mark.parametrize("side,passive,expected", [
+        (OrderSide.BUY, True, 12_300),
+        (OrderSide.SELL, True, 12_400),
+        (OrderSide.BUY, False, 12_400),
+        (OrderSide.SELL, False, 12_300),
+    ])
+    def test_quantize_price(self, rules, side, passive, expected):
+        assert rules.quantize_price(12_345, side, passive=passive) == expected
+        assert rules.quantize_price(12_300, side, passive=passive) == 12_300
+
+    def test_validate_limit_order(self, rules):
+        rules.validate_limit_order(12_300, 1_000)
+        with pytest.raises(ValueError, match="tick size"):
+            rules.validate_limit_order(12_345, 1_000)
+        with pytest.raises(ValueError, match="minimum"):
+            rules.validate_limit_order(12_300, 999)
+        with pytest.raises(ValueError, match="not active"):
+            MarketRules(CLOB, 1, 1, 1, active=False).validate_limit_order(1, 1)
+
+
+class TestMarketRulesCache:
+    """Test MarketRulesCache."""
+
+    @pytest.mark.asyncio
+    async def test_loads_once(self, clob, rules):
+        cache = MarketRulesCache()
+
+        loaded = await asyncio.gather(cache.get(clob), cache.get(clob))
+        assert loaded == [rules, rules]
+        assert await cache.get(clob) == rules
+        clob.get_market_settings.assert_awaited_once()
+
+        await cache.refresh(clob)
+        assert clob.get_market_settings.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_updated_from_logs(self, clob):
+        cache = MarketRulesCache()
+        await cache.get(clob)
+
+        cache.on_log(settings_log("TickSizeUpdated", 50))
+        cache.on_log(settings_log("MinLimitOrderAmountInBaseUpdated", 7))
+        cache.on_log(settings_log("MaxLimitOrdersPerTxUpdated", 5))
+
+        assert cache.get_cached(CLOB) == MarketRules(CLOB, 50, 7, 5)
+
+    @pytest.mark.asyncio
+    async def test_poll_logs(self, clob):
+        cache = MarketRulesCache()
+        await cache.get(clob)
+        cache.last_block = 9
+        web3 = MagicMock()
+        web3.eth.get_logs = AsyncMock(return_value=[settings_log("TickSizeUpdated", 50)])
+
+        assert await cache.poll_logs(web3, to_block=10) == 1
+        assert web3.eth.get_logs.await_args.args[0]["address"] == [CLOB]
+        assert cache.get_cached(CLOB).tick_size == 50
@@ -0,0 +1,157 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_account import Account
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.structs import OperatorRole, OrderSide, Settlement
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.orders import OrderStore
+from gte_py.clients.execution.sharded import ShardedExecutionClient, ShardRouting
+from gte_py.models import Market, MarketType, Token
+
+ROUTER = to_checksum_address("0x" + "0b" * 20)
+FUNDED = Account.from_key("0x" + "f0" * 32)
+WALLETS = [Account.from_key("0x" + f"{i:02x}" * 32) for i in range(1, 4)]
+TOKEN = Token(address=to_checksum_address("0x" + "01" * 20), decimals=0, name="T", symbol="T")
+MARKETS = [
+    Market(address=to_checksum_address(f"0x{i:040x}"), market_type=MarketType.CLOB_SPOT, base=TOKEN, quote=TOKEN)
+    for i in range(1, 4)
+]
+
+
+def make_client(account, **kwargs) -> ExecutionClient:
+    web3 = AsyncWeb3()
+    web3.eth.default_account = account.address
+    return ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER, account=account, **kwargs)
+
+
+def make_sharded(routing=ShardRouting.MARKET) -> ShardedExecutionClient:
+    return ShardedExecutionClient([make_client(w, order_store=OrderStore(w.address)) for w in WALLETS], routing)
+
+
+class TestOperatorOrders:
+    """Test ExecutionClient with a trading account."""
+
+    @pytest.fixture
+    def client(self):
+        return make_client(WALLETS[0], trading_account=FUNDED.address)
+
+    def test_limit_order_goes_to_clob_for_account(self, client):
+        tx = client.place_limit_order_tx(MARKETS[0].address, OrderSide.BUY, 10, 100)
+
+        assert tx.func_call.address == MARKETS[0].address
+        assert tx.func_call.fn_name == "postLimitOrder"
+        account, args = tx.func_call.args
+        assert account == FUNDED.address
+        assert args[-1] == Settlement.ACCOUNT
+
+    def test_market_order_and_cancel_go_to_clob_for_account(self, client):
+        fill = client.place_market_order_tx(MARKETS[0], OrderSide.SELL, 10, 90)
+        cancel = client.cancel_order_tx(MARKETS[0], [1, 2])
+
+        assert (fill.func_call.fn_name, fill.func_call.args[0]) == ("postFillOrder", FUNDED.address)
+        assert cancel.func_call.fn_name == "cancel"
+        assert cancel.func_call.args == (FUNDED.address, ([1, 2], Settlement.ACCOUNT))
+
+    @pytest.mark.asyncio
+    async def test_only_orders_skip_token_approval(self, client):
+        erc20 = MagicMock(address=TOKEN.address, allowance=AsyncMock(return_value=2**256 - 1))
+        client._chain_client.get_erc20 = MagicMock(return_value=erc20)
+        client._chain_client._clob_manager = MagicMock()
+        client._chain_client._clob_manager_address = ROUTER
+        client._scheduler.send = AsyncMock(return_value="0x01")
+
+        await client.ensure_spot_approval(MARKETS[0], OrderSide.BUY)
+        erc20.allowance.assert_not_awaited()
+
+        await client.deposit(TOKEN.address, 10)
+        erc20.allowance.assert_awaited_once_with(owner=WALLETS[0].address, spender=ROUTER)
+
+    def test_wallet_trades_for_itself_by_default(self):
+        client = make_client(WALLETS[0])
+
+        assert client.trading_account == WALLETS[0].address
+        assert client.place_limit_order_tx(MARKETS[0].address, OrderSide.BUY, 10, 100).func_call.address == ROUTER
+
+
+class TestShardedExecutionClient:
+    """Test ShardedExecutionClient."""
+
+    def test_needs_shards(self):
+        with pytest.raises(ValueError):
+            ShardedExecutionClient([])
+
+    def test_shards_must_trade_for_funding_account(self):
+        with pytest.raises(ValueError):
+            ShardedExecutionClient([make_client(WALLETS[0])], funding=make_client(FUNDED))
+
+    def test_market_routing_is_stable(self):
+        sharded = make_sharded()
+
+        picked = [sharded.shard_for(market) for market in MARKETS]
+
+        assert picked == [sharded.shard_for(market) for market in MARKETS]
+        assert len({shard.wallet_address for shard in picked}) == 3
+
+    def test_round_robin(self):
+        sharded = make_sharded(ShardRouting.ROUND_ROBIN)
+
+        picked = [sharded.shard_for(MARKETS[0]).wallet_address for _ in range(4)]
+
+        assert picked == [WALLETS[0].address, WALLETS[1].address, WALLETS[2].address, WALLETS[0].address]
+
+    @pytest.mark.asyncio
+    async def test_cancel_goes_to_owning_shard(self):
+        sharded = make_sharded(ShardRouting.ROUND_ROBIN)
+        owner = sharded.shards[2]
+        owner.orders._upsert(MARKETS[0].address, 7, remaining_amount=10)
+        for shard in sharded.shards:
+            shard.cancel_order = AsyncMock(return_value=shard.wallet_address)
+
+        assert await sharded.cancel_order(MARKETS[0], 7) == owner.wallet_address
+        with pytest.raises(ValueError):
+            await sharded.cancel_order(MARKETS[0], 8)
+
+    @pytest.mark.asyncio
+    async def test_aggregated_orders_and_balances(self):
+        sharded = make_sharded()
+        sharded.shards[0].orders._upsert(MARKETS[0].address, 1, remaining_amount=10, filled_amount=4)
+        sharded.shards[1].orders._upsert(MARKETS[1].address, 2, remaining_amount=5)
+        for i, shard in enumerate(sharded.shards):
+            shard.get_balance = AsyncMock(return_value=(Decimal(i), Decimal(10)))
+
+        assert sorted(order.order_id for order in sharded.open_orders()) == [1, 2]
+        assert sharded.filled(MARKETS[0].address, 1) == 4
+        assert sharded.get_order(MARKETS[1].address, 1) is None
+        assert await sharded.get_balance(TOKEN.address) == (Decimal(3), Decimal(30))
+
+    @pytest.mark.asyncio
+    async def test_funded_account_shares_one_store(self):
+        store = OrderStore(FUNDED.address)
+        funding = make_client(FUNDED)
+        sharded = ShardedExecutionClient(
+            [make_client(w, order_store=store, trading_account=FUNDED.address) for w in WALLETS], funding=funding
+        )
+        store._upsert(MARKETS[0].address, 1, remaining_amount=10)
+        funding.get_balance = AsyncMock(return_value=(Decimal(1), Decimal(2)))
+
+        assert [order.order_id for order in sharded.open_orders()] == [1]
+        assert await sharded.get_balance(TOKEN.address) == (Decimal(1), Decimal(2))
+
+    @pytest.mark.asyncio
+    async def test_approve_shards_skips_approved(self):
+        funding = make_client(FUNDED)
+        sharded = ShardedExecutionClient(
+            [make_client(w, trading_account=FUNDED.address) for w in WALLETS], funding=funding
+        )
+        approvals = {WALLETS[0].address: OperatorRole.ADMIN.value, WALLETS[1].address: 0, WALLETS[2].address: 2}
+        funding._chain_client._clob_manager = MagicMock(get_operator_role_approvals=AsyncMock(
+            side_effect=lambda account, operator: approvals[operator]
+        ))
+        funding.approve_operator = AsyncMock(return_value="0xaa")
+
+        assert await sharded.approve_shards() == ["0xaa", "0xaa"]
+        assert [call.args[0] for call in funding.approve_operator.await_args_list] == [WALLETS[1].address, WALLETS[2].address]
@@ -0,0 +1,95 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_utils.address import to_checksum_address
+from web3 import AsyncWeb3
+
+from gte_py.api.chain.structs import OrderSide
+from gte_py.api.chain.utils import BatchSendResult
+from gte_py.clients.execution import ExecutionClient
+from gte_py.clients.execution.amm import AmmQuoter, PairReserves, get_amount_in, get_amount_out, sort_tokens
+from gte_py.clients.execution.smart_router import SmartOrderRouter, _clob_fill, plan_split
+from gte_py.models import Market, MarketType, OrderBookSnapshot, Token
+
+ROUTER = to_checksum_address("0x000000000000000000000000000000000000b00c")
+WALLET = to_checksum_address("0x1234567890abcdef1234567890abcdef12345678")
+BASE = Token(address=to_checksum_address("0x" + "01" * 20), decimals=0, name="Base", symbol="B")
+QUOTE = Token(address=to_checksum_address("0x" + "02" * 20), decimals=0, name="Quote", symbol="Q")
+PAIR = to_checksum_address("0x" + "aa" * 20)
+
+ASKS = [(100, 10), (200, 100)]
+BIDS = [(100, 10), (50, 100)]
+
+
+def brute_force(side: OrderSide, amount: int, levels, reserve_base: int, reserve_quote: int) -> int:
+    """Best total quote over every split."""
+    totals = []
+    for x in range(amount + 1):
+        try:
+            clob = _clob_fill(levels, amount - x, 1)[0] if amount - x else 0
+            if side == OrderSide.BUY:
+                amm = get_amount_in(x, reserve_quote, reserve_base) if x else 0
+            else:
+                amm = get_amount_out(x, reserve_base, reserve_quote) if x else 0
+        except ValueError:
+            continue
+        totals.append(clob + amm)
+    return min(totals) if side == OrderSide.BUY else max(totals)
+
+
+class TestPlanSplit:
+    """Test plan_split."""
+
+    def test_buy_split_is_optimal(self):
+        plan = plan_split(OrderSide.BUY, 50, ASKS, 1_000, 100_000, 1)
+
+        assert (plan.clob_amount, plan.amm_amount, plan.clob_price_limit) == (10, 40, 100)
+        # Marginal pricing in floats may be off by a rounding unit per leg
+        assert plan.total_quote <= brute_force(OrderSide.BUY, 50, ASKS, 1_000, 100_000) + 2
+
+    def test_sell_split_is_optimal(self):
+        plan = plan_split(OrderSide.SELL, 80, BIDS, 1_000, 100_000, 1)
+
+        assert plan.clob_amount + plan.amm_amount == 80
+        assert plan.total_quote >= brute_force(OrderSide.SELL, 80, BIDS, 1_000, 100_000) - 2
+
+    def test_single_venue(self):
+        assert plan_split(OrderSide.BUY, 5, ASKS, 0, 0, 1).clob_amount == 5
+        assert plan_split(OrderSide.SELL, 5, [], 1_000, 100_000, 1).amm_amount == 5
+
+    def test_too_large(self):
+        with pytest.raises(ValueError, match="cannot fill"):
+            plan_split(OrderSide.BUY, 2_000, ASKS, 1_000, 100_000, 1)
+
+
+@pytest.mark.asyncio
+async def test_execute_sends_both_legs():
+    web3 = AsyncWeb3()
+    web3.eth.default_account = WALLET
+    client = ExecutionClient(web3=web3, info=MagicMock(), gte_router_address=ROUTER)
+    client._chain_client._weth_address = to_checksum_address("0x" + "ee" * 20)
+    client.get_order_book = AsyncMock(return_value=OrderBookSnapshot(
+        bids=[], asks=[{"px": str(price), "sz": str(size), "n": 1} for price, size in ASKS], timestamp=0
+    ))
+    client.ensure_spot_approval = AsyncMock()
+    client.ensure_swap_approval = AsyncMock()
+    client.place_market_order_tx = MagicMock(return_value="clob")
+    client.swap_tokens_for_exact_output_tx = MagicMock(return_value="amm")
+    client._scheduler.send_many = AsyncMock(return_value=[BatchSendResult(0, "0x01"), BatchSendResult(1, "0x02")])
+
+    quoter = AmmQuoter(MagicMock(), ROUTER, max_age=None)
+    token0, token1 = sort_tokens(BASE.address, QUOTE.address)
+    quoter.register_pair(token0, token1, PAIR)
+    quoter._pairs[PAIR] = PairReserves(PAIR, token0, token1, 1_000, 100_000, 1, 0, 0.0)
+    market = Market(address=to_checksum_address("0x" + "03" * 20), market_type=MarketType.CLOB_SPOT, base=BASE, quote=QUOTE)
+
+    plan, results = await SmartOrderRouter(client, quoter).execute(market, OrderSide.BUY, Decimal(50), slippage=0.1)
+
+    assert (plan.clob_amount, plan.amm_amount) == (10, 40)
+    assert client.place_market_order_tx.call_args.kwargs["price_limit"] == 110
+    client.get_order_book.assert_awaited_once_with(market, 20)
+    client.ensure_swap_approval.assert_awaited_once_with(QUOTE)
+    assert client.swap_tokens_for_exact_output_tx.call_args.kwargs["amount_in_max"] == int(plan.amm_quote * 1.1)
+    client._scheduler.send_many.assert_awaited_once_with(["clob", "amm"])
+    assert [r.ok for r in results] == [True, True]
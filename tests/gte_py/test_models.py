@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+import pytest
+from eth_utils.address import to_checksum_address
+
+from gte_py.models import Market, MarketSide, MarketType, Token
+
+BASE = Token(address=to_checksum_address("0x" + "01" * 20), decimals=18, name="Base", symbol="B")
+QUOTE = Token(address=to_checksum_address("0x" + "02" * 20), decimals=6, name="Quote", symbol="Q")
+
+
+class TestTokenConversions:
+    """Test Token amount conversions."""
+
+    @pytest.mark.parametrize("quantity", [Decimal("1.5"), Decimal("0.000000000000000001"), Decimal("-2.25"), Decimal("1e-20")])
+    def test_quantity_to_amount_matches_decimal_math(self, quantity):
+        assert BASE.convert_quantity_to_amount(quantity) == int(quantity * 10**18)
+
+    @pytest.mark.parametrize("text", ["1.5", "0.000000000000000001", "-2.25", "1e-18"])
+    def test_string_quantities(self, text):
+        assert BASE.convert_quantity_to_amount(text) == int(Decimal(text) * 10**18)
+
+    def test_int_and_float_quantities(self):
+        assert BASE.convert_quantity_to_amount(3) == 3 * 10**18
+        assert QUOTE.convert_quantity_to_amount(1.5) == 1_500_000
+
+    def test_amount_to_quantity(self):
+        assert QUOTE.convert_amount_to_quantity(1_500_000) == Decimal("1.5")
+        assert str(QUOTE.convert_amount_to_quantity(2_000_000)) == "2"
+        assert QUOTE.scale == 10**6
+
+    def test_batch_conversions(self):
+        assert QUOTE.convert_quantities_to_amounts(["1.5", Decimal("0.000001"), 2]) == [1_500_000, 1, 2_000_000]
+        assert QUOTE.convert_amounts_to_quantities([1_500_000, 1]) == [Decimal("1.5"), Decimal("0.000001")]
+
+    def test_market_levels(self):
+        market = Market(address=to_checksum_address("0x" + "03" * 20), market_type=MarketType.CLOB_SPOT, base=BASE, quote=QUOTE)
+
+        assert market.convert_levels_to_amounts([{"px": "3442.5", "sz": "0.5", "n": 2}, (Decimal("3441"), "1")]) == [
+            (3_442_500_000, 5 * 10**17),
+            (3_441_000_000, 10**18),
+        ]
+
+
+class TestMarketSide:
+    """Test MarketSide parsing."""
+
+    @pytest.mark.parametrize("s, side", [("bid", MarketSide.BID), ("ASK", MarketSide.ASK)])
+    def test_from_string(self, s, side):
+        assert MarketSide.from_string(s) == side
+
+    def test_from_string_invalid(self):
+        with pytest.raises(ValueError):
+            MarketSide.from_string("buy")